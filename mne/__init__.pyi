@@ -160,6 +160,7 @@ __all__ = [
     "set_cache_dir",
     "set_config",
     "set_eeg_reference",
+    "set_fft_workers",
     "set_log_file",
     "set_log_level",
     "set_memmap_min_size",
@@ -183,6 +184,7 @@ __all__ = [
     "time_frequency",
     "transform_surface_to",
     "use_coil_def",
+    "use_fft_workers",
     "use_log_level",
     "verbose",
     "vertex_to_mni",
@@ -425,10 +427,12 @@ from .utils import (
     open_docs,
     set_cache_dir,
     set_config,
+    set_fft_workers,
     set_log_file,
     set_log_level,
     set_memmap_min_size,
     sys_info,
+    use_fft_workers,
     use_log_level,
     verbose,
 )
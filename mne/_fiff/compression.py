@@ -0,0 +1,82 @@
+# Authors: The MNE-Python contributors.
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import zlib
+
+import numpy as np
+
+from ..utils import _check_option, _soft_import
+from .constants import FIFF
+from .tag import _simple_dict
+
+# Compressed raw data buffers are stored as FIFF_MNE_COMPRESSED_DATA_BUFFER tags
+# of type FIFFT_BYTE, so readers that do not know about them will not try to
+# interpret the payload as samples. The payload is a big-endian header
+# (codec, data type, number of samples) followed by the compressed buffer, whose
+# bytes are shuffled (grouped by significance) before compression.
+
+_HEADER_SIZE = 12
+_codecs = dict(zlib=1, zstd=2)
+_codec_names = {val: key for key, val in _codecs.items()}
+_data_dtypes = {
+    FIFF.FIFFT_DAU_PACK16: _simple_dict[FIFF.FIFFT_DAU_PACK16],
+    FIFF.FIFFT_INT: _simple_dict[FIFF.FIFFT_INT],
+    FIFF.FIFFT_FLOAT: _simple_dict[FIFF.FIFFT_FLOAT],
+    FIFF.FIFFT_DOUBLE: _simple_dict[FIFF.FIFFT_DOUBLE],
+    FIFF.FIFFT_COMPLEX_FLOAT: ">c8",
+    FIFF.FIFFT_COMPLEX_DOUBLE: ">c16",
+}
+
+
+def _check_compression(compression):
+    """Check the compression argument (and the module it requires)."""
+    if compression is not None:
+        _check_option("compression", compression, list(_codecs))
+        if compression == "zstd":
+            _get_zstd()
+    return compression
+
+
+def _get_zstd():
+    return _soft_import("zstandard", "zstd compression of FIF files")
+
+
+def _compress_buffer(data, data_type, compression):
+    """Compress a (n_samples, n_channels) buffer."""
+    dtype = np.dtype(_data_dtypes[data_type])
+    data = np.ascontiguousarray(data, dtype=dtype)
+    # shuffle: one row per byte of the item size
+    raw = data.view(np.uint8).reshape(-1, dtype.itemsize).T.tobytes()
+    if compression == "zlib":
+        raw = zlib.compress(raw)
+    else:
+        raw = _get_zstd().ZstdCompressor().compress(raw)
+    header = np.array([_codecs[compression], data_type, len(data)], ">i4")
+    return header.tobytes() + raw
+
+
+def _read_compressed_header(fid, ent):
+    """Read the data type and number of samples of a compressed buffer."""
+    fid.seek(ent.pos + 16, 0)
+    codec, data_type, nsamp = np.frombuffer(fid.read(_HEADER_SIZE), ">i4").tolist()
+    if codec not in _codec_names or data_type not in _data_dtypes:
+        raise RuntimeError(
+            f"Unknown codec ({codec}) or data type ({data_type}) in compressed "
+            f"data buffer at position {ent.pos}"
+        )
+    return data_type, nsamp
+
+
+def _decompress_buffer(payload, nchan):
+    """Decompress a buffer to an array of shape (n_samples, n_channels)."""
+    codec, data_type, nsamp = np.frombuffer(payload[:_HEADER_SIZE], ">i4").tolist()
+    raw = payload[_HEADER_SIZE:]
+    if _codec_names[codec] == "zlib":
+        raw = zlib.decompress(raw)
+    else:
+        raw = _get_zstd().ZstdDecompressor().decompress(raw)
+    dtype = np.dtype(_data_dtypes[data_type])
+    # unshuffle
+    raw = np.frombuffer(raw, np.uint8).reshape(dtype.itemsize, -1).T
+    return np.ascontiguousarray(raw).view(dtype).reshape(nsamp, nchan)
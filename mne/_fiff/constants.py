@@ -680,6 +680,8 @@ FIFF.FIFF_MNE_ICA_MISC_PARAMS = 3609  # ICA misc params
 # Miscellaneous
 #
 FIFF.FIFF_MNE_KIT_SYSTEM_ID = 3612  # Unique ID assigned to KIT systems
+# XXX pending registration in fiff-constants (DictionaryTags.txt)
+FIFF.FIFF_MNE_COMPRESSED_DATA_BUFFER = 3613  # Compressed raw data buffer
 #
 # Maxfilter tags
 #
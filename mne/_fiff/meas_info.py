@@ -2334,13 +2334,14 @@ def write_fiducials(
 
 
 @verbose
-def read_info(fname, verbose=None):
+def read_info(fname, *, header_only=False, verbose=None):
     """Read measurement info from a file.
 
     Parameters
     ----------
     fname : path-like
         File name.
+    %(header_only_info)s
     %(verbose)s
 
     Returns
@@ -2351,7 +2352,7 @@ def read_info(fname, verbose=None):
     fname = _check_fname(fname, must_exist=True, overwrite="read")
     f, tree, _ = fiff_open(fname)
     with f as fid:
-        info = read_meas_info(fid, tree)[0]
+        info = read_meas_info(fid, tree, header_only=header_only)[0]
     return info
 
 
@@ -2397,7 +2398,7 @@ def _write_bad_channels(fid, bads, ch_names_mapping):
 
 
 @verbose
-def read_meas_info(fid, tree, clean_bads=False, verbose=None):
+def read_meas_info(fid, tree, clean_bads=False, *, header_only=False, verbose=None):
     """Read the measurement info.
 
     Parameters
@@ -2410,6 +2411,7 @@ def read_meas_info(fid, tree, clean_bads=False, verbose=None):
         If True, clean info['bads'] before running consistency check.
         Should only be needed for old files where we did not check bads
         before saving.
+    %(header_only_info)s
     %(verbose)s
 
     Returns
@@ -2574,7 +2576,7 @@ def read_meas_info(fid, tree, clean_bads=False, verbose=None):
                         ctf_head_t = cand
 
     #   Locate the Polhemus data
-    dig = _read_dig_fif(fid, meas_info)
+    dig = None if header_only else _read_dig_fif(fid, meas_info)
 
     #   Locate the acquisition information
     acqpars = dir_tree_find(meas_info, FIFF.FIFFB_DACQ_PARS)
@@ -2592,11 +2594,14 @@ def read_meas_info(fid, tree, clean_bads=False, verbose=None):
                 tag = read_tag(fid, pos)
                 acq_stim = tag.data
 
-    #   Load the SSP data
-    projs = _read_proj(fid, meas_info, ch_names_mapping=ch_names_mapping)
+    if header_only:
+        projs, comps = [], []
+    else:
+        #   Load the SSP data
+        projs = _read_proj(fid, meas_info, ch_names_mapping=ch_names_mapping)
 
-    #   Load the CTF compensation data
-    comps = _read_ctf_comp(fid, meas_info, chs, ch_names_mapping=ch_names_mapping)
+        #   Load the CTF compensation data
+        comps = _read_ctf_comp(fid, meas_info, chs, ch_names_mapping=ch_names_mapping)
 
     #   Load the bad channel list
     bads = _read_bad_channels(fid, meas_info, ch_names_mapping=ch_names_mapping)
@@ -2608,7 +2613,7 @@ def read_meas_info(fid, tree, clean_bads=False, verbose=None):
     info._unlocked = True
 
     #   Locate events list
-    events = dir_tree_find(meas_info, FIFF.FIFFB_EVENTS)
+    events = [] if header_only else dir_tree_find(meas_info, FIFF.FIFFB_EVENTS)
     evs = list()
     for event in events:
         ev = dict()
@@ -2623,7 +2628,7 @@ def read_meas_info(fid, tree, clean_bads=False, verbose=None):
     info["events"] = evs
 
     #   Locate HPI result
-    hpi_results = dir_tree_find(meas_info, FIFF.FIFFB_HPI_RESULT)
+    hpi_results = [] if header_only else dir_tree_find(meas_info, FIFF.FIFFB_HPI_RESULT)
     hrs = list()
     for hpi_result in hpi_results:
         hr = dict()
@@ -2653,7 +2658,7 @@ def read_meas_info(fid, tree, clean_bads=False, verbose=None):
     info["hpi_results"] = hrs
 
     #   Locate HPI Measurement
-    hpi_meass = dir_tree_find(meas_info, FIFF.FIFFB_HPI_MEAS)
+    hpi_meass = [] if header_only else dir_tree_find(meas_info, FIFF.FIFFB_HPI_MEAS)
     hms = list()
     for hpi_meas in hpi_meass:
         hm = dict()
@@ -2835,16 +2840,19 @@ def read_meas_info(fid, tree, clean_bads=False, verbose=None):
             hs["hpi_coils"] = hc
     info["hpi_subsystem"] = hs
 
-    #   Read cross-talk and fine cal
-    cross_talk = _read_mf_data(fid, tree, kind="sss_ctc")
-    if len(cross_talk):
-        info["cross_talk"] = cross_talk
-    fine_calibration = _read_mf_data(fid, tree, kind="sss_cal")
-    if len(fine_calibration):
-        info["fine_calibration"] = fine_calibration
-
-    #   Read processing history
-    info["proc_history"] = _read_proc_history(fid, tree)
+    if header_only:
+        info["proc_history"] = []
+    else:
+        #   Read cross-talk and fine cal
+        cross_talk = _read_mf_data(fid, tree, kind="sss_ctc")
+        if len(cross_talk):
+            info["cross_talk"] = cross_talk
+        fine_calibration = _read_mf_data(fid, tree, kind="sss_cal")
+        if len(fine_calibration):
+            info["fine_calibration"] = fine_calibration
+
+        #   Read processing history
+        info["proc_history"] = _read_proc_history(fid, tree)
 
     #  Make the most appropriate selection for the measurement id
     if meas_info["parent_id"] is None:
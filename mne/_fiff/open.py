@@ -2,6 +2,9 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import hashlib
+import json
+import os
 from gzip import GzipFile
 from io import SEEK_SET, BytesIO
 from pathlib import Path
@@ -9,7 +12,15 @@ from pathlib import Path
 import numpy as np
 from scipy.sparse import issparse
 
-from ..utils import _check_fname, _file_like, _validate_type, logger, verbose, warn
+from ..utils import (
+    _check_fname,
+    _file_like,
+    _validate_type,
+    get_config,
+    logger,
+    verbose,
+    warn,
+)
 from .constants import FIFF
 from .tag import Tag, _call_dict_names, _matrix_info, _read_tag_header, read_tag
 from .tree import dir_tree_find, make_dir_tree
@@ -144,6 +155,12 @@ def _fiff_open(fname, fid, preload):
         with fid as fid_old:
             fid = BytesIO(fid_old.read())
 
+    index_key = _fif_index_key(fname)
+    if index_key is not None:
+        index = _read_fif_index(fname, index_key)
+        if index is not None:
+            return (fid,) + index
+
     tag = _read_tag_header(fid, 0)
 
     #   Check that this looks like a fif file
@@ -198,9 +215,123 @@ def _fiff_open(fname, fid, preload):
     #   Back to the beginning
     fid.seek(0)
 
+    if index_key is not None:
+        _write_fif_index(fname, index_key, tree, directory)
+
     return fid, tree, directory
 
 
+###############################################################################
+# Sidecar tag directory index (see mne.utils.set_fif_index)
+
+_FIF_INDEX_VERSION = 1
+_FIF_INDEX_HEADER_SIZE = 65536
+
+
+def _fif_index_fname(fname):
+    return fname.with_name(f"{fname.name}.idx")
+
+
+def _fif_index_key(fname):
+    """Get the key identifying the current file contents, if indexing is enabled."""
+    if _file_like(fname) or get_config("MNE_FIF_INDEX", "false").lower() != "true":
+        return None
+    stat = fname.stat()
+    with open(fname, "rb") as fid:
+        header = hashlib.sha1(fid.read(_FIF_INDEX_HEADER_SIZE)).hexdigest()
+    return dict(
+        version=_FIF_INDEX_VERSION,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        header=header,
+    )
+
+
+def _read_fif_index(fname, key):
+    """Read the tree and directory from a sidecar index, if it is valid."""
+    index_fname = _fif_index_fname(fname)
+    if not index_fname.is_file():
+        return None
+    try:
+        with open(index_fname) as fid:
+            index = json.load(fid)
+        if index["key"] != key:
+            logger.debug(f"    Ignoring outdated tag directory index {index_fname}")
+            return None
+        directory = [Tag(*ent) for ent in index["directory"]]
+        tree = _tree_from_index(index["tree"], directory)
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.debug(f"    Ignoring invalid tag directory index {index_fname}: {exc}")
+        return None
+    logger.debug(f"    Using tag directory index {index_fname}")
+    return tree, directory
+
+
+def _write_fif_index(fname, key, tree, directory):
+    """Write the tree and directory to a sidecar index."""
+    index_fname = _fif_index_fname(fname)
+    ent_idx = {id(ent): ei for ei, ent in enumerate(directory)}
+    index = dict(
+        key=key,
+        directory=[
+            [ent.kind, ent.type, ent.size, ent.next, ent.pos] for ent in directory
+        ],
+        tree=_tree_to_index(tree, ent_idx),
+    )
+    tmp_fname = index_fname.with_name(f"{index_fname.name}.tmp{os.getpid()}")
+    try:
+        with open(tmp_fname, "w") as fid:
+            json.dump(index, fid)
+        os.replace(tmp_fname, index_fname)
+    except (OSError, TypeError) as exc:  # e.g., read-only data directory
+        logger.debug(f"    Could not write tag directory index {index_fname}: {exc}")
+        tmp_fname.unlink(missing_ok=True)
+    else:
+        logger.debug(f"    Wrote tag directory index {index_fname}")
+
+
+def _id_to_index(id_):
+    if id_ is None:
+        return None
+    return dict(id_, machid=[int(m) for m in id_["machid"]])
+
+
+def _id_from_index(id_):
+    if id_ is None:
+        return None
+    return dict(id_, machid=np.array(id_["machid"], dtype=">i4"))
+
+
+def _tree_to_index(tree, ent_idx):
+    directory = tree["directory"]
+    if directory is not None:
+        directory = [ent_idx[id(ent)] for ent in directory]
+    return dict(
+        block=int(tree["block"]),
+        id=_id_to_index(tree["id"]),
+        parent_id=_id_to_index(tree["parent_id"]),
+        nent=tree["nent"],
+        nchild=tree["nchild"],
+        directory=directory,
+        children=[_tree_to_index(child, ent_idx) for child in tree["children"]],
+    )
+
+
+def _tree_from_index(tree, directory):
+    ents = tree["directory"]
+    if ents is not None:
+        ents = [directory[ei] for ei in ents]
+    return dict(
+        block=tree["block"],
+        id=_id_from_index(tree["id"]),
+        parent_id=_id_from_index(tree["parent_id"]),
+        nent=tree["nent"],
+        nchild=tree["nchild"],
+        directory=ents,
+        children=[_tree_from_index(child, directory) for child in tree["children"]],
+    )
+
+
 @verbose
 def show_fiff(
     fname,
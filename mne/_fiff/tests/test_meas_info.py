@@ -356,6 +356,26 @@ def test_read_write_info(tmp_path):
         write_info(fname, info, overwrite=True)
 
 
+def test_read_info_header_only(tmp_path):
+    """Test reading only the header part of the measurement info."""
+    info = create_info(["Fp1", "Fp2", "Cz", "STI 014"], 1000.0, ["eeg"] * 3 + ["stim"])
+    raw = RawArray(np.zeros((4, 1000)), info)
+    raw.set_montage("colin27_1020")
+    raw.set_eeg_reference(projection=True)
+    raw.info["bads"] = ["Fp2"]
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    info = read_info(fname)
+    info_header = read_info(fname, header_only=True)
+    assert len(info["dig"]) > 0 and len(info["projs"]) == 1
+    assert info_header["dig"] is None
+    assert info_header["projs"] == []
+    assert info_header["proc_history"] == []
+    for key in ("sfreq", "ch_names", "bads", "meas_date", "highpass", "lowpass"):
+        assert info_header[key] == info[key], key
+    assert_object_equal(info_header["chs"], info["chs"])
+
+
 @testing.requires_testing_data
 def test_info_serialization_roundtrip(tmp_path):
     """Test Info JSON serialization with real MEG data."""
@@ -245,6 +245,47 @@ def _read_segments_file(
             _mult_cal_one(data_view, block, idx, cals, mult)
 
 
+def _read_segments_mmap(
+    raw,
+    data,
+    idx,
+    fi,
+    start,
+    stop,
+    cals,
+    mult,
+    dtype,
+    n_channels=None,
+    offset=0,
+    order="F",
+):
+    """Read a chunk of raw data from a memory map of the file.
+
+    The samples are stored time-major (multiplexed, ``order="F"``) or
+    channel-major (vectorized, ``order="C"``). Both are exposed as a
+    (n_channels, n_samples) view of the file, from which only the requested
+    channels and samples are copied (all channels when ``mult`` is used).
+    """
+    if n_channels is None:
+        n_channels = raw._raw_extras[fi]["orig_nchan"]
+    dtype = np.dtype(dtype)
+    fname = raw.filenames[fi]
+    n_samples = (os.path.getsize(fname) - offset) // (dtype.itemsize * n_channels)
+    if stop > n_samples:
+        raise RuntimeError(
+            f"Incorrect number of samples ({n_samples} < {stop}), please "
+            "report this error to MNE-Python developers"
+        )
+    if order == "C":
+        view = np.memmap(fname, dtype, "r", offset, (n_channels, n_samples))
+    else:
+        view = np.memmap(fname, dtype, "r", offset, (n_samples, n_channels)).T
+    if mult is None:
+        _mult_cal_one(data, view[idx, start:stop], slice(None), cals, None)
+    else:
+        _mult_cal_one(data, view[:, start:stop], idx, cals, mult)
+
+
 def read_str(fid, count=1):
     """Read string from a binary file in a python version compatible way."""
     dtype = np.dtype(f">S{count}")
@@ -119,6 +119,12 @@ def write_complex128(fid, kind, data):
     _write(fid, data, kind, data_size, FIFF.FIFFT_COMPLEX_FLOAT, ">c16")
 
 
+def write_bytes(fid, kind, data):
+    """Write a byte tag to a fif file."""
+    data = np.frombuffer(data, dtype=">B")
+    _write(fid, data, kind, 1, FIFF.FIFFT_BYTE, ">B")
+
+
 def write_julian(fid, kind, data):
     """Write a Julian-formatted date to a FIF file."""
     assert isinstance(data, datetime.date), type(data)
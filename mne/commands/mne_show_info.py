@@ -20,6 +20,12 @@ import mne
 def run():
     """Run command."""
     parser = mne.commands.utils.get_optparser(__file__, usage="mne show_info <file>")
+    parser.add_option(
+        "--header-only",
+        dest="header_only",
+        help="skip digitization, projectors, HPI and processing history",
+        action="store_true",
+    )
     options, args = parser.parse_args()
     if len(args) != 1:
         parser.print_help()
@@ -30,7 +36,7 @@ def run():
     if not fname.endswith(".fif"):
         raise ValueError(f"{fname} does not seem to be a .fif file.")
 
-    info = mne.io.read_info(fname)
+    info = mne.io.read_info(fname, header_only=options.header_only)
     print(f"File : {fname}")
     print(info)
 
@@ -597,6 +597,9 @@ def test_show_info():
     check_usage(mne_show_info)
     with ArgvSetter((raw_fname,)):
         mne_show_info.run()
+    with ArgvSetter((raw_fname, "--header-only")) as out:
+        mne_show_info.run()
+    assert "proc_history" not in out.stdout.getvalue()
 
 
 def test_sys_info():
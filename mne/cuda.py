@@ -2,12 +2,19 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import numpy as np
 from scipy.fft import irfft, rfft
 
+from .parallel import _check_n_jobs
 from .utils import (
     _check_option,
     _explain_exception,
+    _get_fft_workers,
+    _pl,
     fill_doc,
     get_config,
     logger,
@@ -126,26 +133,31 @@ def _set_cuda_device(device_id, verbose=None):
 # Repeated FFT multiplication
 
 
-def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"):
+def _setup_cuda_fft_multiply_repeated(
+    n_jobs, h, n_fft, kind="FFT FIR filtering", *, h_fft=None
+):
     """Set up repeated CUDA FFT multiplication with a given filter.
 
     Parameters
     ----------
     n_jobs : int | str
         If ``n_jobs='cuda'``, the function will attempt to set up for CUDA
-        FFT multiplication.
+        FFT multiplication. If ``n_jobs='threads'``, it will set up for CPU FFT
+        multiplication in threads using preallocated buffers.
     h : array
         The filtering function that will be used repeatedly.
     n_fft : int
         The number of points in the FFT.
     kind : str
         The kind to report to the user.
+    h_fft : array | None
+        The FFT of ``h``, if it has already been computed.
 
     Returns
     -------
     n_jobs : int
-        Sets n_jobs = 1 if n_jobs == 'cuda' was passed in, otherwise
-        original n_jobs is passed.
+        Sets n_jobs = 1 if n_jobs == 'cuda' or n_jobs == 'threads' was passed
+        in, otherwise original n_jobs is passed.
     cuda_dict : dict
         Dictionary with the following CUDA-related variables:
             use_cuda : bool
@@ -159,6 +171,9 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
                 frequency-domain multiplication.
             x : instance of gpuarray
                 Empty allocated GPU space for the data to filter.
+            n_threads : int
+                The number of CPU threads to use (only present if
+                ``n_jobs='threads'``, see :func:`_setup_cpu_threads`).
     h_fft : array | instance of gpuarray
         This will either be a gpuarray (if CUDA enabled) or ndarray.
 
@@ -166,9 +181,14 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
     -----
     This function is designed to be used with fft_multiply_repeated().
     """
-    cuda_dict = dict(n_fft=n_fft, rfft=rfft, irfft=irfft, h_fft=rfft(h, n=n_fft))
+    if h_fft is None:
+        h_fft = rfft(h, n=n_fft)
+    cuda_dict = dict(n_fft=n_fft, h_fft=h_fft, **_cpu_fft_funcs())
     if isinstance(n_jobs, str):
-        _check_option("n_jobs", n_jobs, ("cuda",))
+        _check_option("n_jobs", n_jobs, ("cuda", "threads"))
+        if n_jobs == "threads":
+            _setup_cpu_threads(cuda_dict, kind)
+            return 1, cuda_dict
         n_jobs = 1
         init_cuda()
         if _cuda_capable:
@@ -192,6 +212,54 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
     return n_jobs, cuda_dict
 
 
+def _cpu_fft_funcs():
+    workers = _get_fft_workers()
+    return dict(
+        rfft=partial(rfft, workers=workers), irfft=partial(irfft, workers=workers)
+    )
+
+
+def _setup_cpu_threads(cuda_dict, kind):
+    """Set up repeated CPU FFTs in threads that reuse their output buffers.
+
+    Each thread gets its own output buffers for the rfft and irfft, which are
+    allocated on first use and reused as long as the shapes do not change. The
+    arrays returned by ``cuda_dict["rfft"]`` and ``cuda_dict["irfft"]`` are
+    thus only valid until the next call from the same thread. Work should be
+    distributed over ``cuda_dict["n_threads"]`` threads with
+    :func:`_map_threads`.
+    """
+    n_threads = _check_n_jobs(-1)
+    buffers = threading.local()
+    cuda_dict.update(
+        n_threads=n_threads,
+        rfft=partial(_buffered_fft, np.fft.rfft, buffers=buffers, inverse=False),
+        irfft=partial(_buffered_fft, np.fft.irfft, buffers=buffers, inverse=True),
+    )
+    logger.info(f"Using {n_threads} CPU thread{_pl(n_threads)} for {kind}")
+
+
+def _buffered_fft(func, x, n, axis=-1, *, buffers, inverse):
+    """Compute an rfft or irfft into a per-thread buffer."""
+    if n is None:
+        n = x.shape[axis] if not inverse else 2 * (x.shape[axis] - 1)
+    shape = list(x.shape)
+    shape[axis] = n if inverse else n // 2 + 1
+    key = "irfft" if inverse else "rfft"
+    out = getattr(buffers, key, None)
+    if out is None or out.shape != tuple(shape):
+        out = np.empty(shape, np.float64 if inverse else np.complex128)
+        setattr(buffers, key, out)
+    return func(x, n, axis=axis, out=out)
+
+
+def _map_threads(func, items, n_threads):
+    """Call func for each item using a pool of threads."""
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        for _ in executor.map(func, items):  # re-raises exceptions
+            pass
+
+
 def _fft_multiply_repeated(x, cuda_dict):
     """Do FFT multiplication by a filter function (possibly using CUDA).
 
@@ -229,7 +297,8 @@ def _setup_cuda_fft_resample(n_jobs, W, new_len):
     ----------
     n_jobs : int | str
         If n_jobs == 'cuda', the function will attempt to set up for CUDA
-        FFT resampling.
+        FFT resampling. If n_jobs == 'threads', it will set up for CPU FFT
+        resampling in threads using preallocated buffers.
     W : array
         The filtering function to be used during resampling.
         If n_jobs='cuda', this function will be shortened (since CUDA
@@ -241,8 +310,8 @@ def _setup_cuda_fft_resample(n_jobs, W, new_len):
     Returns
     -------
     n_jobs : int
-        Sets n_jobs = 1 if n_jobs == 'cuda' was passed in, otherwise
-        original n_jobs is passed.
+        Sets n_jobs = 1 if n_jobs == 'cuda' or n_jobs == 'threads' was passed
+        in, otherwise original n_jobs is passed.
     cuda_dict : dict
         Dictionary with the following CUDA-related variables:
             use_cuda : bool
@@ -256,19 +325,26 @@ def _setup_cuda_fft_resample(n_jobs, W, new_len):
                 frequency-domain multiplication.
             x : instance of gpuarray
                 Empty allocated GPU space for the data to resample.
+            n_threads : int
+                The number of CPU threads to use (only present if
+                ``n_jobs='threads'``).
 
     Notes
     -----
     This function is designed to be used with fft_resample().
     """
-    cuda_dict = dict(use_cuda=False, rfft=rfft, irfft=irfft)
+    cuda_dict = dict(use_cuda=False, **_cpu_fft_funcs())
     rfft_len_x = len(W) // 2 + 1
     # fold the window onto inself (should be symmetric) and truncate
     W = W.copy()
     W[1:rfft_len_x] = (W[1:rfft_len_x] + W[::-1][: rfft_len_x - 1]) / 2.0
     W = W[:rfft_len_x]
     if isinstance(n_jobs, str):
-        _check_option("n_jobs", n_jobs, ("cuda",))
+        _check_option("n_jobs", n_jobs, ("cuda", "threads"))
+        if n_jobs == "threads":
+            _setup_cpu_threads(cuda_dict, "FFT resampling")
+            cuda_dict["W"] = W
+            return 1, cuda_dict
         n_jobs = 1
         init_cuda()
         if _cuda_capable:
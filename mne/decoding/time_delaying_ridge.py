@@ -47,6 +47,9 @@ def _compute_corrs(
 
     n_fft = next_fast_len(2 * X.shape[0] - 1)
 
+    # the buffers of n_jobs="threads" would be overwritten by the next FFT
+    if isinstance(n_jobs, str):
+        _check_option("n_jobs", n_jobs, ("cuda",))
     _, cuda_dict = _setup_cuda_fft_multiply_repeated(
         n_jobs, [1.0], n_fft, "correlation calculations"
     )
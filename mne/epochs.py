@@ -14,6 +14,7 @@ from functools import partial
 from inspect import getfullargspec
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
+from weakref import WeakSet
 
 import numpy as np
 from numpy.random import RandomState
@@ -62,6 +63,7 @@ from .annotations import (
     Annotations,
     EpochAnnotationsMixin,
     _read_annotations_fif,
+    _sync_onset,
     _write_annotations,
     events_from_annotations,
 )
@@ -71,7 +73,7 @@ from .channels.channels import InterpolationMixin, ReferenceMixin, UpdateChannel
 from .event import _read_events_fif, make_fixed_length_events, match_event_names
 from .evoked import Evoked, EvokedArray
 from .filter import FilterMixin, _check_fun, detrend
-from .fixes import _reshape_view, rng_uniform
+from .fixes import rng_uniform
 from .html_templates import _get_html_template
 from .parallel import parallel_func
 from .time_frequency.spectrum import EpochsSpectrum, SpectrumMixin, _validate_method
@@ -156,11 +158,14 @@ def _save_split(epochs, split_fnames, part_idx, n_parts, fmt, overwrite):
         next_idx = part_idx + 1
         next_fname = split_fnames[next_idx]
 
+    # get the data before the file is (possibly) overwritten
+    data = epochs.get_data(copy=False)
+    _release_memmaps(this_fname)
     with start_and_end_file(this_fname) as fid:
-        _save_part(fid, epochs, fmt, n_parts, next_fname, next_idx)
+        _save_part(fid, epochs, data, fmt, n_parts, next_fname, next_idx)
 
 
-def _save_part(fid, epochs, fmt, n_parts, next_fname, next_idx):
+def _save_part(fid, epochs, data, fmt, n_parts, next_fname, next_idx):
     info = epochs.info
     meas_id = info["meas_id"]
 
@@ -176,9 +181,6 @@ def _save_part(fid, epochs, fmt, n_parts, next_fname, next_idx):
     start_block(fid, FIFF.FIFFB_PROCESSED_DATA)
     start_block(fid, FIFF.FIFFB_MNE_EPOCHS)
 
-    # write events out after getting data to ensure bad events are dropped
-    data = epochs.get_data(copy=False)
-
     _check_option("fmt", fmt, ["single", "double"])
 
     if np.iscomplexobj(data):
@@ -967,24 +969,15 @@ class BaseEpochs(
             return False, ("TOO_SHORT",)
         if self.reject is None and self.flat is None:
             return True, None
-        else:
-            if self._reject_time is not None:
-                data = data[:, self._reject_time]
-
-            return _is_good(
-                data,
-                self.ch_names,
-                self._channel_type_idx,
-                self.reject,
-                self.flat,
-                full_report=True,
-                ignore_chs=self.info["bads"],
-            )
+        bad_tuple = self._get_bad_tuples(data[np.newaxis])[0]
+        return (False, bad_tuple) if bad_tuple else (True, None)
 
     @verbose
     def _detrend_offset_decim(self, epoch, picks, verbose=None):
         """Aux Function: detrend, baseline correct, offset, decim.
 
+        Works on one epoch or on an array of epochs.
+
         Note: operates inplace
         """
         if (epoch is None) or isinstance(epoch, str):
@@ -995,7 +988,9 @@ class BaseEpochs(
             # We explicitly detrend just data channels (not EMG, ECG, EOG which
             # are processed by baseline correction)
             use_picks = _pick_data_channels(self.info, exclude=())
-            epoch[use_picks] = detrend(epoch[use_picks], self.detrend, axis=1)
+            epoch[..., use_picks, :] = detrend(
+                epoch[..., use_picks, :], self.detrend, axis=-1
+            )
 
         # Baseline correct
         if self._do_baseline:
@@ -1009,7 +1004,7 @@ class BaseEpochs(
             )
 
         # Decimate if necessary (i.e., epoch not preloaded)
-        epoch = epoch[:, self._decim_slice]
+        epoch = epoch[..., self._decim_slice]
 
         # handle offset
         if self._offset is not None:
@@ -1165,6 +1160,10 @@ class BaseEpochs(
         they correspond to different conditions. To average by condition,
         do ``epochs[condition].average()`` for each condition separately.
 
+        If the data are not preloaded, the epochs are read in blocks and all
+        event types are averaged in a single pass over the data (only
+        ``method="mean"`` and ``"std"`` are supported in this case).
+
         When picks is None and epochs contain only ICA channels, no channels
         are selected, resulting in an error. This is because ICA channels
         are not considered data channels (they are of misc type) and only data
@@ -1180,7 +1179,17 @@ class BaseEpochs(
         This would compute the trimmed mean.
         """
         self._handle_empty("raise", "average")
-        if by_event_type:
+        if by_event_type and not self.preload:
+            # one pass over the data for all event types
+            self._check_aggregate_picks(picks)
+            self._check_aggregate_mode(method)
+            moments = self._aggregate_from_raw(method, by_event_type=True)
+            evokeds = list()
+            for event_type, code in self.event_id.items():
+                n, mean, m2 = moments.get(code, (0, None, None))
+                ev = self._evoked_from_moments(n, mean, m2, picks, method, event_type)
+                evokeds.append(ev)
+        elif by_event_type:
             evokeds = list()
             for event_type in self.event_id.keys():
                 ev = self[event_type]._compute_aggregate(picks=picks, mode=method)
@@ -1211,6 +1220,31 @@ class BaseEpochs(
 
     def _compute_aggregate(self, picks, mode="mean"):
         """Compute the mean, median, or std over epochs and return Evoked."""
+        self._check_aggregate_picks(picks)
+        if self.preload:
+            assert self._data is not None
+            n_events = len(self.events)
+            fun = _check_combine(mode, valid=("mean", "median", "std"))
+            data = fun(self._data)
+            assert len(self.events) == len(self._data)
+            if data.shape != self._data.shape[1:]:
+                raise RuntimeError(
+                    f"You passed a function that resulted n data of shape "
+                    f"{data.shape}, but it should be {self._data.shape[1:]}."
+                )
+            if mode == "std":
+                kind = "standard_error"
+                data /= np.sqrt(n_events)
+            else:
+                kind = "average"
+            return self._evoked_from_epoch_data(
+                data, self.info, picks, n_events, kind, self._name
+            )
+        self._check_aggregate_mode(mode)
+        n_events, mean, m2 = self._aggregate_from_raw(mode)[None]
+        return self._evoked_from_moments(n_events, mean, m2, picks, mode, self._name)
+
+    def _check_aggregate_picks(self, picks):
         # if instance contains ICA channels they won't be included unless picks
         # is specified
         if picks is None:
@@ -1225,56 +1259,52 @@ class BaseEpochs(
                     "selected in picks"
                 )
 
-        n_channels = len(self.ch_names)
-        n_times = len(self.times)
-
-        if self.preload:
-            assert self._data is not None
-            n_events = len(self.events)
-            fun = _check_combine(mode, valid=("mean", "median", "std"))
-            data = fun(self._data)
-            assert len(self.events) == len(self._data)
-            if data.shape != self._data.shape[1:]:
-                raise RuntimeError(
-                    f"You passed a function that resulted n data of shape "
-                    f"{data.shape}, but it should be {self._data.shape[1:]}."
-                )
-        else:
-            if mode not in {"mean", "std"}:
-                raise ValueError(
-                    "If data are not preloaded, can only compute "
-                    "mean or standard deviation."
-                )
-            data = np.zeros((n_channels, n_times))
-            n_events = 0
-            for e in self:
-                if np.iscomplexobj(e):
-                    data = data.astype(np.complex128)
-                data += e
-                n_events += 1
-
-            if n_events > 0:
-                data /= n_events
-            else:
-                data.fill(np.nan)
+    def _check_aggregate_mode(self, mode):
+        if not isinstance(mode, str) or mode not in {"mean", "std"}:
+            raise ValueError(
+                "If data are not preloaded, can only compute "
+                "mean or standard deviation."
+            )
 
-            # convert to stderr if requested, could do in one pass but do in
-            # two (slower) in case there are large numbers
-            if mode == "std":
-                data_mean = data.copy()
-                data.fill(0.0)
-                for e in self:
-                    data += (e - data_mean) ** 2
-                data = np.sqrt(data / n_events)
+    def _aggregate_from_raw(self, mode, by_event_type=False):
+        """Compute the moments of the good epochs in a single pass.
 
+        The epochs are read in blocks, which are merged into the running count,
+        mean and (for ``mode="std"``) sum of squared deviations of each event
+        code (or of all epochs, under the key ``None``).
+        """
+        n_block = max(2**22 // (len(self.ch_names) * len(self.times)), 1)
+        moments = dict()
+        block, block_keys = list(), list()
+        idxs = np.arange(len(self.events))
+        epochs = self._iter_epochs_from_raw(idxs, reject=True)
+        for ii, (epoch_noproj, epoch, bad_tuple) in enumerate(epochs):
+            if bad_tuple:
+                continue
+            block.append(epoch_noproj if self._do_delayed_proj else epoch)
+            block_keys.append(self.events[ii, 2] if by_event_type else None)
+            if len(block) == n_block:
+                _merge_moments(moments, np.array(block), block_keys, mode == "std")
+                block, block_keys = list(), list()
+        if len(block):
+            _merge_moments(moments, np.array(block), block_keys, mode == "std")
+        return moments
+
+    def _evoked_from_moments(self, n_events, mean, m2, picks, mode, comment):
+        """Create an evoked object from the moments of the epochs."""
+        if n_events == 0:
+            data = np.full((len(self.ch_names), len(self.times)), np.nan)
+        elif mode == "std":
+            data = np.sqrt(m2 / n_events)
+        else:
+            data = mean
         if mode == "std":
             kind = "standard_error"
             data /= np.sqrt(n_events)
         else:
             kind = "average"
-
         return self._evoked_from_epoch_data(
-            data, self.info, picks, n_events, kind, self._name
+            data, self.info, picks, n_events, kind, comment
         )
 
     @property
@@ -1684,15 +1714,98 @@ class BaseEpochs(
         """Get a given epoch from disk."""
         raise NotImplementedError
 
+    def _get_epochs_from_raw(self, idxs):
+        """Get the given epochs from disk at once.
+
+        Returns
+        -------
+        data : array, shape (n_ok, n_channels, n_times)
+            The epochs that could be read in full.
+        ok : array of bool, shape (len(idxs),)
+            Which epochs are in ``data``.
+        other : dict
+            The output of ``_get_epoch_from_raw`` for the other epochs, by
+            position in ``idxs``.
+        """
+        epochs = [self._get_epoch_from_raw(idx) for idx in idxs]
+        ok = np.array(
+            [
+                isinstance(epoch, np.ndarray) and epoch.shape[1] == len(self._raw_times)
+                for epoch in epochs
+            ],
+            bool,
+        )
+        other = {ii: epoch for ii, epoch in enumerate(epochs) if not ok[ii]}
+        data = np.array([epoch for epoch, o in zip(epochs, ok) if o])
+        return data, ok, other
+
+    def _iter_epochs_from_raw(self, idxs, *, project=True, reject=False):
+        """Load and process epochs from disk in blocks.
+
+        Yields ``(epoch_noproj, epoch, bad_tuple)`` for each of the given
+        epochs, where ``bad_tuple`` holds the reasons to drop the epoch (empty
+        if the epoch is good, only checked if ``reject=True``).
+        """
+        n_block = max(2**22 // (len(self.ch_names) * len(self._raw_times)), 1)
+        detrend_picks = self._detrend_picks
+        for start in range(0, len(idxs), n_block):
+            data, ok, other = self._get_epochs_from_raw(idxs[start : start + n_block])
+            if len(data):
+                data = self._detrend_offset_decim(data, detrend_picks)
+                data_proj = self._project_epoch(data) if project else data
+                bad_tuples = self._get_bad_tuples(data_proj) if reject else None
+            di = 0
+            for ii in range(len(ok)):
+                if ok[ii]:
+                    yield data[di], data_proj[di], bad_tuples and bad_tuples[di]
+                    di += 1
+                    continue
+                epoch = self._detrend_offset_decim(other[ii], detrend_picks)
+                epoch_proj = self._project_epoch(epoch) if project else epoch
+                bad_tuple = None
+                if reject:
+                    is_good, bad_tuple = self._is_good_epoch(epoch_proj)
+                    bad_tuple = () if is_good else bad_tuple
+                yield epoch, epoch_proj, bad_tuple
+
+    def _iter_epochs_from_data(self):
+        """Yield ``(epoch_noproj, epoch, bad_tuple)`` for the preloaded epochs."""
+        assert self._data is not None
+        n_block = max(2**22 // (len(self.ch_names) * len(self.times)), 1)
+        for start in range(0, len(self._data), n_block):
+            data = self._data[start : start + n_block]
+            if self._do_delayed_proj:
+                data_proj = self._project_epoch(data)
+            else:
+                data_proj = data
+            bad_tuples = self._get_bad_tuples(data_proj)
+            for ii in range(len(data)):
+                yield data[ii], data_proj[ii], bad_tuples[ii]
+
+    def _get_bad_tuples(self, data):
+        """Get the reasons to drop each of an array of (full-length) epochs."""
+        if self.reject is None and self.flat is None:
+            return [()] * len(data)
+        if self._reject_time is not None:
+            data = data[..., self._reject_time]
+        return _drop_log_entries(
+            data,
+            self.ch_names,
+            self._channel_type_idx,
+            self.reject,
+            self.flat,
+            ignore_chs=self.info["bads"],
+        )
+
     def _project_epoch(self, epoch):
-        """Process a raw epoch based on the delayed param."""
+        """Process a raw epoch (or array of epochs) based on the delayed param."""
         # whenever requested, the first epoch is being projected.
         if (epoch is None) or isinstance(epoch, str):
             # can happen if t < 0 or reject based on annotations
             return epoch
         proj = self._do_delayed_proj or self.proj
         if self._projector is not None and proj is True:
-            epoch = np.dot(self._projector, epoch)
+            epoch = self._projector @ epoch
         return epoch
 
     def _handle_empty(self, on_empty, meth):
@@ -1820,15 +1933,11 @@ class BaseEpochs(
                 )
 
             # we need to load from disk, drop, and return data
-            detrend_picks = self._detrend_picks
-            for ii, idx in enumerate(use_idx):
+            epochs_iter = self._iter_epochs_from_raw(
+                use_idx, project=not self._do_delayed_proj
+            )
+            for ii, (_, epoch_out, _) in enumerate(epochs_iter):
                 # faster to pre-allocate memory here
-                epoch_noproj = self._get_epoch_from_raw(idx)
-                epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
-                if self._do_delayed_proj:
-                    epoch_out = epoch_noproj
-                else:
-                    epoch_out = self._project_epoch(epoch_noproj)
                 if ii == 0:
                     data = np.empty(
                         (n_events, len(self.ch_names), len(self.times)),
@@ -1842,27 +1951,18 @@ class BaseEpochs(
             n_out = 0
             drop_log = list(self.drop_log)
             assert n_events == len(self.selection)
-            if not self.preload:
-                detrend_picks = self._detrend_picks
-            for idx, sel in enumerate(self.selection):
-                if self.preload:  # from memory
-                    assert self._data is not None
-                    if self._do_delayed_proj:
-                        epoch_noproj = self._data[idx]
-                        epoch = self._project_epoch(epoch_noproj)
-                    else:
-                        epoch_noproj = None
-                        epoch = self._data[idx]
-                else:  # from disk
-                    epoch_noproj = self._get_epoch_from_raw(idx)
-                    epoch_noproj = self._detrend_offset_decim(
-                        epoch_noproj, detrend_picks
-                    )
-                    epoch = self._project_epoch(epoch_noproj)
-
+            # the reasons to drop are found for blocks of epochs at once
+            if self.preload:  # from memory
+                epochs_iter = self._iter_epochs_from_data()
+            else:  # from disk
+                epochs_iter = self._iter_epochs_from_raw(
+                    np.arange(n_events), reject=True
+                )
+            for idx, (sel, (epoch_noproj, epoch, bad_tuple)) in enumerate(
+                zip(self.selection, epochs_iter)
+            ):
                 epoch_out = epoch_noproj if self._do_delayed_proj else epoch
-                is_good, bad_tuple = self._is_good_epoch(epoch, verbose=verbose)
-                if not is_good:
+                if bad_tuple:
                     assert isinstance(bad_tuple, tuple)
                     assert all(isinstance(x, str) for x in bad_tuple)
                     drop_log[sel] = drop_log[sel] + bad_tuple
@@ -3366,135 +3466,194 @@ def make_metadata(
     start_idx = stop_idx
     metadata[columns[start_idx:]] = None
 
-    # We're all set, let's iterate over all events and fill in in the
+    # We're all set, let's find the time window of each event and fill in the
     # respective cells in the metadata. We will subset this to include only
-    # `row_events` later
-    for row_event in events_df.itertuples(name="RowEvent"):
-        row_idx = row_event.Index
-        metadata.loc[row_idx, "event_name"] = id_to_name_map[row_event.id]
-
-        # Determine which events fall into the current time window
-        if start_sample is None and isinstance(tmin, list):
-            # Lower bound is the current or the closest previous event with a name
-            # in "tmin"; if there is no such event (e.g., beginning of the recording is
-            # being approached), the upper lower becomes the last event in the
-            # recording.
-            prev_matching_events = events_df.loc[
-                (events_df["sample"] <= row_event.sample)
-                & (events_df["id"].isin([event_id[name] for name in tmin])),
-                :,
-            ]
-            if prev_matching_events.size == 0:
-                # No earlier matching event. Use the current one as the beginning of the
-                # time window. This may occur at the beginning of a recording.
-                window_start_sample = row_event.sample
-            else:
-                # At least one earlier matching event. Use the closest one.
-                window_start_sample = prev_matching_events.iloc[-1]["sample"]
-        elif start_sample is None:
-            # Lower bound is the current event.
-            window_start_sample = row_event.sample
-        else:
-            # Lower bound is determined by tmin.
-            window_start_sample = row_event.sample + start_sample
-
-        if stop_sample is None and isinstance(tmax, list):
-            # Upper bound is the current or the closest following event with a name
-            # in "tmax"; if there is no such event (e.g., end of the recording is being
-            # approached), the upper bound becomes the last event in the recording.
-            next_matching_events = events_df.loc[
-                (events_df["sample"] >= row_event.sample)
-                & (events_df["id"].isin([event_id[name] for name in tmax])),
-                :,
-            ]
-            if next_matching_events.size == 0:
-                # No matching event after the current one; use the end of the recording
-                # as upper bound. This may occur at the end of a recording.
-                window_stop_sample = events_df["sample"].iloc[-1]
-            else:
-                # At least one matching later event. Use the closest one..
-                window_stop_sample = next_matching_events.iloc[0]["sample"]
-        elif stop_sample is None:
-            # Upper bound: next event of the same type, or the last event (of
-            # any type) if no later event of the same type can be found.
-            next_events = events_df.loc[
-                (events_df["sample"] > row_event.sample),
-                :,
+    # `row_events` later. The windows are found on the events sorted by time
+    # (stably, so simultaneous events keep their order) using searchsorted.
+    order = np.argsort(events_df["sample"].to_numpy(), kind="stable")
+    samples = events_df["sample"].to_numpy()[order]
+    ids = events_df["id"].to_numpy()[order]
+    event_names = np.array([id_to_name_map[id_] for id_ in ids], object)
+    n_events = len(samples)
+
+    # Lower bound of each window
+    if start_sample is None and isinstance(tmin, list):
+        # Lower bound is the current or the closest previous event with a name
+        # in "tmin"; if there is no such event (e.g., beginning of the recording
+        # is being approached), the current event is the lower bound.
+        bound_samples = samples[np.isin(ids, [event_id[name] for name in tmin])]
+        idx = np.searchsorted(bound_samples, samples, side="right") - 1
+        window_start = samples.copy()
+        use = idx >= 0
+        window_start[use] = bound_samples[idx[use]]
+    elif start_sample is None:
+        # Lower bound is the current event.
+        window_start = samples
+    else:
+        # Lower bound is determined by tmin.
+        window_start = samples + start_sample
+
+    # Upper bound of each window
+    if stop_sample is None and isinstance(tmax, list):
+        # Upper bound is the current or the closest following event with a name
+        # in "tmax"; if there is no such event (e.g., end of the recording is
+        # being approached), the upper bound becomes the last event.
+        bound_samples = samples[np.isin(ids, [event_id[name] for name in tmax])]
+        idx = np.searchsorted(bound_samples, samples, side="left")
+        window_stop = np.full(n_events, samples[-1] if n_events else 0)
+        use = idx < len(bound_samples)
+        window_stop[use] = bound_samples[idx[use]]
+    elif stop_sample is None:
+        # Upper bound: one sample before the next event of the same type, or
+        # the last event (of any type) if no later event of the same type can
+        # be found, or the current event if it is the last one.
+        window_stop = np.full(n_events, samples[-1] if n_events else 0)
+        for id_ in np.unique(ids):
+            this = np.flatnonzero(ids == id_)
+            idx = np.searchsorted(samples[this], samples[this], side="right")
+            use = idx < len(this)
+            window_stop[this[use]] = samples[this[idx[use]]] - 1
+    else:
+        # Upper bound is determined by tmax.
+        window_stop = samples + stop_sample
+
+    # Each window holds the (sorted) events lo <= idx < hi
+    lo = np.searchsorted(samples, window_start, side="left")
+    hi = np.searchsorted(samples, window_stop, side="right")
+
+    def _event_times(idx):
+        """Get the times of events relative to the row events (NaN if -1)."""
+        times = np.full(n_events, np.nan)
+        use = idx >= 0
+        times[use] = (samples[idx[use]] - samples[use]) / sfreq
+        times[np.isclose(times, 0)] = 0
+        return times
+
+    def _strip_group_name(event_name, group_name):
+        # This is an HED. Strip redundant information from the event name
+        return event_name.replace(group_name, "").replace("//", "/").strip("/")
+
+    group_matches = {
+        group_name: match_event_names(event_id, [group_name])
+        for group_name in keep_first + keep_last
+    }
+    values = {col: np.full(n_events, np.nan) for col in columns[1:stop_idx]}
+    values.update({col: np.full(n_events, None, object) for col in columns[stop_idx:]})
+    if all(
+        matches == [group_name]
+        for group_name, matches in group_matches.items()
+        if group_name in event_id
+    ):
+        # Each event column is only filled by the events of that name, so we
+        # can find the first (or last) event of each name in all windows at
+        # once.
+        def _first_in_window(pos):
+            idx = np.searchsorted(pos, lo)
+            use = idx < len(pos)
+            use[use] = pos[idx[use]] < hi[use]
+            first = np.full(n_events, -1)
+            first[use] = pos[idx[use]]
+            return first
+
+        def _last_in_window(pos):
+            # the first of the last simultaneous events
+            idx = np.searchsorted(pos, hi) - 1
+            use = idx >= 0
+            use[use] = pos[idx[use]] >= lo[use]
+            last = np.full(n_events, -1)
+            last[use] = pos[
+                np.searchsorted(samples[pos], samples[pos[idx[use]]], side="left")
             ]
-            if next_events.size == 0:
-                # We've reached the last event in the recording.
-                window_stop_sample = row_event.sample
-            elif next_events.loc[next_events["id"] == row_event.id, :].size > 0:
-                # There's still an event of the same type appearing after the
-                # current event. Stop one sample short, we don't want to include that
-                # last event here, but in the next iteration.
-                window_stop_sample = (
-                    next_events.loc[next_events["id"] == row_event.id, :].iloc[0][
-                        "sample"
-                    ]
-                    - 1
-                )
-            else:
-                # There are still events after the current one, but not of the
-                # same type.
-                window_stop_sample = next_events.iloc[-1]["sample"]
-        else:
-            # Upper bound is determined by tmax.
-            window_stop_sample = row_event.sample + stop_sample
-
-        events_in_window = events_df.loc[
-            (events_df["sample"] >= window_start_sample)
-            & (events_df["sample"] <= window_stop_sample),
-            :,
-        ]
-
-        assert not events_in_window.empty
-
-        # Store the metadata
-        for event in events_in_window.itertuples(name="Event"):
-            event_sample = event.sample - row_event.sample
-            event_time = event_sample / sfreq
-            event_time = 0 if np.isclose(event_time, 0) else event_time
-            event_name = id_to_name_map[event.id]
-
-            if not np.isnan(metadata.loc[row_idx, event_name]):
-                # Event already exists in current time window!
-                assert metadata.loc[row_idx, event_name] <= event_time
-
-                if event_name not in keep_last:
-                    continue
-
-            metadata.loc[row_idx, event_name] = event_time
-
-            # Handle keep_first and keep_last event aggregation
-            for event_group_name in keep_first + keep_last:
-                if event_name not in match_event_names(event_id, [event_group_name]):
-                    continue
+            return last
 
-                if event_group_name in keep_first:
-                    first_last_col = f"first_{event_group_name}"
+        event_idx = dict()
+        for event_name in event_id:
+            pos = np.flatnonzero(event_names == event_name)
+            if event_name in keep_last:
+                event_idx[event_name] = _last_in_window(pos)
+            else:
+                event_idx[event_name] = _first_in_window(pos)
+            values[event_name] = _event_times(event_idx[event_name])
+
+        # Handle keep_first and keep_last event aggregation
+        for group_name in keep_first_cols + keep_last_cols:
+            best = np.full(n_events, -1)
+            for event_name in group_matches[group_name]:
+                idx = event_idx[event_name]
+                if event_name in keep_last and group_name in keep_first:
+                    idx = _first_in_window(np.flatnonzero(event_names == event_name))
+                if group_name in keep_first:
+                    better = (idx >= 0) & ((best < 0) | (idx < best))
                 else:
-                    first_last_col = f"last_{event_group_name}"
+                    better = (idx >= 0) & (
+                        (best < 0)
+                        | (samples[idx] > samples[best])
+                        | ((samples[idx] == samples[best]) & (idx < best))
+                    )
+                best[better] = idx[better]
+            values[group_name] = _event_times(best)
+            prefix = "first" if group_name in keep_first else "last"
+            name_col = values[f"{prefix}_{group_name}"]
+            for event_name in group_matches[group_name]:
+                this = best >= 0
+                this[this] = event_names[best[this]] == event_name
+                name_col[this] = _strip_group_name(event_name, group_name)
+    else:
+        # Groups that are also event names can fill in the column of these
+        # events, so we need to go through the events of each window in order
+        for row_idx in range(n_events):
+            for idx in range(lo[row_idx], hi[row_idx]):
+                event_time = (samples[idx] - samples[row_idx]) / sfreq
+                event_time = 0 if np.isclose(event_time, 0) else event_time
+                event_name = event_names[idx]
+
+                if not np.isnan(values[event_name][row_idx]):
+                    # Event already exists in current time window!
+                    assert values[event_name][row_idx] <= event_time
+
+                    if event_name not in keep_last:
+                        continue
+
+                values[event_name][row_idx] = event_time
 
-                old_time = metadata.loc[row_idx, event_group_name]
-                if not np.isnan(old_time):
-                    if (event_group_name in keep_first and old_time <= event_time) or (
-                        event_group_name in keep_last and old_time >= event_time
-                    ):
+                # Handle keep_first and keep_last event aggregation
+                for group_name in keep_first + keep_last:
+                    if event_name not in group_matches[group_name]:
                         continue
 
-                if event_group_name not in event_id:
-                    # This is an HED. Strip redundant information from the
-                    # event name
-                    name = (
-                        event_name.replace(event_group_name, "")
-                        .replace("//", "/")
-                        .strip("/")
-                    )
-                    metadata.loc[row_idx, first_last_col] = name
-                    del name
+                    if group_name in keep_first:
+                        first_last_col = f"first_{group_name}"
+                    else:
+                        first_last_col = f"last_{group_name}"
+
+                    old_time = values[group_name][row_idx]
+                    if not np.isnan(old_time):
+                        if (group_name in keep_first and old_time <= event_time) or (
+                            group_name in keep_last and old_time >= event_time
+                        ):
+                            continue
+
+                    if group_name not in event_id:
+                        values[first_last_col][row_idx] = _strip_group_name(
+                            event_name, group_name
+                        )
+
+                    values[group_name][row_idx] = event_time
 
-                metadata.loc[row_idx, event_group_name] = event_time
+    # Back to the original order of the events
+    unsort = np.empty_like(order)
+    unsort[order] = np.arange(n_events)
+    metadata["event_name"] = pd.Series(
+        event_names[unsort], index=metadata.index, dtype=metadata["event_name"].dtype
+    )
+    for col, col_values in values.items():
+        if col_values.dtype == object:
+            col_values = pd.Series(
+                col_values[unsort], index=metadata.index, dtype=object
+            )
+        else:
+            col_values = col_values[unsort]
+        metadata[col] = col_values
 
     # Only keep rows of interest
     if row_events:
@@ -3800,6 +3959,81 @@ class Epochs(BaseEpochs):
         )
         return data
 
+    def _get_epochs_from_raw(self, idxs):
+        """Get the given epochs from disk at once.
+
+        Nearby epochs are read with a single read of the raw data, epochs that
+        are out of bounds or rejected by annotations are handled one by one.
+        """
+        raw = self._raw
+        sfreq = raw.info["sfreq"]
+        n_times = len(self._raw_times)
+        event_samp = self.events[idxs, 0]
+        starts = np.round(event_samp + self._raw_times[0] * sfreq).astype(np.int64)
+        starts -= raw.first_samp
+        ok = (starts >= 0) & (starts + n_times <= raw.n_times)
+        if self.reject_by_annotation and len(raw.annotations) > 0:
+            annot = raw.annotations
+            is_bad = np.array(
+                [desc.lower().startswith("bad") for desc in annot.description], bool
+            )
+            onset = _sync_onset(raw, annot.onset)[is_bad]
+            offset = onset + annot.duration[is_bad]
+            reject_tmin = self.reject_tmin
+            if reject_tmin is None:
+                reject_tmin = self._raw_times[0]
+            reject_start = np.round(event_samp + reject_tmin * sfreq) - raw.first_samp
+            reject_tmax = self.reject_tmax
+            if reject_tmax is None:
+                reject_tmax = self._raw_times[-1]
+            diff = int(round((self._raw_times[-1] - reject_tmax) * sfreq))
+            reject_stop = starts + n_times - diff
+            ok &= ~np.any(
+                (onset < reject_stop[:, np.newaxis] / sfreq)
+                & (offset > reject_start[:, np.newaxis] / sfreq),
+                axis=1,
+            )
+        other = {
+            ii: self._get_epoch_from_raw(idx)
+            for ii, idx in enumerate(idxs)
+            if not ok[ii]
+        }
+        # Merge the epochs into runs of overlapping or close (a gap of at most
+        # one epoch, which is cheaper to read than to seek over) epochs
+        starts = starts[ok]
+        order = np.argsort(starts, kind="stable")
+        max_run = max(n_times, 2**22 // max(len(self.picks), 1))
+        data = None
+        run = list()
+        for oi in order:
+            if run and (
+                starts[oi] > starts[run[-1]] + 2 * n_times
+                or starts[oi] + n_times - starts[run[0]] > max_run
+            ):
+                data = self._read_epochs_run(data, starts, run, len(order))
+                run = list()
+            run.append(oi)
+        if run:
+            data = self._read_epochs_run(data, starts, run, len(order))
+        if data is None:
+            data = np.empty((0, len(self.picks), n_times))
+        return data, ok, other
+
+    def _read_epochs_run(self, data, starts, run, n_epochs):
+        """Read a run of (sorted) epochs into data (allocated on first use)."""
+        n_times = len(self._raw_times)
+        run_start = starts[run[0]]
+        seg = self._raw._getitem(
+            (self.picks, slice(run_start, starts[run[-1]] + n_times)),
+            return_times=False,
+        )
+        logger.debug(f"    Getting {len(run)} epochs from {seg.shape[1]} samples")
+        if data is None:
+            data = np.empty((n_epochs, len(seg), n_times), seg.dtype)
+        windows = np.lib.stride_tricks.sliding_window_view(seg, n_times, axis=1)
+        data[run] = windows[:, starts[run] - run_start].transpose(1, 0, 2)
+        return data
+
 
 @fill_doc
 class EpochsArray(BaseEpochs):
@@ -4117,67 +4351,11 @@ def _is_good(
     If full_report=True, it will give True/False as well as a list of all
     offending channels.
     """
-    bad_tuple = tuple()
-    has_printed = False
-    checkable = np.ones(len(ch_names), dtype=bool)
-    checkable[np.array([c in ignore_chs for c in ch_names], dtype=bool)] = False
-
-    for refl, f, t in zip([reject, flat], [np.greater, np.less], ["", "flat"]):
-        if refl is not None:
-            for key, refl in refl.items():
-                criterion = refl
-                idx = channel_type_idx[key]
-                name = key.upper()
-                if len(idx) > 0:
-                    e_idx = e[idx]
-                    checkable_idx = checkable[idx]
-                    # Check if criterion is a function and apply it
-                    if callable(criterion):
-                        result = criterion(e_idx)
-                        _validate_type(result, tuple, "reject/flat output")
-                        if len(result) != 2:
-                            raise TypeError(
-                                "Function criterion must return a tuple of length 2"
-                            )
-                        cri_truth, reasons = result
-                        _validate_type(cri_truth, (bool, np.bool_), cri_truth, "bool")
-                        _validate_type(
-                            reasons, (str, list, tuple), reasons, "str, list, or tuple"
-                        )
-                        idx_deltas = np.where(np.logical_and(cri_truth, checkable_idx))[
-                            0
-                        ]
-                    else:
-                        deltas = np.max(e_idx, axis=1) - np.min(e_idx, axis=1)
-                        idx_deltas = np.where(
-                            np.logical_and(f(deltas, criterion), checkable_idx)
-                        )[0]
-
-                    if len(idx_deltas) > 0:
-                        # Check to verify that refl is a callable that returns
-                        # (bool, reason). Reason must be a str/list/tuple.
-                        # If using tuple
-                        if callable(refl):
-                            if isinstance(reasons, str):
-                                reasons = (reasons,)
-                            for idx, reason in enumerate(reasons):
-                                _validate_type(reason, str, reason)
-                            bad_tuple += tuple(reasons)
-                        else:
-                            bad_names = [ch_names[idx[i]] for i in idx_deltas]
-                            if not has_printed:
-                                logger.info(
-                                    f"    Rejecting {t} epoch based on {name} : "
-                                    f"{bad_names}"
-                                )
-                                has_printed = True
-                            if not full_report:
-                                return False
-                            else:
-                                bad_tuple += tuple(bad_names)
-
+    bad_tuple = _drop_log_entries(
+        e[np.newaxis], ch_names, channel_type_idx, reject, flat, ignore_chs
+    )[0]
     if not full_report:
-        return True
+        return bad_tuple == ()
     else:
         if bad_tuple == ():
             return True, None
@@ -4185,6 +4363,97 @@ def _is_good(
             return False, bad_tuple
 
 
+def _merge_moments(moments, data, keys, sum_sq=True):
+    """Merge a block of epochs into running moments, in place.
+
+    ``moments`` maps each key to ``(n, mean, m2)``, where ``m2`` is the sum of
+    squared deviations from the mean (only computed if ``sum_sq``). Blocks are
+    combined with the pairwise update of Chan et al. (1979), which is
+    numerically stable. For complex data the squares are not conjugated.
+    """
+    keys = np.array(keys, object)
+    for key in dict.fromkeys(keys.tolist()):
+        use = keys == key
+        block = data if use.all() else data[use]
+        n_b = len(block)
+        mean_b = block.mean(axis=0)
+        m2_b = ((block - mean_b) ** 2).sum(axis=0) if sum_sq else None
+        if key not in moments:
+            moments[key] = (n_b, mean_b, m2_b)
+            continue
+        n_a, mean_a, m2_a = moments[key]
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        mean = mean_a + delta * (n_b / n)
+        m2 = m2_a + m2_b + delta**2 * (n_a * n_b / n) if sum_sq else None
+        moments[key] = (n, mean, m2)
+
+
+def _drop_log_entries(data, ch_names, channel_type_idx, reject, flat, ignore_chs=()):
+    """Test all epochs in data according to reject and flat at once.
+
+    The peak-to-peak amplitudes are computed for all epochs at once, functions
+    (which take the data of one epoch) are called for each epoch.
+
+    Returns the tuple of reasons to drop each epoch (empty if it is good).
+    """
+    n_epochs = len(data)
+    bad_tuples = [()] * n_epochs
+    messages = dict()  # the first reason (if not a function) is logged
+    checkable = np.array([ch_name not in ignore_chs for ch_name in ch_names], bool)
+    for refl, f, t in zip([reject, flat], [np.greater, np.less], ["", "flat"]):
+        if refl is None:
+            continue
+        for key, criterion in refl.items():
+            idx = np.asarray(channel_type_idx[key], int)
+            if len(idx) == 0:
+                continue
+            checkable_idx = checkable[idx]
+            if callable(criterion):
+                # functions get a copy, as they could modify the data in place
+                for ei in range(n_epochs):
+                    bad_tuples[ei] += _call_criterion(
+                        criterion, data[ei][idx], checkable_idx
+                    )
+                continue
+            if np.all(np.diff(idx) == 1):  # avoid a copy
+                data_idx = data[:, idx[0] : idx[-1] + 1]
+            else:
+                data_idx = data[:, idx]
+            deltas = np.max(data_idx, axis=-1) - np.min(data_idx, axis=-1)
+            bads = f(deltas, criterion) & checkable_idx
+            for ei in np.flatnonzero(bads.any(axis=1)):
+                bad_names = [ch_names[ii] for ii in idx[bads[ei]]]
+                messages.setdefault(
+                    ei,
+                    f"    Rejecting {t} epoch based on {key.upper()} : {bad_names}",
+                )
+                bad_tuples[ei] += tuple(bad_names)
+    for ei in sorted(messages):
+        logger.info(messages[ei])
+    return bad_tuples
+
+
+def _call_criterion(criterion, e_idx, checkable_idx):
+    """Get the reasons to drop one epoch based on a callable criterion."""
+    result = criterion(e_idx)
+    _validate_type(result, tuple, "reject/flat output")
+    if len(result) != 2:
+        raise TypeError("Function criterion must return a tuple of length 2")
+    cri_truth, reasons = result
+    _validate_type(cri_truth, (bool, np.bool_), cri_truth, "bool")
+    _validate_type(reasons, (str, list, tuple), reasons, "str, list, or tuple")
+    if not np.any(np.logical_and(cri_truth, checkable_idx)):
+        return ()
+    # Check to verify that refl is a callable that returns
+    # (bool, reason). Reason must be a str/list/tuple.
+    if isinstance(reasons, str):
+        reasons = (reasons,)
+    for reason in reasons:
+        _validate_type(reason, str, reason)
+    return tuple(reasons)
+
+
 def _read_one_epoch_file(f, tree, preload):
     """Read a single FIF file."""
     with f as fid:
@@ -4386,6 +4655,10 @@ def read_epochs(
     preload : bool
         If True, read all epochs from disk immediately. If ``False``, epochs
         will be read on demand.
+
+        .. versionchanged:: 1.13
+           With ``preload=False``, the data of uncompressed files are
+           memory-mapped, and only the epochs that are accessed are read.
     %(verbose)s
 
     Returns
@@ -4396,20 +4669,78 @@ def read_epochs(
     return EpochsFIF(fname, proj, preload, verbose)
 
 
+# the containers with memory-mapped data, which must be released before their
+# file is overwritten
+_memmap_containers = WeakSet()
+
+
+def _release_memmaps(fname):
+    """Read files that will be overwritten with file handles instead of memmaps."""
+    fname = Path(fname).resolve()
+    for container in list(_memmap_containers):
+        if container.fname.resolve() == fname:
+            container.data = None
+            container.fid = fiff_open(container.fname)[0]
+            _memmap_containers.discard(container)
+
+
 class _RawContainer:
     """Helper for a raw data container."""
 
-    def __init__(self, fid, data_tag, event_samps, epoch_shape, cals, fmt):
-        self.fid = fid
+    def __init__(self, fname, data_tag, event_samps, epoch_shape, cals, fmt):
+        self.fname = fname
+        self.fid = self.data = None
+        if fname.suffixes[-1] == ".gz":
+            self.fid = fiff_open(fname)[0]
+        else:
+            # memory-map the data, so that only the epochs that are accessed
+            # are read (and calibrated)
+            self.data = np.memmap(
+                fname,
+                fmt,
+                mode="r",
+                offset=data_tag.pos + 16,  # 16 = Tag header
+                shape=(len(event_samps),) + tuple(epoch_shape),
+            )
+            _memmap_containers.add(self)
         self.data_tag = data_tag
         self.event_samps = event_samps
         self.epoch_shape = epoch_shape
         self.cals = cals
         self.proj = False
         self.fmt = fmt
+        self._order = np.argsort(event_samps, kind="stable")
 
     def __del__(self):  # noqa: D105
-        self.fid.close()
+        if self.fid is not None:
+            self.fid.close()
+
+    def _find(self, event_samps):
+        """Get the index of each event sample in this file (-1 if absent)."""
+        sorted_samps = self.event_samps[self._order]
+        pos = np.searchsorted(sorted_samps, event_samps)
+        pos = np.minimum(pos, len(sorted_samps) - 1)
+        found = sorted_samps[pos] == event_samps
+        return np.where(found, self._order[pos], -1)
+
+    def _read(self, idx):
+        """Read and calibrate the epochs with the given indices."""
+        if self.data is not None:
+            data = self.data[idx]
+        else:
+            size = np.prod(self.epoch_shape) * np.dtype(self.fmt).itemsize
+            data = np.empty((len(idx),) + tuple(self.epoch_shape), self.fmt)
+            for ii, ei in enumerate(idx):
+                self.fid.seek(self.data_tag.pos + ei * size + 16, 0)
+                data[ii] = np.frombuffer(self.fid.read(size), self.fmt).reshape(
+                    self.epoch_shape
+                )
+        if self.fmt in (">c8", ">c16"):
+            data = data.astype(np.complex128)
+        else:
+            data = data.astype(np.float64)
+        data *= self.cals
+        return data
 
 
 @fill_doc
@@ -4423,6 +4754,10 @@ class EpochsFIF(BaseEpochs):
     preload : bool
         If True, read all epochs from disk immediately. If False, epochs will
         be read on demand.
+
+        .. versionchanged:: 1.13
+           With ``preload=False``, the data of uncompressed files are
+           memory-mapped, and only the epochs that are accessed are read.
     %(verbose)s
 
     See Also
@@ -4510,7 +4845,7 @@ class EpochsFIF(BaseEpochs):
                 # store everything we need to index back to the original data
                 raw.append(
                     _RawContainer(
-                        fiff_open(fname)[0],
+                        fname,
                         data_tag,
                         events[:, 0].copy(),
                         epoch_shape,
@@ -4593,47 +4928,31 @@ class EpochsFIF(BaseEpochs):
     @verbose
     def _get_epoch_from_raw(self, idx, verbose=None):
         """Load one epoch from disk."""
-        # Find the right file and offset to use
-        event_samp = self.events[idx, 0]
+        return self._get_epochs_from_raw([idx])[0][0]
+
+    def _get_epochs_from_raw(self, idxs):
+        """Load the given epochs from disk at once."""
         assert self._raw is not None
+        event_samps = self.events[idxs, 0]
+        found = np.zeros(len(event_samps), bool)
+        data = None
         for raw in self._raw:
-            idx = np.where(raw.event_samps == event_samp)[0]
-            if len(idx) == 1:
-                fmt = raw.fmt
-                idx = idx[0]
-                size = np.prod(raw.epoch_shape) * np.dtype(fmt).itemsize
-                offset = idx * size + 16  # 16 = Tag header
-                break
-        else:
-            # read the correct subset of the data
+            idx = raw._find(event_samps)
+            use = idx >= 0
+            if not use.any():
+                continue
+            this_data = raw._read(idx[use])
+            if data is None:
+                data = np.empty(
+                    (len(event_samps),) + this_data.shape[1:], this_data.dtype
+                )
+            data[use] = this_data
+            found |= use
+        if not found.all():
             raise RuntimeError(
                 "Correct epoch could not be found, please contact mne-python developers"
             )
-        # the following is equivalent to this, but faster:
-        #
-        # >>> data = read_tag(raw.fid, raw.data_tag.pos).data.astype(float)
-        # >>> data *= raw.cals[np.newaxis, :, :]
-        # >>> data = data[idx]
-        #
-        # Eventually this could be refactored in io/tag.py if other functions
-        # could make use of it
-        raw.fid.seek(raw.data_tag.pos + offset, 0)
-        if fmt == ">c8":
-            read_fmt = ">f4"
-        elif fmt == ">c16":
-            read_fmt = ">f8"
-        else:
-            read_fmt = fmt
-        data = np.frombuffer(raw.fid.read(size), read_fmt)
-        if read_fmt != fmt:
-            data = data.view(fmt)
-            data = data.astype(np.complex128)
-        else:
-            data = data.astype(np.float64)
-
-        data = _reshape_view(data, raw.epoch_shape)
-        data *= raw.cals
-        return data
+        return data, found, dict()
 
 
 @fill_doc
@@ -4,6 +4,11 @@
 
 """IIR and FIR filtering and resampling functions."""
 
+import json
+import os
+import os.path as op
+import platform
+import time
 from collections import Counter
 from copy import deepcopy
 from functools import lru_cache, partial
@@ -18,27 +23,38 @@ from ._ola import _COLA
 from .cuda import (
     _fft_multiply_repeated,
     _fft_resample,
+    _map_threads,
     _setup_cuda_fft_multiply_repeated,
     _setup_cuda_fft_resample,
     _smart_pad,
 )
 from .fixes import _reshape_view
-from .parallel import parallel_func
+from .parallel import _check_n_jobs, parallel_func
 from .utils import (
     _check_option,
     _check_preload,
     _ensure_int,
+    _get_fft_workers,
+    _open_lock,
     _pl,
     _validate_type,
+    get_config,
     logger,
     sum_squared,
     verbose,
     warn,
 )
+from .utils.config import _get_extra_data_path
 
 # These values from Ifeachor and Jervis.
 _length_factors = dict(hann=3.1, hamming=3.3, blackman=5.0)
 
+# Designed filters (and the FFTs of FIR kernels) are memoized, as pipelines
+# tend to design the same few filters over and over. FFTs can be large, so
+# fewer of them are kept.
+_DESIGN_CACHE_SIZE = 128
+_FFT_CACHE_SIZE = 16
+
 
 def next_fast_len(target):
     """Find the next fast size of input data to `fft`, for zero-padding, etc.
@@ -285,8 +301,13 @@ def _overlap_add_filter(
     n_jobs=None,
     copy=True,
     pad="reflect_limited",
+    autotune=False,
 ):
-    """Filter the signal x using h with overlap-add FFTs."""
+    """Filter the signal x using h with overlap-add FFTs.
+
+    If ``autotune`` is True (see :func:`_use_fir_autotune`) and ``n_fft`` is
+    None, the fastest implementation according to the stored timings is used.
+    """
     # set up array for filtering, reshape to 2D, operate on last axis
     x, orig_shape, picks = _prep_for_filtering(x, copy, picks)
     # Extend the signal by mirroring the edges to reduce transient filter
@@ -301,7 +322,14 @@ def _overlap_add_filter(
     if phase == "zero-double":
         h = np.convolve(h, h[::-1])
 
-    # Determine FFT length to use
+    # Determine FFT length to use (or use direct convolution)
+    if n_fft is None and not isinstance(n_jobs, str) and autotune:
+        n_fft = _fastest_fir_impl(len(h), n_x)
+        if n_fft == "direct":
+            picks = _picks_to_idx(len(x), picks)
+            for chunk in _picks_chunks(picks, n_x * 2):
+                x[chunk] = _direct_filter(x[chunk], h, n_edge, phase, pad)
+            return _reshape_view(x, orig_shape)
     min_fft = 2 * len(h) - 1
     if n_fft is None:
         max_fft = n_x
@@ -332,10 +360,33 @@ def _overlap_add_filter(
         )
 
     # Figure out if we should use CUDA
-    n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft)
+    n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(
+        n_jobs, h, n_fft, h_fft=_fir_fft(np.asarray(h, float).tobytes(), n_fft)
+    )
 
-    # Process each row separately
     picks = _picks_to_idx(len(x), picks)
+    if "n_threads" in cuda_dict:  # rows in CPU threads with reused buffers
+
+        def filter_row(p):
+            x[p] = _1d_overlap_filter(
+                x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft
+            )
+
+        _map_threads(filter_row, picks, cuda_dict["n_threads"])
+        return _reshape_view(x, orig_shape)
+    elif isinstance(cuda_dict["h_fft"], np.ndarray):  # not using CUDA
+        # Process blocks of rows at once, with the FFTs using n_jobs threads
+        # (rather than n_jobs processes each getting a copy of one row), or
+        # mne.set_fft_workers threads if n_jobs is None
+        workers = _get_fft_workers() if n_jobs is None else _check_n_jobs(n_jobs)
+        n_segments = -(-n_x // (n_fft - len(h) + 1))
+        for chunk in _picks_chunks(picks, n_segments * n_fft):
+            x[chunk] = _2d_overlap_filter(
+                x[chunk], cuda_dict["h_fft"], len(h), n_edge, phase, pad, n_fft, workers
+            )
+        return _reshape_view(x, orig_shape)
+
+    # Process each row separately
     parallel, p_fun, _ = parallel_func(_1d_overlap_filter, n_jobs)
     if n_jobs == 1:
         for p in picks:
@@ -353,6 +404,45 @@ def _overlap_add_filter(
     return x
 
 
+@lru_cache(maxsize=_FFT_CACHE_SIZE)
+def _fir_fft(h_bytes, n_fft):
+    """Compute the (read-only) FFT of a FIR kernel given as bytes."""
+    h_fft = fft.rfft(np.frombuffer(h_bytes, float), n=n_fft)
+    h_fft.flags.writeable = False
+    return h_fft
+
+
+def _2d_overlap_filter(x, h_fft, n_h, n_edge, phase, pad, n_fft, workers):
+    """Do overlap-add FFT FIR filtering of all rows at once."""
+    # pad to reduce ringing
+    x_ext = _smart_pad(x, (n_edge, n_edge), pad)
+    n_rows, n_x = x_ext.shape
+
+    n_seg = n_fft - n_h + 1
+    n_segments = -(-n_x // n_seg)
+    shift = ((n_h - 1) // 2 if phase.startswith("zero") else 0) + n_edge
+
+    # Split into zero-padded segments and filter them all at once
+    segs = np.zeros((n_rows, n_segments, n_fft))
+    for seg_idx in range(n_segments):
+        seg = x_ext[:, seg_idx * n_seg : (seg_idx + 1) * n_seg]
+        segs[:, seg_idx, : seg.shape[1]] = seg
+    prod = fft.rfft(segs, axis=-1, workers=workers)
+    prod *= h_fft
+    prod = fft.irfft(prod, n_fft, axis=-1, workers=workers)
+
+    # Overlap-add: the tail of each segment (n_h - 1 <= n_seg samples) only
+    # overlaps with the start of the next one
+    x_filtered = np.zeros((n_rows, (n_segments + 1) * n_seg))
+    heads = x_filtered[:, : n_segments * n_seg].reshape(n_rows, n_segments, n_seg)
+    heads[:] = prod[..., :n_seg]
+    tails = x_filtered[:, n_seg:].reshape(n_rows, n_segments, n_seg)
+    tails[..., : n_fft - n_seg] += prod[..., n_seg:]
+
+    # Remove mirrored edges that we added (n_edge can be zero)
+    return x_filtered[:, shift : shift + n_x - 2 * n_edge]
+
+
 def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
     """Do one-dimensional overlap-add FFT FIR filtering."""
     # pad to reduce ringing
@@ -369,10 +459,8 @@ def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
     for seg_idx in range(n_segments):
         start = seg_idx * n_seg
         stop = (seg_idx + 1) * n_seg
-        seg = x_ext[start:stop]
-        seg = np.concatenate([seg, np.zeros(n_fft - len(seg))])
-
-        prod = _fft_multiply_repeated(seg, cuda_dict)
+        # the FFT zero-pads the segment to n_fft
+        prod = _fft_multiply_repeated(x_ext[start:stop], cuda_dict)
 
         start_filt = max(0, start - shift)
         stop_filt = min(start - shift + n_fft, n_x)
@@ -385,6 +473,193 @@ def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
     return x_filtered
 
 
+def _direct_filter(x, h, n_edge, phase, pad):
+    """Do direct (time-domain) FIR filtering of all rows."""
+    x_ext = _smart_pad(x, (n_edge, n_edge), pad)
+    n_h, n_x = len(h), x_ext.shape[-1]
+    shift = ((n_h - 1) // 2 if phase.startswith("zero") else 0) + n_edge
+    return np.array(
+        [np.convolve(row, h)[shift : shift + n_x - 2 * n_edge] for row in x_ext]
+    )
+
+
+# FIR filtering implementations are benchmarked on signals of at most this many
+# samples (the time per sample of overlap-add filtering does not change for
+# longer signals), and direct convolution only for this many taps or fewer
+_BENCH_MAX_TIMES = 2**18
+_BENCH_MAX_DIRECT_TAPS = 2**10 - 1
+_fir_timings = dict()
+
+
+def _use_fir_autotune():
+    return get_config("MNE_FILTER_AUTOTUNE", "false").lower() == "true"
+
+
+def _fir_timings_fname():
+    return op.join(_get_extra_data_path(), "filter_timings.json")
+
+
+def _load_fir_timings(fid, fname):
+    """Load the stored timings, treating an unreadable file as empty."""
+    try:
+        stored = json.load(fid)
+        if not isinstance(stored, dict) or not all(
+            isinstance(v, dict) for v in stored.values()
+        ):
+            raise ValueError("expected a dict of dicts")
+    except (OSError, ValueError) as exc:
+        logger.debug(f"    Ignoring invalid FIR filter timings {fname}: {exc}")
+        stored = dict()
+    return stored
+
+
+def _read_fir_timings(fname):
+    """Read the timings stored by all machines."""
+    if not op.isfile(fname):
+        return dict()
+    try:
+        with _open_lock(fname, "r") as fid:
+            return _load_fir_timings(fid, fname)
+    except OSError as exc:
+        logger.debug(f"    Could not read FIR filter timings {fname}: {exc}")
+        return dict()
+
+
+def _write_fir_timings(fname, machine, key, timings):
+    """Add timings to the file, keeping those stored by other processes."""
+    tmp_fname = f"{fname}.tmp{os.getpid()}"
+    try:
+        os.makedirs(op.dirname(fname), exist_ok=True)
+        with _open_lock(fname, "a+") as fid:
+            fid.seek(0)
+            stored = _load_fir_timings(fid, fname)
+            stored.setdefault(machine, dict())[key] = timings
+            with open(tmp_fname, "w") as fid_tmp:
+                json.dump(stored, fid_tmp, indent=2)
+            fid.close()  # so that it can be replaced on Windows
+            os.replace(tmp_fname, fname)
+    except OSError as exc:  # e.g., read-only configuration directory
+        logger.debug(f"    Could not write FIR filter timings {fname}: {exc}")
+        if op.isfile(tmp_fname):
+            os.remove(tmp_fname)
+        return dict()
+    return stored
+
+
+def _fir_bench_sizes(n_taps, n_times):
+    """Round the filter and signal lengths up to the benchmarked sizes."""
+    n_taps = 2 ** int(np.ceil(np.log2(n_taps + 1))) - 1  # odd
+    n_times = 2 ** int(np.ceil(np.log2(max(n_times, 1))))
+    return n_taps, n_times
+
+
+@verbose
+def profile_fir_filter(n_taps, n_times, *, force=False, verbose=None):
+    """Measure the speed of FIR filtering implementations.
+
+    Parameters
+    ----------
+    n_taps : int
+        The length of the FIR filter.
+    n_times : int
+        The number of samples of the signal to filter (including the padding
+        added at both ends, i.e., about ``n_taps - 1`` samples each).
+    force : bool
+        If True, measure the timings again even if they were stored before.
+    %(verbose)s
+
+    Returns
+    -------
+    timings : dict
+        The time in seconds that filtering one channel takes with each
+        implementation: ``'direct'`` for direct convolution (only measured for
+        filters of up to 1023 taps), ``'fft-<n_fft>'`` for overlap-add filtering
+        with FFTs of length ``n_fft``, and ``'iir'`` for (forward-backward)
+        filtering with a 4th order Butterworth IIR filter for comparison.
+
+    See Also
+    --------
+    filter_data
+
+    Notes
+    -----
+    The timings are measured for filter lengths rounded up to the next power
+    of 2 (minus 1) and signal lengths rounded up to the next power of 2, once
+    per machine, and are stored in the file ``filter_timings.json`` in the
+    MNE-Python configuration directory (see :func:`mne.get_config_path`).
+    Signals longer than 2 ** 18 samples are measured with that many
+    samples, and the timings scaled accordingly.
+
+    If the configuration variable ``MNE_FILTER_AUTOTUNE`` is ``'true'`` (see
+    :func:`mne.set_config`), FIR filtering (e.g., :func:`mne.filter.filter_data`
+    and :meth:`mne.io.Raw.filter`) uses the fastest of the equivalent direct
+    and overlap-add implementations according to these timings instead of a
+    heuristic choice of the FFT length. The IIR filter is a different filter
+    and thus never chosen.
+
+    .. versionadded:: 1.13
+    """
+    n_taps = _ensure_int(n_taps, "n_taps")
+    n_times = _ensure_int(n_times, "n_times")
+    if n_taps < 1 or n_times < 1:
+        raise ValueError(
+            f"n_taps and n_times must be positive, got {n_taps} and {n_times}"
+        )
+    n_taps, n_times = _fir_bench_sizes(n_taps, n_times)
+    fname, key = _fir_timings_fname(), f"{n_taps}-{n_times}"
+    machine = platform.node()
+    if fname not in _fir_timings:
+        _fir_timings[fname] = _read_fir_timings(fname)
+    stored = _fir_timings[fname].setdefault(machine, dict())
+    if force or key not in stored:
+        logger.info(
+            f"Measuring FIR filtering speed for {n_taps} taps and {n_times} samples"
+        )
+        stored[key] = _time_fir_impls(n_taps, n_times)
+        _fir_timings[fname].update(_write_fir_timings(fname, machine, key, stored[key]))
+    timings = dict(_fir_timings[fname][machine][key])
+    best = min((k for k in timings if k != "iir"), key=timings.get)
+    for impl, t in timings.items():
+        logger.info(f"    {impl:>11}: {t * 1e3:10.3f} ms{' *' if impl == best else ''}")
+    return timings
+
+
+def _time_fir_impls(n_taps, n_times):
+    """Time the FIR filtering implementations (for one channel)."""
+    n_bench = min(n_times, _BENCH_MAX_TIMES)
+    x = np.random.default_rng(0).standard_normal((1, n_bench))
+    h = signal.firwin(n_taps, 0.1)
+    n_edge = min(n_taps, n_bench) - 1
+
+    def _time(func):
+        best = np.inf
+        for _ in range(3):
+            t0 = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - t0)
+        return best * n_times / n_bench
+
+    timings = dict()
+    if n_taps <= _BENCH_MAX_DIRECT_TAPS:
+        timings["direct"] = _time(
+            partial(_direct_filter, x, h, n_edge, "zero", "reflect_limited")
+        )
+    min_fft = np.ceil(np.log2(2 * n_taps - 1))
+    max_fft = max(np.ceil(np.log2(n_bench + 2 * n_edge)), min_fft)
+    for n_fft in 2 ** np.arange(min_fft, max_fft + 1, dtype=int):
+        timings[f"fft-{n_fft}"] = _time(partial(_overlap_add_filter, x, h, int(n_fft)))
+    sos = signal.butter(4, 0.1, output="sos")
+    timings["iir"] = _time(partial(signal.sosfiltfilt, sos, x))
+    return timings
+
+
+def _fastest_fir_impl(n_h, n_x):
+    """Get the fastest FIR implementation: "direct" or the FFT length."""
+    timings = profile_fir_filter(n_h, n_x, verbose=False)
+    best = min((k for k in timings if k != "iir"), key=timings.get)
+    return best if best == "direct" else int(best.split("-")[1])
+
+
 def _filter_attenuation(h, freq, gain):
     """Compute minimum attenuation at stop frequency."""
     _, filt_resp = signal.freqz(h.ravel(), worN=np.pi * freq)
@@ -474,11 +749,6 @@ def _construct_fir_filter(
     If x is multi-dimensional, this operates along the last dimension.
     """
     assert freq[0] == 0
-    if fir_design == "firwin2":
-        fir_design = signal.firwin2
-    else:
-        assert fir_design == "firwin"
-        fir_design = partial(_firwin_design, sfreq=sfreq)
     # issue a warning if attenuation is less than this
     min_att_db = 12 if phase == "minimum-half" else 20
 
@@ -492,6 +762,33 @@ def _construct_fir_filter(
 
     # Use overlap-add filter with a fixed length
     N = _check_zero_phase_length(filter_length, phase, gain[-1])
+    h, att_db, att_freq = _design_fir(
+        sfreq,
+        tuple(freq.tolist()),
+        tuple(gain.tolist()),
+        N,
+        phase,
+        fir_window,
+        fir_design,
+    )
+    if att_db < min_att_db:
+        att_freq *= sfreq / 2.0
+        warn(
+            f"Attenuation at stop frequency {att_freq:0.2f} Hz is only {att_db:0.2f} "
+            "dB. Increase filter_length for higher attenuation."
+        )
+    return h.copy()
+
+
+@lru_cache(maxsize=_DESIGN_CACHE_SIZE)
+def _design_fir(sfreq, freq, gain, N, phase, fir_window, fir_design):
+    """Design a (read-only) FIR filter and get its attenuation."""
+    if fir_design == "firwin2":
+        fir_design = signal.firwin2
+    else:
+        assert fir_design == "firwin"
+        fir_design = partial(_firwin_design, sfreq=sfreq)
+    freq, gain = np.array(freq), np.array(gain)
     # construct symmetric (linear phase) filter
     if phase == "minimum-half":
         h = fir_design(N * 2 - 1, freq, gain, window=fir_window)
@@ -504,13 +801,8 @@ def _construct_fir_filter(
     att_db, att_freq = _filter_attenuation(h, freq, gain)
     if phase == "zero-double":
         att_db += 6
-    if att_db < min_att_db:
-        att_freq *= sfreq / 2.0
-        warn(
-            f"Attenuation at stop frequency {att_freq:0.2f} Hz is only {att_db:0.2f} "
-            "dB. Increase filter_length for higher attenuation."
-        )
-    return h
+    h.flags.writeable = False
+    return h, att_db, att_freq
 
 
 def _check_zero_phase_length(N, phase, gain_nyq=0):
@@ -809,7 +1101,7 @@ def construct_iir_filter(
     if not isinstance(iir_params, dict):
         raise TypeError(f"iir_params must be a dict, got {type(iir_params)}")
     # if the filter has been designed, we're good to go
-    Wp = None
+    Wp = design = None
     if "sos" in iir_params:
         system = iir_params["sos"]
         output = "sos"
@@ -852,7 +1144,7 @@ def construct_iir_filter(
         # SciPy designs forward for -3dB, so forward-backward is -6dB
         if "order" in iir_params:
             singleton = btype in ("low", "lowpass", "high", "highpass")
-            use_Wp = Wp.item() if singleton else Wp
+            use_Wp = Wp.item() if singleton else tuple(Wp.tolist())
             kwargs = dict(
                 N=iir_params["order"],
                 Wn=use_Wp,
@@ -863,7 +1155,7 @@ def construct_iir_filter(
             for key in ("rp", "rs"):
                 if key in iir_params:
                     kwargs[key] = iir_params[key]
-            system = signal.iirfilter(**kwargs)
+            design = ("iirfilter", tuple(sorted(kwargs.items())))
             if phase in ("zero", "zero-double"):
                 ptype, pmul = "(effective, after forward-backward)", 2
             else:
@@ -878,14 +1170,16 @@ def construct_iir_filter(
                 raise ValueError(
                     "iir_params must have at least 'gstop' and 'gpass' (or N) entries."
                 )
-            system = signal.iirdesign(
-                Wp,
-                Ws,
-                iir_params["gpass"],
-                iir_params["gstop"],
+            kwargs = dict(
+                wp=tuple(Wp.tolist()),
+                ws=tuple(np.atleast_1d(Ws).tolist()),
+                gpass=iir_params["gpass"],
+                gstop=iir_params["gstop"],
                 ftype=ftype,
                 output=output,
             )
+            design = ("iirdesign", tuple(sorted(kwargs.items())))
+        system = _copy_system(_design_iir(*design))
 
     if system is None:
         raise RuntimeError("coefficients could not be created from iir_params")
@@ -906,7 +1200,10 @@ def construct_iir_filter(
         logger.info(f"- Cutoff{_pl(f_pass)} at {edge_freqs} Hz: {cutoffs} dB")
     # now deal with padding
     if "padlen" not in iir_params:
-        padlen = estimate_ringing_samples(system)
+        if design is None:
+            padlen = estimate_ringing_samples(system)
+        else:
+            padlen = _design_iir_padlen(*design)
     else:
         padlen = iir_params["padlen"]
 
@@ -922,6 +1219,78 @@ def construct_iir_filter(
     return iir_params
 
 
+@lru_cache(maxsize=_DESIGN_CACHE_SIZE)
+def _design_iir(func, kwargs):
+    """Design a (read-only) IIR filter with a SciPy design function."""
+    system = getattr(signal, func)(**dict(kwargs))
+    for arr in (system,) if isinstance(system, np.ndarray) else system:
+        arr.flags.writeable = False
+    return system
+
+
+@lru_cache(maxsize=_DESIGN_CACHE_SIZE)
+def _design_iir_padlen(func, kwargs):
+    return estimate_ringing_samples(_copy_system(_design_iir(func, kwargs)))
+
+
+def _copy_system(system):
+    if isinstance(system, np.ndarray):
+        return system.copy()
+    return tuple(arr.copy() for arr in system)
+
+
+_filter_caches = dict(
+    fir=_design_fir, iir=_design_iir, iir_padlen=_design_iir_padlen, fft=_fir_fft
+)
+
+
+def filter_cache_info():
+    """Get information about the cache of designed filters.
+
+    Returns
+    -------
+    info : dict
+        For each of the caches (FIR filters ``'fir'``, IIR filters ``'iir'``,
+        their padding lengths ``'iir_padlen'``, and the FFTs of FIR filters used
+        for overlap-add filtering ``'fft'``), a dict with the number of cache
+        ``'hits'`` and ``'misses'``, the number of cached entries ``'size'``, and
+        the maximum number of entries ``'max_size'``.
+
+    See Also
+    --------
+    clear_filter_cache
+
+    Notes
+    -----
+    Filters designed by :func:`mne.filter.create_filter` (and thus by all
+    filtering functions and methods) are kept in a least-recently-used cache,
+    so that designing the same filter again (e.g., for another subject or
+    channel type with the same sampling frequency) is fast.
+
+    .. versionadded:: 1.13
+    """
+    info = dict()
+    for key, func in _filter_caches.items():
+        hits, misses, max_size, size = func.cache_info()
+        info[key] = dict(hits=hits, misses=misses, size=size, max_size=max_size)
+    return info
+
+
+def clear_filter_cache():
+    """Clear the cache of designed filters.
+
+    See Also
+    --------
+    filter_cache_info
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    for func in _filter_caches.values():
+        func.cache_clear()
+
+
 def _check_method(method, iir_params, extra_types=()):
     """Parse method arguments."""
     allowed_types = ["iir", "fir", "fft"] + list(extra_types)
@@ -1044,7 +1413,9 @@ def filter_data(
         fir_design,
     )
     if method in ("fir", "fft"):
-        data = _overlap_add_filter(data, filt, None, phase, picks, n_jobs, copy, pad)
+        data = _overlap_add_filter(
+            data, filt, None, phase, picks, n_jobs, copy, pad, _use_fir_autotune()
+        )
     else:
         data = _iir_filter(data, filt, picks, n_jobs, copy, phase)
     return data
@@ -1549,24 +1920,11 @@ def notch_filter(
 
     # Only have to deal with notch_widths for non-autodetect
     if freqs is not None:
-        if notch_widths is None:
-            notch_widths = freqs / 200.0
-        elif np.any(notch_widths < 0):
-            raise ValueError("notch_widths must be >= 0")
-        else:
-            notch_widths = np.atleast_1d(notch_widths)
-            if len(notch_widths) == 1:
-                notch_widths = notch_widths[0] * np.ones_like(freqs)
-            elif len(notch_widths) != len(freqs):
-                raise ValueError(
-                    "notch_widths must be None, scalar, or the same length as freqs"
-                )
+        notch_widths = _check_notch_widths(freqs, notch_widths)
 
     if method in ("fir", "iir"):
         # Speed this up by computing the fourier coefficients once
-        tb_2 = trans_bandwidth / 2.0
-        lows = [freq - nw / 2.0 - tb_2 for freq, nw in zip(freqs, notch_widths)]
-        highs = [freq + nw / 2.0 + tb_2 for freq, nw in zip(freqs, notch_widths)]
+        lows, highs, tb_2 = _notch_stop_bands(freqs, notch_widths, trans_bandwidth)
         xf = filter_data(
             x,
             Fs,
@@ -1602,6 +1960,30 @@ def notch_filter(
     return xf
 
 
+def _check_notch_widths(freqs, notch_widths):
+    if notch_widths is None:
+        notch_widths = freqs / 200.0
+    elif np.any(notch_widths < 0):
+        raise ValueError("notch_widths must be >= 0")
+    else:
+        notch_widths = np.atleast_1d(notch_widths)
+        if len(notch_widths) == 1:
+            notch_widths = notch_widths[0] * np.ones_like(freqs)
+        elif len(notch_widths) != len(freqs):
+            raise ValueError(
+                "notch_widths must be None, scalar, or the same length as freqs"
+            )
+    return notch_widths
+
+
+def _notch_stop_bands(freqs, notch_widths, trans_bandwidth):
+    """Get the edges of the stop bands and the transition bandwidth."""
+    tb_2 = trans_bandwidth / 2.0
+    lows = [freq - nw / 2.0 - tb_2 for freq, nw in zip(freqs, notch_widths)]
+    highs = [freq + nw / 2.0 + tb_2 for freq, nw in zip(freqs, notch_widths)]
+    return lows, highs, tb_2
+
+
 @lru_cache
 def _get_window_thresh(n_times, sfreq, mt_bandwidth, p_value):
     from .time_frequency.multitaper import _compute_mt_params
@@ -1642,24 +2024,21 @@ def _mt_spectrum_proc(
         _get_window_thresh, sfreq=sfreq, mt_bandwidth=mt_bandwidth, p_value=p_value
     )
     window_fun, threshold = get_wt(filter_length)
+    # Channels are processed in blocks that are small enough for the tapered
+    # spectra of a window of all channels of a block to be computed at once
+    chunks = _picks_chunks(picks, window_fun.shape[1] * len(window_fun))
     parallel, p_fun, n_jobs = parallel_func(_mt_spectrum_remove_win, n_jobs)
+    args = (sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt)
     if n_jobs == 1:
         freq_list = list()
-        for ii, x_ in enumerate(x):
-            if pick_mask[ii]:
-                x[ii], f = _mt_spectrum_remove_win(
-                    x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt
-                )
-                freq_list.append(f)
+        for chunk in chunks:
+            x[chunk], f = _mt_spectrum_remove_win(x[chunk], *args)
+            freq_list.extend(f)
     else:
-        data_new = parallel(
-            p_fun(x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt)
-            for xi, x_ in enumerate(x)
-            if pick_mask[xi]
-        )
-        freq_list = [d[1] for d in data_new]
-        data_new = np.array([d[0] for d in data_new])
-        x[picks, :] = data_new
+        data_new = parallel(p_fun(x[chunk], *args) for chunk in chunks)
+        freq_list = sum((d[1] for d in data_new), list())
+        for chunk, d in zip(chunks, data_new):
+            x[chunk] = d[0]
 
     # report found frequencies, but do some sanitizing first by binning into
     # 1 Hz bins
@@ -1687,17 +2066,21 @@ def _mt_spectrum_remove_win(
     n_samples = window_fun.shape[1]
     n_overlap = (n_samples + 1) // 2
     x_out = np.zeros_like(x)
-    rm_freqs = list()
+    rm_freqs = [list() for _ in range(len(x))]
 
-    # Define how to process a chunk of data
+    # Define how to process a chunk of data (all channels at once)
     def process(x_, *, start, stop):
         out = _mt_spectrum_remove(
             x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_thresh
         )
-        rm_freqs.append(out[1])
+        for ii, f in enumerate(out[1]):
+            rm_freqs[ii].append(f)
         return (out[0],)  # must return a tuple
 
-    _COLA(process, x_out, n_times, n_samples, n_overlap, sfreq, verbose=False).feed(x)
+    # Stream the data window by window so that the input buffer stays small
+    cola = _COLA(process, x_out, n_times, n_samples, n_overlap, sfreq, verbose=False)
+    for start in range(0, n_times, n_samples):
+        cola.feed(x[:, start : start + n_samples])
     return x_out, rm_freqs
 
 
@@ -1707,17 +2090,17 @@ def _mt_spectrum_remove(
     """Use MT-spectrum to remove line frequencies.
 
     Based on Chronux. If line_freqs is specified, all freqs within notch_width
-    of each line_freq is set to zero.
+    of each line_freq is set to zero. Operates on all channels (rows) of x at
+    once.
     """
     from .time_frequency.multitaper import _mt_spectra
 
-    assert x.ndim == 1
+    assert x.ndim == 2
     if x.shape[-1] != window_fun.shape[-1]:
         window_fun, threshold = get_thresh(x.shape[-1])
     # drop the even tapers
     n_tapers = len(window_fun)
     tapers_odd = np.arange(0, n_tapers, 2)
-    tapers_even = np.arange(1, n_tapers, 2)
     tapers_use = window_fun[tapers_odd]
 
     # sum tapers for (used) odd prolates across time (n_tapers, 1)
@@ -1727,13 +2110,14 @@ def _mt_spectrum_remove(
     H0_sq = sum_squared(H0)
 
     # make "time" vector
-    rads = 2 * np.pi * (np.arange(x.size) / float(sfreq))
+    rads = 2 * np.pi * (np.arange(x.shape[-1]) / float(sfreq))
 
-    # compute mt_spectrum (returning n_ch, n_tapers, n_freq)
-    x_p, freqs = _mt_spectra(x[np.newaxis, :], window_fun, sfreq)
+    # compute mt_spectrum (returning n_ch, n_tapers, n_freq) with a single FFT
+    x_p, freqs = _mt_spectra(x[np.newaxis], window_fun, sfreq)
+    x_p = x_p[0]
 
-    # sum of the product of x_p and H0 across tapers (1, n_freqs)
-    x_p_H0 = np.sum(x_p[:, tapers_odd, :] * H0[np.newaxis, :, np.newaxis], axis=1)
+    # sum of the product of x_p and H0 across tapers (n_ch, n_freqs)
+    x_p_H0 = np.einsum("ctf,t->cf", x_p[:, tapers_odd], H0)
 
     # resulting calculated amplitudes for all freqs
     A = x_p_H0 / H0_sq
@@ -1741,21 +2125,20 @@ def _mt_spectrum_remove(
     if line_freqs is None:
         # figure out which freqs to remove using F stat
 
-        # estimated coefficient
-        x_hat = A * H0[:, np.newaxis]
-
         # numerator for F-statistic
-        num = (n_tapers - 1) * (A * A.conj()).real * H0_sq
-        # denominator for F-statistic
-        den = np.sum(np.abs(x_p[:, tapers_odd, :] - x_hat) ** 2, 1) + np.sum(
-            np.abs(x_p[:, tapers_even, :]) ** 2, 1
-        )
-        den[den == 0] = np.inf
+        fit_power = (A * A.conj()).real * H0_sq
+        num = (n_tapers - 1) * fit_power
+        # denominator for F-statistic: the residual power of the odd tapers
+        # after subtracting the estimated coefficient (A * H0) plus the power of
+        # the even tapers, which is the total power minus that of the fit
+        den = np.einsum("ctf,ctf->cf", x_p.real, x_p.real)
+        den += np.einsum("ctf,ctf->cf", x_p.imag, x_p.imag)
+        den -= fit_power
+        den[den <= 0] = np.inf
         f_stat = num / den
 
-        # find frequencies to remove
-        indices = np.where(f_stat > threshold)[1]
-        rm_freqs = freqs[indices]
+        # find frequencies to remove (for each channel)
+        mask = f_stat > threshold
     else:
         # specify frequencies
         indices_1 = np.unique([np.argmin(np.abs(freqs - lf)) for lf in line_freqs])
@@ -1765,18 +2148,19 @@ def _mt_spectrum_remove(
         ]
         indices_2 = np.where(np.any(np.array(indices_2), axis=0))[0]
         indices = np.unique(np.r_[indices_1, indices_2])
-        rm_freqs = freqs[indices]
+        mask = np.zeros(A.shape, bool)
+        mask[:, indices] = True
+    rm_freqs = [freqs[m] for m in mask]
 
+    indices = np.where(mask.any(axis=0))[0]
     if len(indices) == 0:
         datafit = 0.0
     else:
-        c = 2 * A[0, indices]
-        # fitted sinusoids are summed, and subtracted from data
-        datafit = np.sum(
-            np.abs(c)[:, np.newaxis]
-            * np.cos(freqs[indices, np.newaxis] * rads + np.angle(c)[:, np.newaxis]),
-            axis=0,
-        )
+        c = np.where(mask[:, indices], 2 * A[:, indices], 0)
+        # fitted sinusoids (|c| cos(wt + angle(c)) = Re(c exp(iwt))) are summed
+        # for all channels at once, and subtracted from data
+        phases = freqs[indices, np.newaxis] * rads
+        datafit = c.real @ np.cos(phases) - c.imag @ np.sin(phases)
 
     return x - datafit, rm_freqs
 
@@ -1844,7 +2228,8 @@ def resample(
         Axis along which to resample (default is the last axis).
     %(window_resample)s
     %(n_jobs_cuda)s
-        ``n_jobs='cuda'`` is only supported when ``method="fft"``.
+        ``n_jobs='cuda'`` and ``n_jobs='threads'`` are only supported when
+        ``method="fft"``.
     %(pad_resample_auto)s
 
         .. versionadded:: 0.15
@@ -1983,6 +2368,16 @@ def _resample_fft(x_flat, *, ratio, final_len, pad, window, npad, n_jobs):
 
     # do the resampling using an adaptation of scipy's FFT-based resample()
     # use of the 'flat' window is recommended for minimal ringing
+    if "n_threads" in cuda_dict:  # rows in CPU threads with reused buffers
+        y = np.zeros((len(x_flat), new_len - to_removes.sum()), dtype=x_flat.dtype)
+
+        def resample_row(xi):
+            y[xi] = _fft_resample(
+                x_flat[xi], new_len, npads, to_removes, cuda_dict, pad
+            )
+
+        _map_threads(resample_row, range(len(x_flat)), cuda_dict["n_threads"])
+        return y
     parallel, p_fun, n_jobs = parallel_func(_fft_resample, n_jobs)
     if n_jobs == 1:
         y = np.zeros((len(x_flat), new_len - to_removes.sum()), dtype=x_flat.dtype)
@@ -2020,22 +2415,28 @@ def _resample_stim_channels(stim_data, up, down):
     See the decimate_stimch function in MNE/mne_browse_raw/save.c
     """
     stim_data = np.atleast_2d(stim_data)
-    n_stim_channels, n_samples = stim_data.shape
+    sample_picks = _stim_sample_picks(stim_data.shape[1], up, down)
+    return _resample_stim_windows(stim_data, sample_picks, stim_data.shape[1])
+
 
+def _stim_sample_picks(n_samples, up, down):
+    """Get the first samples of the windows used to resample stim channels."""
     ratio = float(up) / down
     resampled_n_samples = int(round(n_samples * ratio))
-
-    stim_resampled = np.zeros((n_stim_channels, resampled_n_samples))
-
     # Figure out which points in old data to subsample protect against
     # out-of-bounds, which can happen (having one sample more than
     # expected) due to padding
-    sample_picks = np.minimum(
+    return np.minimum(
         (np.arange(resampled_n_samples) / ratio).astype(int), n_samples - 1
     )
 
+
+def _resample_stim_windows(stim_data, sample_picks, stop):
+    """Resample stim channels given the first sample of each window."""
+    stim_resampled = np.zeros((len(stim_data), len(sample_picks)))
+
     # Create windows starting from sample_picks[i], ending at sample_picks[i+1]
-    windows = zip(sample_picks, np.r_[sample_picks[1:], n_samples])
+    windows = zip(sample_picks, np.r_[sample_picks[1:], stop])
 
     # Use the first non-zero value in each window
     for window_i, window in enumerate(windows):
@@ -2050,6 +2451,182 @@ def _resample_stim_channels(stim_data, up, down):
     return stim_resampled
 
 
+@verbose
+def decimate_data(
+    data,
+    sfreq,
+    h_freq,
+    decim,
+    h_trans_bandwidth="auto",
+    phase="zero",
+    fir_window="hamming",
+    pad="reflect_limited",
+    *,
+    verbose=None,
+):
+    """Low-pass filter and decimate data using a multirate filter cascade.
+
+    Parameters
+    ----------
+    data : ndarray, shape (..., n_times)
+        The data to filter and decimate.
+    sfreq : float
+        The sample frequency in Hz.
+    h_freq : float
+        The upper pass-band edge in Hz. The stop-band edge
+        ``h_freq + h_trans_bandwidth`` must not exceed the Nyquist frequency of
+        the decimated data (``sfreq / decim / 2``).
+    decim : int
+        The decimation factor.
+    h_trans_bandwidth : float | str
+        Width of the transition band at the high cut-off frequency in Hz.
+        Can be "auto" (default) to use a value based on ``h_freq``::
+
+            min(max(h_freq * 0.25, 2.), sfreq / decim / 2. - h_freq)
+
+    phase : str
+        If ``'zero'`` (default), the delay of each linear-phase stage is
+        compensated for, which makes the cascade zero-phase (non-causal). If
+        ``'minimum'``, minimum-phase stages are used, which makes the cascade
+        causal.
+    %(fir_window)s
+    %(pad_fir)s
+        The default is ``'reflect_limited'``.
+    %(verbose)s
+
+    Returns
+    -------
+    data : ndarray, shape (..., n_decim)
+        The filtered and decimated data, with ``n_decim`` equal to
+        ``len(range(0, n_times, decim))``. The sample frequency of the
+        result is ``sfreq / decim``.
+
+    See Also
+    --------
+    filter_data
+    resample
+    mne.Epochs.decimate
+
+    Notes
+    -----
+    Low-pass filtering far below the Nyquist frequency followed by decimation
+    (e.g., ``raw.filter(None, 40).resample(200)``) requires long FIR filters
+    when done at the original sample frequency. Here ``decim`` is instead
+    split into its prime factors and the data are decimated in stages (the
+    factors of 2 first). Each stage keeps only every ``factor``-th output of
+    its filter (polyphase decimation, see :func:`scipy.signal.upfirdn`), so
+    outputs that are discarded are never computed:
+
+    - Intermediate stages use anti-aliasing filters that pass everything up to
+      the final stop-band edge and stop at the frequencies that would alias
+      onto it. For factors of 2, these are half-band filters.
+    - The final stage applies the requested low-pass filter at the
+      lowest sample frequency possible, where it is shortest.
+
+    The number of taps, the stop-band attenuation (as computed from the
+    filter kernel), and the number of multiplications needed per input
+    sample are logged for each stage. The samples kept are the same as those
+    of ``data[..., ::decim]``.
+
+    .. versionadded:: 1.13
+    """
+    data = _check_filterable(data)
+    sfreq = float(sfreq)
+    decim = _ensure_int(decim, "decim")
+    if decim < 1:
+        raise ValueError(f"decim must be at least 1, got {decim}")
+    _validate_type(phase, "str", "phase")
+    _check_option("phase", phase, ("zero", "minimum"))
+    _validate_type(fir_window, "str", "fir_window")
+    _check_option("fir_window", fir_window, _known_fir_windows)
+    final_nyq = sfreq / decim / 2.0
+    h_freq = float(h_freq)
+    if not 0 < h_freq < final_nyq:
+        raise ValueError(
+            f"h_freq must be between 0 and the Nyquist frequency of the decimated "
+            f"data ({final_nyq} Hz), got {h_freq}"
+        )
+    if isinstance(h_trans_bandwidth, str):
+        _check_option("h_trans_bandwidth", h_trans_bandwidth, ("auto",))
+        h_trans_bandwidth = min(max(0.25 * h_freq, 2.0), final_nyq - h_freq)
+    h_trans_bandwidth = float(h_trans_bandwidth)
+    if h_trans_bandwidth <= 0:
+        raise ValueError(f"h_trans_bandwidth must be positive, got {h_trans_bandwidth}")
+    h_stop = h_freq + h_trans_bandwidth
+    if h_stop > final_nyq:
+        raise ValueError(
+            f"Effective stop frequency ({h_stop} Hz) is too high (maximum based on "
+            f"the Nyquist frequency of the decimated data is {final_nyq} Hz)"
+        )
+    factors = _prime_factors(decim) or [1]
+    logger.info(
+        f"Multirate low-pass filtering at {h_freq:0.2f} Hz (stop: {h_stop:0.2f} "
+        f"Hz) and decimation by {decim} in {len(factors)} stage{_pl(factors)}:"
+    )
+    rate = sfreq
+    n_mult = 0.0
+    for si, factor in enumerate(factors):
+        if si == len(factors) - 1:  # the requested filter
+            pass_freq, stop_freq = h_freq, h_stop
+        else:  # anti-aliasing for the stages that follow
+            pass_freq, stop_freq = h_stop, rate / factor - h_stop
+        N = int(round(_length_factors[fir_window] * rate / (stop_freq - pass_freq)))
+        N += 1 - N % 2
+        nyq = rate / 2.0
+        freq = (0.0, pass_freq / nyq, stop_freq / nyq, 1.0)
+        if stop_freq == nyq:
+            freq, gain = freq[:-1], (1.0, 1.0, 0.0)
+        else:
+            gain = (1.0, 1.0, 0.0, 0.0)
+        h, att_db, att_freq = _design_fir(
+            rate, freq, gain, N, phase, fir_window, "firwin"
+        )
+        n_mult += N * (rate / factor) / sfreq
+        logger.info(
+            f"- Stage {si + 1}: {rate:0.2f} -> {rate / factor:0.2f} Hz, {N} taps, "
+            f"{att_db:0.2f} dB attenuation at {att_freq * nyq:0.2f} Hz"
+        )
+        if att_db < 20:
+            warn(
+                f"Attenuation at stop frequency {att_freq * nyq:0.2f} Hz is only "
+                f"{att_db:0.2f} dB in decimation stage {si + 1}."
+            )
+        data = _decimate_stage(data, h, factor, phase, pad)
+        rate /= factor
+    n_single = int(round(_length_factors[fir_window] * sfreq / h_trans_bandwidth))
+    logger.info(
+        f"- {n_mult:0.1f} multiplications per input sample (single-rate FIR "
+        f"filter: {n_single + 1 - n_single % 2} taps)"
+    )
+    return data
+
+
+def _prime_factors(n):
+    """Get the prime factors of n in ascending order."""
+    factors = list()
+    factor = 2
+    while factor * factor <= n:
+        while n % factor == 0:
+            factors.append(factor)
+            n //= factor
+        factor += 1
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def _decimate_stage(x, h, down, phase, pad):
+    """Filter and decimate the last axis of x with polyphase filtering."""
+    n_times, N = x.shape[-1], len(h)
+    n_out = (n_times - 1) // down + 1
+    delay = (N - 1) // 2 if phase == "zero" else 0
+    # Pad so that output k is centered (or ends) at input sample k * down
+    offset = -(-(N - 1) // down)
+    n_pad = (offset * down - delay, max((n_out - 1) * down + delay - n_times + 1, 0))
+    x = _smart_pad(x, np.array(n_pad), pad)
+    return signal.upfirdn(h, x, down=down, axis=-1)[..., offset : offset + n_out]
+
+
 def detrend(x, order=1, axis=-1):
     """Detrend the array x.
 
@@ -2685,7 +3262,14 @@ class FilterMixin:
 
     @verbose
     def apply_hilbert(
-        self, picks=None, envelope=False, n_jobs=None, n_fft="auto", *, verbose=None
+        self,
+        picks=None,
+        envelope=False,
+        n_jobs=None,
+        n_fft="auto",
+        *,
+        dtype="complex128",
+        verbose=None,
     ):
         """Compute analytic signal or envelope for a subset of channels/vertices.
 
@@ -2695,12 +3279,13 @@ class FilterMixin:
         envelope : bool
             Compute the envelope signal of each channel/vertex. Default False.
             See Notes.
-        %(n_jobs)s
+        %(n_jobs_hilbert)s
         n_fft : int | None | str
             Points to use in the FFT for Hilbert transformation. The signal
             will be padded with zeros before computing Hilbert, then cut back
             to original length. If None, n == self.n_times. If 'auto',
             the next highest fast FFT length will be use.
+        %(dtype_hilbert)s
         %(verbose)s
 
         Returns
@@ -2728,8 +3313,9 @@ class FilterMixin:
 
         If envelope=False, more memory is required since the original raw data
         as well as the analytic signal have temporarily to be stored in memory.
-        If n_jobs > 1, more memory is required as ``len(picks) * n_times``
-        additional time points need to be temporarily stored in memory.
+        Using ``dtype='complex64'`` halves the memory needed for the analytic
+        signal. The channels/vertices are transformed in blocks, so only a few
+        of them need additional temporary memory at a time.
 
         Also note that the ``n_fft`` parameter will allow you to pad the signal
         with zeros before performing the Hilbert transform. This padding
@@ -2773,27 +3359,14 @@ class FilterMixin:
                 f"n_fft ({n_fft}) must be at least the number of time points ("
                 f"{len(self.times)})"
             )
-        dtype = None if envelope else np.complex128
-        args, kwargs = (), dict(n_fft=n_fft, envelope=envelope)
+        _check_option("dtype", dtype, ("complex128", "complex64"))
+        dtype = None if envelope else np.dtype(dtype)
 
         data_in = self._data
         if dtype is not None and dtype != self._data.dtype:
             self._data = self._data.astype(dtype)
-
-        parallel, p_fun, n_jobs = parallel_func(_check_fun, n_jobs)
-        if n_jobs == 1:
-            # modify data inplace to save memory
-            for idx in picks:
-                self._data[..., idx, :] = _check_fun(
-                    _my_hilbert, data_in[..., idx, :], *args, **kwargs
-                )
-        else:
-            # use parallel function
-            data_picks_new = parallel(
-                p_fun(_my_hilbert, data_in[..., p, :], *args, **kwargs) for p in picks
-            )
-            for pp, p in enumerate(picks):
-                self._data[..., p, :] = data_picks_new[pp]
+        # modify data inplace (in blocks of picks) to save memory
+        _hilbert_picks(data_in, self._data, picks, n_fft, envelope, n_jobs)
         return self
 
 
@@ -2808,32 +3381,50 @@ def _check_fun(fun, d, *args, **kwargs):
     return d
 
 
-def _my_hilbert(x, n_fft=None, envelope=False):
+def _my_hilbert(x, n_fft=None, envelope=False, *, workers=None):
     """Compute Hilbert transform of signals w/ zero padding.
 
     Parameters
     ----------
-    x : array, shape (n_times)
-        The signal to convert
+    x : array, shape (..., n_times)
+        The signal(s) to convert
     n_fft : int
         Size of the FFT to perform, must be at least ``len(x)``.
         The signal will be cut back to original length.
     envelope : bool
         Whether to compute amplitude of the hilbert transform in order
         to return the signal envelope.
+    workers : int | None
+        The number of threads to use for the FFTs.
 
     Returns
     -------
-    out : array, shape (n_times)
+    out : array, shape (..., n_times)
         The hilbert transform of the signal, or the envelope.
     """
     n_x = x.shape[-1]
-    out = signal.hilbert(x, N=n_fft, axis=-1)[..., :n_x]
+    n_fft = n_x if n_fft is None else n_fft
+    # Like scipy.signal.hilbert, but starting from the one-sided spectrum: the
+    # positive frequencies are doubled, and the negative ones are the zeros
+    # that the inverse FFT pads with
+    x_fft = fft.rfft(x, n_fft, axis=-1, workers=workers)
+    x_fft[..., 1 : (n_fft + 1) // 2] *= 2
+    out = fft.ifft(x_fft, n_fft, axis=-1, workers=workers)[..., :n_x]
     if envelope:
         out = np.abs(out)
     return out
 
 
+def _hilbert_picks(x, out, picks, n_fft, envelope, n_jobs):
+    """Transform picks (along the second-to-last axis) of x into out in blocks."""
+    workers = _get_fft_workers() if n_jobs is None else _check_n_jobs(n_jobs)
+    n_per_pick = n_fft * (x.size // max(x.shape[-1] * x.shape[-2], 1))
+    for chunk in _picks_chunks(picks, n_per_pick):
+        out[..., chunk, :] = _my_hilbert(
+            x[..., chunk, :], n_fft, envelope, workers=workers
+        )
+
+
 @verbose
 def design_mne_c_filter(
     sfreq,
@@ -2962,6 +3553,315 @@ def _filt_update_info(info, update_info, l_freq, h_freq):
                 info["highpass"] = float(l_freq)
 
 
+def _filter_raw_stream(
+    raw,
+    l_freq,
+    h_freq,
+    picks,
+    filter_length,
+    l_trans_bandwidth,
+    h_trans_bandwidth,
+    n_jobs,
+    method,
+    iir_params,
+    phase,
+    fir_window,
+    fir_design,
+    pad,
+    skip_by_annotation,
+    memmap,
+):
+    """Filter raw data that are not preloaded while reading them in chunks.
+
+    Each contiguous segment is read in chunks extended on both sides by the
+    length of the filter response, so that chunk boundaries do not affect the
+    output. Causal IIR filters instead carry their state from one chunk to the
+    next. Zero-phase IIR filters do the same for the forward pass (including the
+    padding that filtfilt adds), whose output is stored, and then for the
+    backward pass over the stored output in reverse. The filtered data are
+    preloaded into memory (or ``memmap``).
+    """
+    from .annotations import _annotations_starts_stops
+    from .io.base import _allocate_data, _iter_raw_segments
+
+    sfreq = raw.info["sfreq"]
+    onsets, ends = _annotations_starts_stops(raw, skip_by_annotation, invert=True)
+    logger.info(
+        "Filtering raw data in %d contiguous segment%s while reading them",
+        len(onsets),
+        _pl(onsets),
+    )
+    # the filter length is checked against the longest segment (without
+    # allocating it)
+    longest = np.broadcast_to(0.0, (1, max(ends - onsets, default=1)))
+    iir_params, method = _check_method(method, iir_params)
+    filt = create_filter(
+        longest,
+        sfreq,
+        l_freq,
+        h_freq,
+        filter_length,
+        l_trans_bandwidth,
+        h_trans_bandwidth,
+        method,
+        iir_params,
+        phase,
+        fir_window,
+        fir_design,
+    )
+    forward = method == "iir" and phase not in ("zero", "zero-double")
+    margin = 0
+    n_chunk = int(round(10 * sfreq))
+    if method == "fir":
+        margin = len(filt) * (2 if phase == "zero-double" else 1)
+        n_chunk = max(4 * margin, n_chunk)
+    elif not forward:  # the first chunk holds the samples that the padding uses
+        n_chunk = max(filt["padlen"] + 1, n_chunk)
+    autotune = method == "fir" and _use_fir_autotune()  # read once for all chunks
+    if method == "iir":
+        _check_coefficients(filt["sos"] if "sos" in filt else (filt["b"], filt["a"]))
+        iir_step, iir_zi = _iir_step_funs(filt, len(picks))
+    # (read start, read stop, write start, write stop, segment onset, segment end)
+    reads = list()
+    last = 0
+    for onset, end in zip(list(onsets) + [raw.n_times], list(ends) + [raw.n_times]):
+        # samples outside of the segments are copied as they are
+        for start in range(last, onset, n_chunk):
+            stop = min(start + n_chunk, onset)
+            reads.append((start, stop, start, stop, None, None))
+        for start in range(onset, end, n_chunk):
+            stop = min(start + n_chunk, end)
+            read_start, read_stop = max(start - margin, onset), min(stop + margin, end)
+            reads.append((read_start, read_stop, start, stop, onset, end))
+        last = end
+    data = _allocate_data(memmap, (raw.info["nchan"], raw.n_times), raw._dtype)
+    chunks = _iter_raw_segments(
+        raw, slice(None), [r[0] for r in reads], [r[1] for r in reads], prefetch=2
+    )
+    zi = None
+    for (read_start, _, start, stop, onset, end), x in zip(reads, chunks):
+        if onset is None:
+            pass
+        elif method == "fir":
+            _overlap_add_filter(
+                x, filt, None, phase, picks, n_jobs, False, pad, autotune
+            )
+        elif forward:
+            if start == onset:
+                zi = iir_zi(0.0)
+            x[picks], zi = iir_step(x[picks], zi)
+        else:  # forward pass of filtfilt, with the padding of _iir_filter
+            if start == onset:
+                n_pad = min(filt["padlen"], end - onset - 1)
+                x_pad = _smart_pad(x[picks, : n_pad + 1], (n_pad, 0))[:, :n_pad]
+                zi = iir_zi(x_pad[:, 0] if n_pad else x[picks, 0])
+                if n_pad:
+                    _, zi = iir_step(x_pad, zi)
+                tail = x[picks, :0]
+            tail = np.concatenate([tail, x[picks]], axis=-1)[:, -(n_pad + 1) :]
+            x[picks], zi = iir_step(x[picks], zi)
+        data[:, start:stop] = x[:, start - read_start : stop - read_start]
+        if onset is not None and method == "iir" and not forward and stop == end:
+            _iir_backward_pass(
+                data, picks, onset, end, n_pad, tail, zi, iir_step, iir_zi, n_chunk
+            )
+    raw._data = data
+    raw.preload = True
+    raw._comp = None  # already applied while reading
+    raw._read_cache = None
+    raw.close()
+
+
+def _iir_step_funs(filt, n_rows):
+    """Get functions to run an IIR filter on chunks and to set its state.
+
+    The initial state for a given first sample of each row is the one that
+    filtfilt and sosfiltfilt use.
+    """
+    if "sos" in filt:
+        sos = filt["sos"]
+        zi = signal.sosfilt_zi(sos)[:, np.newaxis]
+
+        def step(x, zi):
+            return signal.sosfilt(sos, x, axis=-1, zi=zi)
+
+    else:
+        b, a = np.atleast_1d(filt["b"]), np.atleast_1d(filt["a"])
+        zi = signal.lfilter_zi(b, a)[np.newaxis]
+
+        def step(x, zi):
+            return signal.lfilter(b, a, x, axis=-1, zi=zi)
+
+    def get_zi(x0):
+        return zi * np.broadcast_to(x0, (n_rows,))[:, np.newaxis]
+
+    return step, get_zi
+
+
+def _iir_backward_pass(data, picks, onset, end, n_pad, tail, zi, step, get_zi, n):
+    """Run the backward pass of filtfilt over a segment of data in place.
+
+    ``data[picks, onset:end]`` holds the forward pass, ``tail`` the last input
+    samples (for the padding at the end) and ``zi`` the state after the segment.
+    """
+    if n_pad:  # the forward pass continues through the padding at the end
+        x_pad = _smart_pad(tail, (0, n_pad))[:, tail.shape[1] :]
+        y_pad, _ = step(x_pad, zi)
+        zi = get_zi(y_pad[:, -1])
+        _, zi = step(y_pad[:, ::-1], zi)
+    else:
+        zi = get_zi(data[picks, end - 1])
+    for stop in range(end, onset, -n):
+        start = max(stop - n, onset)
+        y, zi = step(data[picks, start:stop][:, ::-1], zi)
+        data[picks, start:stop] = y[:, ::-1]
+
+
+def _hilbert_raw_stream(raw, picks, *, envelope, n_fft, dtype, n_jobs, memmap):
+    """Transform raw data that are not preloaded while reading them in chunks.
+
+    The chunks have ``n_fft`` samples and overlap by half of that (overlap-save):
+    of each chunk only the central half is kept (or more at the ends of the
+    data), so that each output sample is at least ``n_fft // 4`` samples away
+    from the boundaries of the chunk it was computed from. The transformed data
+    are preloaded into memory (or ``memmap``).
+    """
+    from .io.base import _allocate_data, _iter_raw_segments
+
+    n_times = raw.n_times
+    margin = n_fft // 4
+    step = max(n_fft - 2 * margin, 1)
+    reads = list()  # (read start, read stop, write start, write stop)
+    for start in range(0, n_times, step):
+        stop = min(start + step, n_times)
+        read_start = max(min(start - margin, n_times - n_fft), 0)
+        reads.append((read_start, min(read_start + n_fft, n_times), start, stop))
+    kind = "envelope" if envelope else "analytic signal"
+    logger.info(
+        f"Computing the {kind} in {len(reads)} chunk{_pl(reads)} of "
+        f"{n_fft / raw.info['sfreq']:0.1f} s while reading the data"
+    )
+    out_dtype = raw._dtype if envelope else dtype
+    data = _allocate_data(memmap, (raw.info["nchan"], n_times), out_dtype)
+
+    def process(x):
+        out = x if envelope else x.astype(out_dtype)
+        _hilbert_picks(x, out, picks, n_fft, envelope, n_jobs)
+        return out
+
+    chunks = _iter_raw_segments(
+        raw,
+        slice(None),
+        [r[0] for r in reads],
+        [r[1] for r in reads],
+        prefetch=2,
+        process=process,
+    )
+    for (read_start, _, start, stop), x in zip(reads, chunks):
+        data[:, start:stop] = x[:, start - read_start : stop - read_start]
+    raw._data = data
+    raw.preload = True
+    raw._comp = None  # already applied while reading
+    raw._read_cache = None
+    raw.close()
+
+
+# padding modes of upfirdn (used by resample_poly) that only depend on the
+# samples close to the edge, so that resampling in chunks is exact
+_POLYPHASE_LOCAL_PADS = (
+    "constant",
+    "edge",
+    "smooth",
+    "symmetric",
+    "reflect",
+    "antisymmetric",
+    "antireflect",
+)
+
+
+def _resample_raw_stream(raw, sfreq, *, window, pad, stim_picks, memmap):
+    """Resample raw data that are not preloaded while reading them in chunks.
+
+    The output of each raw part is computed in chunks with
+    :func:`scipy.signal.upfirdn` using the filter of
+    :func:`scipy.signal.resample_poly`, with each chunk read starting at a
+    multiple of ``down`` samples (so that the polyphase filter is in the same
+    phase) and extended by the filter length. The result is thus identical to
+    resampling the preloaded data. Stim channels are resampled as in
+    :func:`_resample_stim_channels`. The resampled data are returned in memory
+    (or ``memmap``).
+    """
+    from .io.base import _allocate_data, _iter_raw_segments
+
+    picks = np.setdiff1d(np.arange(raw.info["nchan"]), stim_picks)
+    n_news = [
+        _resamp_ratio_len(sfreq, raw.info["sfreq"], n)[1] for n in raw._raw_lengths
+    ]
+    data = _allocate_data(memmap, (raw.info["nchan"], sum(n_news)), raw._dtype)
+    n_chunk = max(int(round(10 * sfreq)), 1)
+    reads = list()  # (read start, read stop, out start, out stop, filt, stim)
+    offset = offset_new = 0
+    for n_in, n_out in zip(raw._raw_lengths, n_news):
+        up, down, h = _prep_polyphase(n_out / n_in, n_in, n_out, window)
+        # the filter is zero-padded as in resample_poly
+        half_len = (len(h) - 1) // 2
+        n_pre_pad = down - half_len % down
+        n_pre_remove = (half_len + n_pre_pad) // down
+        h = np.concatenate([np.zeros(n_pre_pad), h * up])
+        sample_picks = _stim_sample_picks(n_in, n_out, n_in)
+        for start in range(0, n_out, n_chunk):
+            stop = min(start + n_chunk, n_out)
+            m_start, m_stop = start + n_pre_remove, stop + n_pre_remove
+            # the inputs the outputs depend on, starting at a multiple of down
+            filt_start = max(-(-(m_start * down - len(h) + 1) // up), 0)
+            filt_start = filt_start // down * down
+            filt_stop = min((m_stop - 1) * down // up + 1, n_in)
+            stim_start = sample_picks[start]
+            stim_stop = sample_picks[stop] if stop < n_out else n_in
+            read_start = min(filt_start, stim_start)
+            read_stop = max(filt_stop, stim_stop)
+            filt = (
+                slice(filt_start - read_start, filt_stop - read_start),
+                h,
+                up,
+                down,
+                m_start - filt_start // down * up,
+            )
+            stim = (
+                slice(stim_start - read_start, stim_stop - read_start),
+                sample_picks[start:stop] - stim_start,
+            )
+            reads.append(
+                (
+                    offset + read_start,
+                    offset + read_stop,
+                    offset_new + start,
+                    offset_new + stop,
+                    filt,
+                    stim,
+                )
+            )
+        offset += n_in
+        offset_new += n_out
+    logger.info(
+        "Resampling raw data in %d chunk%s while reading them", len(reads), _pl(reads)
+    )
+    chunks = _iter_raw_segments(
+        raw, slice(None), [r[0] for r in reads], [r[1] for r in reads], prefetch=2
+    )
+    for (_, _, start, stop, filt, stim), x in zip(reads, chunks):
+        sl, h, up, down, shift = filt
+        y = signal.upfirdn(h, x[picks, sl], up, down, axis=-1, mode=pad)
+        data[picks, start:stop] = y[:, shift : shift + stop - start]
+        if len(stim_picks):
+            sl, sample_picks = stim
+            x = x[stim_picks, sl]
+            data[stim_picks, start:stop] = _resample_stim_windows(
+                x, sample_picks, x.shape[1]
+            )
+    return data
+
+
 def _iir_pad_apply_unpad(x, *, func, padlen, padtype, **kwargs):
     # All rows are padded and filtered in a single call rather than one at a
     # time: SciPy loops over them in C, whereas looping here costs a GIL
@@ -4,19 +4,24 @@
 
 import os
 import shutil
-from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import partial
 from inspect import getfullargspec
+from io import BytesIO
 from pathlib import Path
+from threading import Lock
 from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 
 from .._fiff.compensator import make_compensator, set_current_comp
+from .._fiff.compression import _check_compression, _compress_buffer
 from .._fiff.constants import FIFF
 from .._fiff.meas_info import (
     ContainsMixin,
@@ -34,13 +39,14 @@ from .._fiff.pick import (
     pick_types,
 )
 from .._fiff.proj import ProjMixin, _proj_equal, activate_proj, setup_proj
-from .._fiff.utils import _check_orig_units, _make_split_fnames
+from .._fiff.utils import _check_orig_units, _make_split_fnames, _mult_cal_one
 from .._fiff.write import (
     _NEXT_FILE_BUFFER,
     _get_split_size,
     end_block,
     start_and_end_file,
     start_block,
+    write_bytes,
     write_complex64,
     write_complex128,
     write_dau_pack16,
@@ -62,16 +68,25 @@ from ..channels.channels import InterpolationMixin, ReferenceMixin, UpdateChanne
 from ..defaults import _handle_default
 from ..event import concatenate_events, find_events
 from ..filter import (
+    _POLYPHASE_LOCAL_PADS,
     FilterMixin,
     _check_fun,
+    _check_notch_widths,
     _check_resamp_noop,
+    _filt_check_picks,
+    _filt_update_info,
+    _filter_raw_stream,
+    _hilbert_raw_stream,
+    _notch_stop_bands,
     _resamp_ratio_len,
+    _resample_raw_stream,
     _resample_stim_channels,
+    next_fast_len,
     notch_filter,
     resample,
 )
 from ..html_templates import _get_html_template
-from ..parallel import parallel_func
+from ..parallel import _check_n_jobs, parallel_func
 from ..time_frequency.spectrum import Spectrum, SpectrumMixin, _validate_method
 from ..time_frequency.tfr import RawTFR
 from ..utils import (
@@ -86,6 +101,7 @@ from ..utils import (
     _check_preload,
     _check_time_format,
     _convert_times,
+    _ensure_int,
     _file_like,
     _get_argvalues,
     _get_stim_channel,
@@ -95,12 +111,12 @@ from ..utils import (
     _time_mask,
     _validate_type,
     check_fname,
-    copy_doc,
     copy_function_doc_to_method_doc,
     fill_doc,
     logger,
     repr_html,
     sizeof_fmt,
+    use_log_level,
     verbose,
     warn,
 )
@@ -266,6 +282,7 @@ class BaseRaw(
         for r in self._raw_extras:
             r["orig_nchan"] = info["nchan"]
         self._read_picks = [np.arange(info["nchan"]) for _ in range(len(raw_extras))]
+        self._read_cache = None
         # deal with compensation (only relevant for CTF data, either CTF
         # reader or MNE-C converted CTF->FIF files)
         self._read_comp_grade = self.compensation_grade  # read property
@@ -390,7 +407,14 @@ class BaseRaw(
 
     @verbose
     def _read_segment(
-        self, start=0, stop=None, sel=None, data_buffer=None, *, verbose=None
+        self,
+        start=0,
+        stop=None,
+        sel=None,
+        data_buffer=None,
+        *,
+        n_jobs=None,
+        verbose=None,
     ):
         """Read a chunk of raw data.
 
@@ -410,6 +434,7 @@ class BaseRaw(
             to store the data.
         projector : array
             SSP operator to apply to the data.
+        %(n_jobs_read)s
         %(verbose)s
 
         Returns
@@ -482,6 +507,7 @@ class BaseRaw(
         assert (mult is None) ^ (cals is None)  # xor
 
         # read from necessary files
+        reads = list()
         offset = 0
         for fi in np.nonzero(files_used)[0]:
             start_file = self._first_samps[fi]
@@ -497,21 +523,111 @@ class BaseRaw(
             if start_file < self._first_samps[fi] or stop_file < start_file:
                 raise ValueError("Bad array indexing, could be a bug")
             n_read = stop_file - start_file
-            this_sl = slice(offset, offset + n_read)
             # reindex back to original file
             orig_idx = _convert_slice(self._read_picks[fi][need_idx])
-            _ReadSegmentFileProtector(self)._read_segment_file(
-                data[:, this_sl],
+            reads.append((offset, orig_idx, fi, int(start_file), int(stop_file)))
+            offset += n_read
+        n_jobs = _check_n_jobs(1 if n_jobs is None else n_jobs)
+        if n_jobs > 1:
+            # the data buffer size is a natural granularity for most readers
+            block = max(int(round(self.buffer_size_sec * self.info["sfreq"])), 1)
+            reads = _split_reads(reads, self._first_samps, stop - start, n_jobs, block)
+        reader = _ReadSegmentFileProtector(self)
+        read_segment_file = reader._read_segment_file
+        if self._read_cache is not None:
+            read_segment_file = partial(self._read_segment_file_cached, reader)
+
+        def _read_one(offset, orig_idx, fi, start_file, stop_file):
+            read_segment_file(
+                data[:, offset : offset + stop_file - start_file],
                 orig_idx,
                 fi,
-                int(start_file),
-                int(stop_file),
+                start_file,
+                stop_file,
                 cals,
                 mult,
             )
-            offset += n_read
+
+        if n_jobs == 1 or len(reads) == 1:
+            for read in reads:
+                _read_one(*read)
+        else:
+            # file reading releases the GIL, so threads suffice, and they write
+            # directly into disjoint parts of the same output array
+            logger.debug(f"Reading {len(reads)} segments using {n_jobs} threads")
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                for future in [executor.submit(_read_one, *read) for read in reads]:
+                    future.result()
         return data
 
+    def _read_segment_file_cached(self, reader, data, idx, fi, start, stop, cals, mult):
+        """Read a segment of data from a file through the read cache."""
+        cache = self._read_cache
+        fname = self.filenames[fi]
+        if fname is None:  # nothing to key on
+            return reader._read_segment_file(data, idx, fi, start, stop, cals, mult)
+        # blocks hold all channels currently read from the file, before any
+        # calibration, compensation or projection is applied
+        chs = np.unique(self._read_picks[fi])
+        want = np.arange(self._raw_extras[fi]["orig_nchan"])[idx]
+        n_block = max(int(round(self.buffer_size_sec * self.info["sfreq"])), 1)
+        first, last = self._first_samps[fi], self._last_samps[fi] + 1
+        blocks, missing = dict(), list()
+        for bi in range(start // n_block, (stop - 1) // n_block + 1):
+            block = cache.get((str(fname), bi))
+            this_start = max(bi * n_block, start)
+            this_stop = min((bi + 1) * n_block, stop)
+            if (
+                block is None
+                or block[1] > this_start
+                or block[2] < this_stop
+                or not np.isin(want, block[0]).all()
+            ):
+                missing.append(bi)
+            else:
+                blocks[bi] = block
+        # read consecutive missing blocks at once
+        for run in np.split(missing, np.where(np.diff(missing) > 1)[0] + 1):
+            if len(run) == 0:
+                continue
+            run_start = max(run[0] * n_block, first)
+            run_stop = min((run[-1] + 1) * n_block, last)
+            buf = np.empty((len(chs), run_stop - run_start), self._dtype)
+            reader._read_segment_file(
+                buf,
+                _convert_slice(chs),
+                fi,
+                run_start,
+                run_stop,
+                np.ones((len(chs), 1)),
+                None,
+            )
+            for bi in run:
+                block_start = max(bi * n_block, first)
+                block_stop = min((bi + 1) * n_block, last)
+                block = (
+                    chs,
+                    block_start,
+                    block_stop,
+                    buf[:, block_start - run_start : block_stop - run_start].copy(),
+                )
+                cache.put((str(fname), bi), block)
+                blocks[bi] = block
+        for bi, (block_chs, block_start, _, block_data) in sorted(blocks.items()):
+            this_start = max(bi * n_block, start)
+            this_stop = min((bi + 1) * n_block, stop)
+            one = block_data[
+                np.searchsorted(block_chs, want),
+                this_start - block_start : this_stop - block_start,
+            ]
+            _mult_cal_one(
+                data[:, this_start - start : this_stop - start],
+                one,
+                slice(None),
+                cals,
+                mult,
+            )
+
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file.
 
@@ -596,6 +712,7 @@ class BaseRaw(
         self,
         *,
         memmap: Path | str | None = None,
+        n_jobs: int | None = None,
         verbose: bool | str | int | None = None,
     ) -> Self:
         """Load raw data.
@@ -606,6 +723,9 @@ class BaseRaw(
             If not ``None``, preload data into a memory-mapped file at this
             path. If ``None`` (default), preload data into RAM.
 
+            .. versionadded:: 1.13
+        %(n_jobs_read)s
+
             .. versionadded:: 1.13
         %(verbose)s
 
@@ -624,10 +744,78 @@ class BaseRaw(
         if not self.preload:
             if memmap is not None:
                 _validate_type(memmap, "path-like", "memmap")
-            self._preload_data(memmap if memmap is not None else True)
+            self._preload_data(memmap if memmap is not None else True, n_jobs=n_jobs)
         return self
 
-    def _preload_data(self, preload):
+    def set_read_cache(self, max_size: int | str | None = "100MB") -> Self:
+        """Keep recently read blocks of data in memory.
+
+        When data are not preloaded, each access (e.g., ``raw[picks, start:stop]``,
+        creating epochs or plotting) reads from disk. With a read cache, blocks of
+        ``buffer_size_sec`` seconds of all channels are kept in memory and
+        reused by subsequent reads of overlapping time windows, evicting the
+        least recently used blocks once ``max_size`` is reached.
+
+        Parameters
+        ----------
+        max_size : int | str | None
+            Maximum size of the cache in bytes, or a string ending in ``"MB"``
+            or ``"GB"``. ``None`` or ``0`` disables (and empties) the cache.
+
+        Returns
+        -------
+        raw : instance of Raw
+            The raw object, modified in place.
+
+        See Also
+        --------
+        read_cache_info
+
+        Notes
+        -----
+        The cached blocks contain the data as stored in the file, so projectors,
+        compensation and channel picking can change without invalidating them.
+        Copies of the raw object share its cache.
+
+        .. versionadded:: 1.13
+        """
+        _validate_type(max_size, (int, str, None), "max_size")
+        if isinstance(max_size, str):
+            exp = dict(MB=20, GB=30).get(max_size[-2:], None)
+            if exp is None:
+                raise ValueError('max_size has to end with either "MB" or "GB"')
+            max_size = int(float(max_size[:-2]) * 2**exp)
+        if not max_size:
+            self._read_cache = None
+        elif self._read_cache is None:
+            self._read_cache = _ReadCache(max_size)
+        else:
+            self._read_cache.resize(max_size)
+        return self
+
+    def read_cache_info(self) -> dict[str, int] | None:
+        """Get statistics of the read cache.
+
+        Returns
+        -------
+        info : dict | None
+            The number of cache ``"hits"`` and ``"misses"``, the number of
+            cached ``"blocks"``, and the current and maximum ``"size"`` and
+            ``"max_size"`` in bytes. ``None`` if no read cache is used.
+
+        See Also
+        --------
+        set_read_cache
+
+        Notes
+        -----
+        .. versionadded:: 1.13
+        """
+        if self._read_cache is None:
+            return None
+        return self._read_cache.info()
+
+    def _preload_data(self, preload, *, n_jobs=None):
         """Actually preload the data."""
         data_buffer = preload
         if isinstance(preload, bool | np.bool_) and not preload:
@@ -636,10 +824,11 @@ class BaseRaw(
         logger.info(
             f"Reading 0 ... {len(t) - 1}  =  {0.0:9.3f} ... {t[-1]:9.3f} secs..."
         )
-        self._data = self._read_segment(data_buffer=data_buffer)
+        self._data = self._read_segment(data_buffer=data_buffer, n_jobs=n_jobs)
         assert len(self._data) == self.info["nchan"]
         self.preload = True
         self._comp = None  # no longer needed
+        self._read_cache = None
         self.close()
 
     @property
@@ -916,13 +1105,13 @@ class BaseRaw(
         """  # noqa: E501
         return self._getitem(item)
 
-    def _getitem(self, item, return_times=True):
+    def _getitem(self, item, return_times=True, *, n_jobs=None):
         sel, start, stop = self._parse_get_set_params(item)
         if self.preload:
             assert self._data is not None
             data = self._data[sel, start:stop]
         else:
-            data = self._read_segment(start=start, stop=stop, sel=sel)
+            data = self._read_segment(start=start, stop=stop, sel=sel, n_jobs=n_jobs)
 
         if return_times:
             # Rather than compute the entire thing just compute the subset
@@ -954,6 +1143,7 @@ class BaseRaw(
         *,
         tmin: int | float | None = None,
         tmax: int | float | None = None,
+        n_jobs: int | None = None,
         verbose: bool | str | int | None = None,
     ) -> np.ndarray | tuple:
         """Get data in the given range.
@@ -983,6 +1173,9 @@ class BaseRaw(
             ignored if the ``stop`` parameter is defined.
 
             .. versionadded:: 0.24.0
+        %(n_jobs_read)s
+
+            .. versionadded:: 1.13
         %(verbose)s
 
         Returns
@@ -1027,7 +1220,7 @@ class BaseRaw(
 
         if len(self.annotations) == 0 or reject_by_annotation is None:
             getitem = self._getitem(
-                (picks, slice(start, stop)), return_times=return_times
+                (picks, slice(start, stop)), return_times=return_times, n_jobs=n_jobs
             )
             if return_times:
                 data, times = getitem
@@ -1045,7 +1238,7 @@ class BaseRaw(
         onsets = np.maximum(onsets[keep], start)
         ends = np.minimum(ends[keep], stop)
         if len(onsets) == 0:
-            data, times = self[picks, start:stop]
+            data, times = self._getitem((picks, slice(start, stop)), n_jobs=n_jobs)
             if units is not None:
                 data *= ch_factors[:, np.newaxis]
             if return_times:
@@ -1083,7 +1276,9 @@ class BaseRaw(
                     if start == stop:
                         continue
                     end = idx + stop - start
-                    data[:, idx:end], times[idx:end] = self[picks, start:stop]
+                    data[:, idx:end], times[idx:end] = self._getitem(
+                        (picks, slice(start, stop)), n_jobs=n_jobs
+                    )
                     idx = end
             else:
                 msg = (
@@ -1099,10 +1294,10 @@ class BaseRaw(
                         n_kept / n_samples,
                     )
                 )
-                data, times = self[picks, start:stop]
+                data, times = self._getitem((picks, slice(start, stop)), n_jobs=n_jobs)
                 data[:, ~used[1:-1]] = np.nan
         else:
-            data, times = self[picks, start:stop]
+            data, times = self._getitem((picks, slice(start, stop)), n_jobs=n_jobs)
 
         if units is not None:
             data *= ch_factors[:, np.newaxis]
@@ -1110,6 +1305,87 @@ class BaseRaw(
             return data, times
         return data
 
+    @verbose
+    def iter_chunks(
+        self,
+        duration: float = 10.0,
+        overlap: float = 0.0,
+        picks: str | np.ndarray | slice | None = None,
+        *,
+        prefetch: int = 2,
+        return_times: bool = False,
+        verbose: bool | str | int | None = None,
+    ) -> Generator:
+        """Iterate over consecutive chunks of data.
+
+        While a chunk is being processed, the following ones are read from disk
+        in a background thread, so that disk latency overlaps with computation.
+
+        Parameters
+        ----------
+        duration : float
+            The duration of each chunk in seconds. The last chunk can be
+            shorter.
+        overlap : float
+            The overlap between consecutive chunks in seconds. Must be smaller
+            than ``duration``.
+        %(picks_all)s
+        prefetch : int
+            The number of chunks to read ahead. Use ``0`` to read each chunk
+            only when it is requested. Has no effect on preloaded data.
+        return_times : bool
+            Whether to yield times as well.
+        %(verbose)s
+
+        Yields
+        ------
+        data : ndarray, shape (n_channels, n_times)
+            The data of the current chunk.
+        times : ndarray, shape (n_times,)
+            The times associated with the data samples. Only yielded if
+            ``return_times=True``.
+
+        Notes
+        -----
+        .. versionadded:: 1.13
+        """
+        _validate_type(prefetch, "int-like", "prefetch")
+        prefetch = int(prefetch)
+        if prefetch < 0:
+            raise ValueError(f"prefetch must be non-negative, got {prefetch}")
+        sfreq = self.info["sfreq"]
+        n_duration = int(round(duration * sfreq))
+        n_step = n_duration - int(round(overlap * sfreq))
+        if n_duration < 1 or n_step < 1:
+            raise ValueError(
+                "duration must be positive and overlap must be smaller than "
+                f"duration, got duration={duration} and overlap={overlap}"
+            )
+        picks = _picks_to_idx(self.info, picks, "all", exclude=())
+        starts = np.arange(0, max(self.n_times - n_duration + n_step, 1), n_step)
+        stops = np.minimum(starts + n_duration, self.n_times)
+        # validate above and return a generator, which uses the log level that
+        # is in effect now whenever a chunk is requested
+        return self._iter_chunks(
+            picks, starts, stops, prefetch, return_times, logger.level
+        )
+
+    def _iter_chunks(self, picks, starts, stops, prefetch, return_times, level):
+        segments = _iter_raw_segments(self, picks, starts, stops, prefetch)
+        try:
+            for ci, (start, stop) in enumerate(zip(starts, stops)):
+                with use_log_level(level):
+                    logger.debug(
+                        f"Reading chunk {ci + 1}/{len(starts)}: {start} ... {stop - 1}"
+                    )
+                    data = next(segments)
+                if return_times:
+                    yield data, self.times[start:stop]
+                else:
+                    yield data
+        finally:  # also when the consumer stops early
+            segments.close()
+
     @verbose
     def apply_function(
         self,
@@ -1203,8 +1479,9 @@ class BaseRaw(
 
         return self
 
-    # Need a separate method because the default pad is different for raw
-    @copy_doc(FilterMixin.filter)
+    # Need a separate method because the default pad is different for raw, and
+    # data that are not preloaded can be filtered while they are read
+    @verbose
     def filter(
         self,
         l_freq: float | None,
@@ -1224,25 +1501,123 @@ class BaseRaw(
             "bad_acq_skip",
         ),
         pad: str = "reflect_limited",
+        *,
+        memmap: Path | str | None = None,
         verbose: bool | str | int | None = None,
     ) -> Self:
-        return super().filter(
+        """Filter a subset of channels.
+
+        Parameters
+        ----------
+        %(l_freq)s
+        %(h_freq)s
+        %(picks_all_data)s
+        %(filter_length)s
+        %(l_trans_bandwidth)s
+        %(h_trans_bandwidth)s
+        %(n_jobs_fir)s
+        %(method_fir)s
+        %(iir_params)s
+        %(phase)s
+        %(fir_window)s
+        %(fir_design)s
+        %(skip_by_annotation)s
+
+            .. versionadded:: 0.16.
+        %(pad_fir)s
+            The default is ``'reflect_limited'``.
+        %(memmap_filter)s
+        %(verbose)s
+
+        Returns
+        -------
+        raw : instance of Raw
+            The raw instance with filtered data.
+
+        See Also
+        --------
+        mne.filter.create_filter
+        mne.io.Raw.notch_filter
+        mne.io.Raw.resample
+        mne.filter.filter_data
+        mne.filter.construct_iir_filter
+
+        Notes
+        -----
+        Applies a zero-phase low-pass, high-pass, band-pass, or band-stop
+        filter to the channels selected by ``picks``.
+        The data are modified inplace.
+
+        ``l_freq`` and ``h_freq`` are the frequencies below which and above
+        which, respectively, to filter out of the data. Thus the uses are:
+
+            * ``l_freq < h_freq``: band-pass filter
+            * ``l_freq > h_freq``: band-stop filter
+            * ``l_freq is not None and h_freq is None``: high-pass filter
+            * ``l_freq is None and h_freq is not None``: low-pass filter
+
+        ``self.info['lowpass']`` and ``self.info['highpass']`` are only
+        updated with picks=None.
+
+        If the data are not preloaded, they are read from disk in chunks that
+        overlap by the length of the filter (or, for IIR filters, with the
+        filter state carried over from one chunk to the next, in both passes
+        for zero-phase filters), so only a few chunks are held in memory
+        besides the filtered data, which can be written to a memory-mapped file
+        with ``memmap``. Afterwards the data are preloaded. The result matches
+        filtering the preloaded data.
+
+        .. note:: If n_jobs > 1, more memory is required as
+                  ``len(picks) * n_times`` additional time points need to
+                  be temporarily stored in memory.
+
+        For more information, see the tutorials
+        :ref:`disc-filtering` and :ref:`tut-filter-resample` and
+        :func:`mne.filter.create_filter`.
+
+        .. versionadded:: 0.15
+        """
+        if self.preload:
+            return super().filter(
+                l_freq,
+                h_freq,
+                picks,
+                filter_length,
+                l_trans_bandwidth,
+                h_trans_bandwidth,
+                n_jobs=n_jobs,
+                method=method,
+                iir_params=iir_params,
+                phase=phase,
+                fir_window=fir_window,
+                fir_design=fir_design,
+                skip_by_annotation=skip_by_annotation,
+                pad=pad,
+                verbose=verbose,
+            )
+        update_info, picks = _filt_check_picks(self.info, picks, l_freq, h_freq)
+        if pad is None and method != "iir":
+            pad = "edge"
+        _filter_raw_stream(
+            self,
             l_freq,
             h_freq,
             picks,
             filter_length,
             l_trans_bandwidth,
             h_trans_bandwidth,
-            n_jobs=n_jobs,
-            method=method,
-            iir_params=iir_params,
-            phase=phase,
-            fir_window=fir_window,
-            fir_design=fir_design,
-            skip_by_annotation=skip_by_annotation,
-            pad=pad,
-            verbose=verbose,
+            n_jobs,
+            method,
+            iir_params,
+            phase,
+            fir_window,
+            fir_design,
+            pad,
+            skip_by_annotation,
+            memmap,
         )
+        _filt_update_info(self.info, update_info, l_freq, h_freq)
+        return self
 
     @verbose
     def notch_filter(
@@ -1265,6 +1640,8 @@ class BaseRaw(
             "edge",
             "bad_acq_skip",
         ),
+        *,
+        memmap: Path | str | None = None,
         verbose: bool | str | int | None = None,
     ) -> Self:
         """Notch filter a subset of channels.
@@ -1304,6 +1681,7 @@ class BaseRaw(
 
             .. versionadded:: 0.15
         %(skip_by_annotation)s
+        %(memmap_filter)s
         %(verbose)s
 
         Returns
@@ -1321,8 +1699,10 @@ class BaseRaw(
         Applies a zero-phase notch filter to the channels selected by
         "picks". By default the data of the Raw object is modified inplace.
 
-        The Raw object has to have the data loaded e.g. with ``preload=True``
-        or ``self.load_data()``.
+        If the data are not preloaded and ``method`` is ``'fir'`` or
+        ``'iir'``, they are filtered while being read from disk, as described in
+        :meth:`mne.io.Raw.filter`. ``method='spectrum_fit'`` requires the data to
+        be loaded, e.g. with ``preload=True`` or ``self.load_data()``.
 
         .. note:: If n_jobs > 1, more memory is required as
                   ``len(picks) * n_times`` additional time points need to
@@ -1332,6 +1712,31 @@ class BaseRaw(
         """
         fs = float(self.info["sfreq"])
         picks = _picks_to_idx(self.info, picks, exclude=(), none="data_or_ica")
+        if not self.preload and method != "spectrum_fit":
+            if freqs is None:
+                raise ValueError("freqs=None can only be used with method spectrum_fit")
+            freqs = np.atleast_1d(freqs)
+            notch_widths = _check_notch_widths(freqs, notch_widths)
+            lows, highs, tb_2 = _notch_stop_bands(freqs, notch_widths, trans_bandwidth)
+            _filter_raw_stream(
+                self,
+                highs,
+                lows,
+                picks,
+                filter_length,
+                tb_2,
+                tb_2,
+                n_jobs,
+                method,
+                iir_params,
+                phase,
+                fir_window,
+                fir_design,
+                pad,
+                skip_by_annotation,
+                memmap,
+            )
+            return self
         _check_preload(self, "raw.notch_filter")
         assert self._data is not None
         onsets, ends = _annotations_starts_stops(self, skip_by_annotation, invert=True)
@@ -1372,6 +1777,7 @@ class BaseRaw(
         events: np.ndarray | None = None,
         pad: str = "auto",
         method: str = "fft",
+        memmap: Path | str | None = None,
         verbose: bool | str | int | None = None,
     ) -> Self | tuple:
         """Resample all channels.
@@ -1419,6 +1825,7 @@ class BaseRaw(
         %(method_resample)s
 
             .. versionadded:: 1.7
+        %(memmap_resample)s
         %(verbose)s
 
         Returns
@@ -1442,6 +1849,13 @@ class BaseRaw(
         object has to have the data loaded e.g. with ``preload=True`` or
         ``self.load_data()``, but this increases memory requirements. The
         resulting raw object will have the data loaded into memory.
+
+        With ``method='polyphase'``, data that are not preloaded are instead
+        read and resampled in chunks of 10 s (for all channels at once), and
+        the result is identical to resampling the preloaded data. This requires
+        a ``pad`` that only depends on the samples close to the edges (i.e.,
+        not ``'wrap'``, ``'line'``, ``'mean'``, ``'median'``, ``'minimum'``, or
+        ``'maximum'``).
         """
         sfreq = float(sfreq)
         o_sfreq = float(self.info["sfreq"])
@@ -1491,44 +1905,66 @@ class BaseRaw(
         )
         ratio, n_news = ratio[0], np.array(n_news, int)
         new_offsets = np.cumsum([0] + list(n_news))
-        if self.preload:
-            assert self._data is not None
-            new_data = np.empty((len(self.ch_names), new_offsets[-1]), self._data.dtype)
-        for ri, (n_orig, n_new) in enumerate(zip(self._raw_lengths, n_news)):
-            this_sl = slice(new_offsets[ri], new_offsets[ri + 1])
+        stream = (
+            not self.preload
+            and method == "polyphase"
+            and (pad == "auto" or pad in _POLYPHASE_LOCAL_PADS)
+        )
+        if stream:
+            new_data = _resample_raw_stream(
+                self,
+                sfreq,
+                window=window,
+                pad="reflect" if pad == "auto" else pad,
+                stim_picks=stim_picks,
+                memmap=memmap,
+            )
+            self._comp = None  # already applied while reading
+            self._read_cache = None
+            self.close()
+        else:
             if self.preload:
                 assert self._data is not None
-                data_chunk = self._data[:, offsets[ri] : offsets[ri + 1]]
-                new_data[:, this_sl] = resample(data_chunk, **kwargs)
-                # In empirical testing, it was faster to resample all channels
-                # (above) and then replace the stim channels than it was to
-                # only resample the proper subset of channels and then use
-                # np.insert() to restore the stims.
-                if len(stim_picks) > 0:
-                    new_data[stim_picks, this_sl] = _resample_stim_channels(
-                        data_chunk[stim_picks], n_new, data_chunk.shape[1]
-                    )
-            else:  # this will not be I/O efficient, but will be mem efficient
-                for ci in range(len(self.ch_names)):
-                    data_chunk = self.get_data(
-                        np.array([ci]), offsets[ri], offsets[ri + 1], verbose="error"
-                    )[0]
-                    if ci == 0 and ri == 0:
-                        new_data = np.empty(
-                            (len(self.ch_names), new_offsets[-1]), data_chunk.dtype
+                new_data = np.empty(
+                    (len(self.ch_names), new_offsets[-1]), self._data.dtype
+                )
+            for ri, (n_orig, n_new) in enumerate(zip(self._raw_lengths, n_news)):
+                this_sl = slice(new_offsets[ri], new_offsets[ri + 1])
+                if self.preload:
+                    assert self._data is not None
+                    data_chunk = self._data[:, offsets[ri] : offsets[ri + 1]]
+                    new_data[:, this_sl] = resample(data_chunk, **kwargs)
+                    # In empirical testing, it was faster to resample all channels
+                    # (above) and then replace the stim channels than it was to
+                    # only resample the proper subset of channels and then use
+                    # np.insert() to restore the stims.
+                    if len(stim_picks) > 0:
+                        new_data[stim_picks, this_sl] = _resample_stim_channels(
+                            data_chunk[stim_picks], n_new, data_chunk.shape[1]
                         )
-                    if ci in stim_picks:
-                        resamp = _resample_stim_channels(
-                            data_chunk, n_new, data_chunk.shape[-1]
+                else:  # this will not be I/O efficient, but will be mem efficient
+                    for ci in range(len(self.ch_names)):
+                        data_chunk = self.get_data(
+                            np.array([ci]),
+                            offsets[ri],
+                            offsets[ri + 1],
+                            verbose="error",
                         )[0]
-                    else:
-                        resamp = resample(data_chunk, **kwargs)
-                    new_data[ci, this_sl] = resamp
+                        if ci == 0 and ri == 0:
+                            new_data = np.empty(
+                                (len(self.ch_names), new_offsets[-1]), data_chunk.dtype
+                            )
+                        if ci in stim_picks:
+                            resamp = _resample_stim_channels(
+                                data_chunk, n_new, data_chunk.shape[-1]
+                            )[0]
+                        else:
+                            resamp = resample(data_chunk, **kwargs)
+                        new_data[ci, this_sl] = resamp
 
         self._cropped_samp = int(np.round(self._cropped_samp * ratio))
         self._first_samps = np.round(self._first_samps * ratio).astype(int)
         self._last_samps = np.array(self._first_samps) + n_news - 1
-        self._raw_lengths[ri] = list(n_news)
         assert np.array_equal(n_news, self._last_samps - self._first_samps + 1)
         self._data = new_data
         self.preload = True
@@ -1564,6 +2000,101 @@ class BaseRaw(
             )
             return self, events
 
+    @verbose
+    def apply_hilbert(
+        self,
+        picks: str | np.ndarray | slice | None = None,
+        envelope: bool = False,
+        n_jobs: int | None = None,
+        n_fft: int | str | None = "auto",
+        *,
+        dtype: str = "complex128",
+        memmap: Path | str | None = None,
+        verbose: bool | str | int | None = None,
+    ) -> Self:
+        """Compute analytic signal or envelope for a subset of channels.
+
+        Parameters
+        ----------
+        %(picks_all_data_noref)s
+        envelope : bool
+            Compute the envelope signal of each channel. Default False.
+            See Notes.
+        %(n_jobs_hilbert)s
+        n_fft : int | None | str
+            Points to use in the FFT for Hilbert transformation. The signal
+            will be padded with zeros before computing Hilbert, then cut back
+            to original length. If None, n == self.n_times. If 'auto',
+            the next highest fast FFT length will be use. If the data are not
+            preloaded, this is also the length of the chunks in which they are
+            transformed (see Notes), and 'auto' limits it to about 60 s.
+        %(dtype_hilbert)s
+        memmap : path-like | None
+            Only used when the data are not preloaded, in which case they are
+            transformed while being read from disk (see Notes) and then kept in
+            memory, or in a memory-mapped file at this path if not ``None``.
+
+            .. versionadded:: 1.13
+        %(verbose)s
+
+        Returns
+        -------
+        raw : instance of Raw
+            The raw object with transformed data.
+
+        See Also
+        --------
+        mne.Epochs.apply_hilbert
+        mne.io.Raw.filter
+
+        Notes
+        -----
+        If ``envelope=False``, the analytic signal for the channels defined in
+        ``picks`` is computed and the data of the Raw object is converted to
+        a complex representation (the analytic signal is complex valued). If
+        ``envelope=True``, the absolute value of the analytic signal is
+        computed, resulting in the envelope signal. See
+        :meth:`mne.Epochs.apply_hilbert` for details.
+
+        If the data are not preloaded, they are read from disk in chunks of
+        ``n_fft`` samples that overlap by half of that (overlap-save), and of
+        each chunk only the central half is kept. Only a few chunks are thus
+        held in memory besides the result, which is then preloaded. If the
+        data are shorter than ``n_fft`` samples, the result is identical to
+        that of the preloaded data. Otherwise, it differs by the
+        (small, for band-limited signals) contribution of samples more than
+        ``n_fft // 4`` samples away.
+        """
+        if self.preload:
+            return super().apply_hilbert(
+                picks, envelope, n_jobs, n_fft, dtype=dtype, verbose=verbose
+            )
+        picks = _picks_to_idx(self.info, picks, exclude=(), with_ref_meg=False)
+        _check_option("dtype", dtype, ("complex128", "complex64"))
+        if n_fft is None:
+            n_fft = self.n_times
+        elif isinstance(n_fft, str):
+            _check_option("n_fft", n_fft, ("auto",))
+            n_fft = min(
+                next_fast_len(self.n_times),
+                next_fast_len(int(round(60 * self.info["sfreq"]))),
+            )
+        n_fft = _ensure_int(n_fft, "n_fft")
+        if n_fft < 1:
+            raise ValueError(f"n_fft must be positive, got {n_fft}")
+        if memmap is not None:
+            _validate_type(memmap, "path-like", "memmap")
+        _hilbert_raw_stream(
+            self,
+            picks,
+            envelope=envelope,
+            n_fft=n_fft,
+            dtype=np.dtype(dtype),
+            n_jobs=n_jobs,
+            memmap=memmap,
+        )
+        return self
+
     @verbose
     def rescale(
         self, scalings: int | float | dict, *, verbose: bool | str | int | None = None
@@ -1817,6 +2348,9 @@ class BaseRaw(
         overwrite: bool = False,
         split_size: str | int = "2GB",
         split_naming: Literal["neuromag", "bids"] = "neuromag",
+        *,
+        compression: Literal["zlib", "zstd"] | None = None,
+        n_jobs: int | None = None,
         verbose: bool | str | int | None = None,
     ) -> list[Path]:
         """Save raw data to file.
@@ -1870,6 +2404,23 @@ class BaseRaw(
         %(split_naming)s
 
             .. versionadded:: 0.17
+        compression : None | 'zlib' | 'zstd'
+            If not None, compress each data buffer using the given codec
+            (``'zstd'`` requires the ``zstandard`` package). Buffers are
+            converted to ``fmt`` before being compressed, so the compression is
+            lossless with respect to the uncompressed file. Such files can
+            only be read by MNE-Python 1.13 or newer, using
+            :func:`mne.io.read_raw_fif` (which also decompresses in parallel
+            when ``n_jobs`` is used to read data). Older versions of MNE-Python
+            and other FIF readers find no data buffers in them.
+
+            .. versionadded:: 1.13
+        n_jobs : int | None
+            The number of threads used to read, project, convert and compress
+            upcoming data buffers while the current one is written to disk.
+            ``None`` (default) and ``1`` use a single background thread.
+
+            .. versionadded:: 1.13
         %(verbose)s
 
         Returns
@@ -1957,7 +2508,15 @@ class BaseRaw(
         _validate_type(split_naming, str, "split_naming")
         _check_option("split_naming", split_naming, ("neuromag", "bids"))
 
-        cfg = _RawFidWriterCfg(buffer_size, split_size, drop_small_buffer, fmt)
+        _check_compression(compression)
+        cfg = _RawFidWriterCfg(
+            buffer_size,
+            split_size,
+            drop_small_buffer,
+            fmt,
+            compression,
+            _check_n_jobs(1 if n_jobs is None else n_jobs),
+        )
         raw_fid_writer = _RawFidWriter(self, info, picks, projector, start, stop, cfg)
         filenames = _write_raw(raw_fid_writer, fname, split_naming, overwrite)
         return filenames
@@ -2729,6 +3288,63 @@ def _allocate_data(preload, shape, dtype):
     return data
 
 
+def _iter_raw_segments(raw, picks, starts, stops, prefetch, *, process=None, n_jobs=1):
+    """Read (and optionally process) segments of raw data ahead of time.
+
+    Segments are read and passed through ``process`` in ``n_jobs`` background
+    threads, keeping up to ``prefetch`` of them in flight, and are yielded in
+    order.
+    """
+
+    def _read(start, stop):
+        data = raw._getitem((picks, slice(start, stop)), return_times=False)
+        return data if process is None else process(data)
+
+    if prefetch == 0 or (raw.preload and n_jobs == 1):
+        for start, stop in zip(starts, stops):
+            yield _read(start, stop)
+        return
+    bounds = zip(starts, stops)
+    futures = deque()
+    executor = ThreadPoolExecutor(max_workers=n_jobs)
+    try:
+        for start, stop in bounds:
+            futures.append(executor.submit(_read, start, stop))
+            if len(futures) == prefetch:
+                break
+        while futures:
+            data = futures.popleft().result()
+            for start, stop in bounds:  # queue the next one (if any)
+                futures.append(executor.submit(_read, start, stop))
+                break
+            yield data
+    finally:  # also when the consumer stops early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _split_reads(reads, first_samps, n_total, n_jobs, block):
+    """Split per-file reads into block-aligned pieces for parallel reading."""
+    chunk = max(int(np.ceil(n_total / n_jobs / block)), 1) * block
+    out = list()
+    for offset, orig_idx, fi, start_file, stop_file in reads:
+        # piece boundaries are aligned to blocks relative to the file start
+        bounds = np.arange(first_samps[fi], stop_file, chunk)
+        bounds = np.concatenate(
+            [[start_file], bounds[bounds > start_file], [stop_file]]
+        )
+        for this_start, this_stop in zip(bounds[:-1], bounds[1:]):
+            out.append(
+                (
+                    offset + this_start - start_file,
+                    orig_idx,
+                    fi,
+                    int(this_start),
+                    int(this_stop),
+                )
+            )
+    return out
+
+
 def _convert_slice(sel):
     if len(sel) and (np.diff(sel) == 1).all():
         return slice(sel[0], sel[-1] + 1)
@@ -2845,6 +3461,63 @@ def _get_scaling(ch_type, target_unit):
     return scaling
 
 
+class _ReadCache:
+    """Thread-safe LRU cache of blocks of data read from raw files."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = self.hits = self.misses = 0
+        self._blocks = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is None:
+                self.misses += 1
+            else:
+                self._blocks.move_to_end(key)
+                self.hits += 1
+            return block
+
+    def put(self, key, block):
+        with self._lock:
+            old = self._blocks.pop(key, None)
+            if old is not None:
+                self.size -= old[-1].nbytes
+            self._blocks[key] = block
+            self.size += block[-1].nbytes
+            self._evict()
+
+    def resize(self, max_size):
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def _evict(self):
+        while self.size > self.max_size and self._blocks:
+            self.size -= self._blocks.popitem(last=False)[1][-1].nbytes
+
+    def info(self):
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                blocks=len(self._blocks),
+                size=self.size,
+                max_size=self.max_size,
+            )
+
+    def __deepcopy__(self, memo):
+        return self  # the blocks only depend on the files, so they can be shared
+
+    def __getstate__(self):
+        return dict(max_size=self.max_size)
+
+    def __setstate__(self, state):
+        self.__init__(state["max_size"])
+
+
 class _ReadSegmentFileProtector:
     """Ensure only _filenames, _raw_extras, and _read_segment_file are used."""
 
@@ -2977,6 +3650,8 @@ class _RawFidWriterCfg:
     split_size: int
     drop_small_buffer: bool
     fmt: str
+    compression: str | None = None
+    n_jobs: int = 1
     reset_range: bool = field(init=False)
     data_type: int = field(init=False)
 
@@ -3033,6 +3708,8 @@ class _RawFidWriter:
             self.projector,
             self.cfg.drop_small_buffer,
             self.cfg.fmt,
+            self.cfg.compression,
+            self.cfg.n_jobs,
         )
         end_block(fid, FIFF.FIFFB_MEAS)
         is_next_split = self.start < self.stop
@@ -3064,6 +3741,8 @@ def _write_raw_data(
     projector,
     drop_small_buffer,
     fmt,
+    compression,
+    n_jobs,
 ):
     # Start the raw data
     data_kind = "IAS_" if info.get("maxshield", False) else ""
@@ -3112,12 +3791,32 @@ def _write_raw_data(
                 )
 
     cals = [ch["cal"] * ch["range"] for ch in info["chs"]]
-    # Write the blocks
+    skipped = np.zeros(len(firsts), bool)
+    if do_skips:
+        for ii, (first, last) in enumerate(zip(firsts, lasts)):
+            skipped[ii] = ((first >= sk_onsets) & (last <= sk_ends)).any()
+    # Write the blocks, while the next ones are read, projected and converted
+    # in background threads
+
+    def _prepare(data):
+        if projector is not None:
+            data = np.dot(projector, data)
+        return data.shape[1], _prepare_raw_buffer(data, cals, fmt, compression)
+
+    buffers = _iter_raw_segments(
+        raw,
+        picks,
+        np.array(firsts)[~skipped],
+        lasts[~skipped],
+        prefetch=2 * n_jobs,
+        process=_prepare,
+        n_jobs=n_jobs,
+    )
     n_current_skip = 0
     new_start = start
-    for first, last in zip(firsts, lasts):
+    for first, last, skip in zip(firsts, lasts, skipped):
         if do_skips:
-            if ((first >= sk_onsets) & (last <= sk_ends)).any():
+            if skip:
                 # Track how many we have
                 n_current_skip += 1
                 continue
@@ -3129,17 +3828,14 @@ def _write_raw_data(
                 # write_nop(fid)
                 # write_nop(fid)
                 n_current_skip = 0
-        data, times = raw[picks, first:last]
-        assert len(times) == last - first
+        n_samp, buffer = next(buffers)
+        assert n_samp == last - first
 
-        if projector is not None:
-            data = np.dot(projector, data)
-
-        if drop_small_buffer and (first > start) and (len(times) < buffer_size):
+        if drop_small_buffer and (first > start) and (n_samp < buffer_size):
             logger.info("Skipping data chunk due to small buffer ... [done]")
             break
         logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
-        _write_raw_buffer(fid, data, cals, fmt)
+        fid.write(buffer)
 
         pos = fid.tell()
         this_buff_size_bytes = pos - pos_prev
@@ -3174,6 +3870,7 @@ def _write_raw_data(
 
             break
         pos_prev = pos
+    buffers.close()
 
     end_block(fid, data_kind)
     return new_start
@@ -3213,13 +3910,11 @@ def _write_raw_metadata(fid, info, data_type, reset_range, annotations):
         _write_annotations(fid, annotations)
 
 
-def _write_raw_buffer(fid, buf, cals, fmt):
-    """Write raw buffer.
+def _prepare_raw_buffer(buf, cals, fmt, compression=None):
+    """Convert a raw buffer to the bytes of its FIF tag.
 
     Parameters
     ----------
-    fid : file descriptor
-        an open raw data file.
     buf : array
         The buffer to write.
     cals : array
@@ -3228,6 +3923,8 @@ def _write_raw_buffer(fid, buf, cals, fmt):
         'short', 'int', 'single', or 'double' for 16/32 bit int or 32/64 bit
         float for each item. This will be doubled for complex datatypes. Note
         that short and int formats cannot be used for complex data.
+    compression : str | None
+        The codec used to compress the buffer, if any.
     """
     if buf.shape[0] != len(cals):
         raise ValueError("buffer and calibration sizes do not match")
@@ -3259,7 +3956,24 @@ def _write_raw_buffer(fid, buf, cals, fmt):
     buf = buf / np.ravel(cals)[:, None]
     if cast_int:
         buf = buf.astype(np.int32)
-    write_function(fid, FIFF.FIFF_DATA_BUFFER, buf)
+    bio = BytesIO()
+    if compression is None:
+        write_function(bio, FIFF.FIFF_DATA_BUFFER, buf)
+    else:
+        data_type = _write_data_types[write_function]
+        payload = _compress_buffer(buf.T, data_type, compression)
+        write_bytes(bio, FIFF.FIFF_MNE_COMPRESSED_DATA_BUFFER, payload)
+    return bio.getvalue()
+
+
+_write_data_types = {
+    write_dau_pack16: FIFF.FIFFT_DAU_PACK16,
+    write_int: FIFF.FIFFT_INT,
+    write_float: FIFF.FIFFT_FLOAT,
+    write_double: FIFF.FIFFT_DOUBLE,
+    write_complex64: FIFF.FIFFT_COMPLEX_FLOAT,
+    write_complex128: FIFF.FIFFT_COMPLEX_DOUBLE,
+}
 
 
 def _check_raw_compatibility(raw):
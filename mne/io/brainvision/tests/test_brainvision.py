@@ -607,6 +607,20 @@ def test_brainvision_vectorized_data():
     assert_allclose(raw._data[:, :2], first_two_samples_all_chs)
 
 
+@pytest.mark.filterwarnings("ignore:.*software filter.*:RuntimeWarning")
+@pytest.mark.filterwarnings("ignore:No info on DataPoints:RuntimeWarning")
+@pytest.mark.parametrize("fname", [vhdr_path, vhdr_old_path])
+def test_brainvision_read_segments(fname):
+    """Test reading channel and sample subsets of multiplexed/vectorized data."""
+    raw = read_raw_brainvision(fname)
+    want = read_raw_brainvision(fname, preload=True).get_data()
+    picks = [0, 3, 17]
+    assert_array_equal(raw.get_data(picks, 12, 234), want[picks, 12:234])
+    assert_array_equal(raw.get_data(start=7, stop=8), want[:, 7:8])
+    raw.set_eeg_reference(projection=True).apply_proj()
+    assert_allclose(raw.get_data(picks), raw.copy().load_data().get_data(picks))
+
+
 def test_coodinates_extraction():
     """Test reading of [Coordinates] section if present."""
     # vhdr 2 has a Coordinates section
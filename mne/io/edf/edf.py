@@ -597,10 +597,7 @@ def _read_ch(fid, subtype, samp, dtype_byte, dtype=None):
     # BDF
     if subtype == "bdf":
         ch_data = read_from_file_or_buffer(fid, dtype=dtype, count=samp * dtype_byte)
-        ch_data = ch_data.reshape(-1, 3).astype(INT32)
-        ch_data = (ch_data[:, 0]) + (ch_data[:, 1] << 8) + (ch_data[:, 2] << 16)
-        # 24th bit determines the sign
-        ch_data[ch_data >= (1 << 23)] -= 1 << 24
+        ch_data = _int24_to_int32(ch_data)
 
     # GDF data and EDF data
     else:
@@ -609,6 +606,15 @@ def _read_ch(fid, subtype, samp, dtype_byte, dtype=None):
     return ch_data
 
 
+def _int24_to_int32(data):
+    """Convert little-endian 24-bit integers stored as bytes to int32."""
+    # put the three bytes in the upper part of an int32, then shift them back
+    # down, which carries the 24th (sign) bit along
+    out = np.zeros((data.size // 3, 4), np.uint8)
+    out[:, 1:] = data.reshape(-1, 3)
+    return out.view(INT32).ravel() >> 8
+
+
 def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals, mult):
     """Read a chunk of raw data."""
     n_samps = raw_extras["n_samps"]
@@ -638,10 +644,24 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
     # Otherwise we can end up with e.g. 18,181 chunks for a 20 MB file!
     # Let's do ~10 MB chunks:
     n_per = max(10 * 1024 * 1024 // (ch_offsets[-1] * dtype_byte), 1)
+    # When all requested channels share the highest sampling rate, the samples
+    # of every channel can be extracted from the records at once
+    uniform = bool((n_samps[orig_sel[idx_arr]] == buf_len).all())
+    n_values = ch_offsets[-1] * (dtype_byte if subtype == "bdf" else 1)
 
     with _gdf_edf_get_fid(filenames, buffering=0) as fid:
         # Extract data
         start_offset = data_offset + block_start_idx * ch_offsets[-1] * dtype_byte
+        # Files on disk are memory-mapped rather than read block by block
+        records = None
+        if not _file_like(filenames) and len(r_lims):
+            records = np.memmap(
+                filenames,
+                dtype=dtype,
+                mode="r",
+                offset=start_offset,
+                shape=(len(r_lims), n_values),
+            )
 
         # first read everything into the `ones` array. For channels with
         # lower sampling frequency, there will be zeros left at the end of the
@@ -652,16 +672,41 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
 
         # read data in chunks
         for ai in range(0, len(r_lims), n_per):
-            block_offset = ai * ch_offsets[-1] * dtype_byte
             n_read = min(len(r_lims) - ai, n_per)
-            fid.seek(start_offset + block_offset, 0)
             # Read and reshape to (n_chunks_read, ch0_ch1_ch2_ch3...)
-            many_chunk = _read_ch(
-                fid, subtype, ch_offsets[-1] * n_read, dtype_byte, dtype
-            ).reshape(n_read, -1)
+            if records is None:
+                block_offset = ai * ch_offsets[-1] * dtype_byte
+                fid.seek(start_offset + block_offset, 0)
+                many_chunk = _read_ch(
+                    fid, subtype, ch_offsets[-1] * n_read, dtype_byte, dtype
+                )
+            elif subtype == "bdf":
+                many_chunk = _int24_to_int32(records[ai : ai + n_read])
+            else:
+                many_chunk = np.array(records[ai : ai + n_read])
+            many_chunk = many_chunk.reshape(n_read, -1)
             r_sidx = r_lims[ai][0]
             r_eidx = buf_len * (n_read - 1) + r_lims[ai + n_read - 1][1]
 
+            if uniform:
+                for ci in tal_idx:
+                    tal_data.append(
+                        many_chunk[:, ch_offsets[ci] : ch_offsets[ci + 1]].copy()
+                    )
+                if len(idx_arr) == 0:
+                    continue
+                _read_uniform_block(
+                    ones,
+                    n_smp_read,
+                    many_chunk,
+                    raw_extras,
+                    idx_arr,
+                    ch_offsets,
+                    r_sidx,
+                    r_eidx,
+                )
+                continue
+
             # loop over selected channels, ci=channel selection
             for ii, ci in enumerate(read_sel):
                 # This now has size (n_chunks_read, n_samp[ci])
@@ -740,6 +785,30 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
     return tal_data
 
 
+def _read_uniform_block(
+    ones, n_smp_read, many_chunk, raw_extras, idx_arr, ch_offsets, r_sidx, r_eidx
+):
+    """Extract and scale all channels sampled at the highest rate at once."""
+    buf_len = int(raw_extras["max_samp"])
+    cal = raw_extras["cal"][idx_arr, np.newaxis]
+    offsets = raw_extras["offsets"][idx_arr, np.newaxis]
+    gains = raw_extras["units"][idx_arr, np.newaxis]
+    # (n_channels, buf_len) indices into each record
+    cols = ch_offsets[raw_extras["sel"][idx_arr], np.newaxis] + np.arange(buf_len)
+    # (n_records, n_channels, buf_len) -> (n_channels, n_records * buf_len)
+    ch_data = many_chunk[:, cols].transpose(1, 0, 2).reshape(len(idx_arr), -1)
+    ch_data = ch_data[:, r_sidx:r_eidx] * cal
+    ch_data += offsets
+    ch_data *= gains
+    is_stim = np.isin(idx_arr, raw_extras["stim_channel_idxs"])
+    if is_stim.any():
+        ch_data[is_stim] = np.bitwise_and(ch_data[is_stim].astype(int), 2**17 - 1)
+    smp_read = n_smp_read[idx_arr[0]]
+    ones[idx_arr, smp_read : smp_read + ch_data.shape[1]] = ch_data
+    for orig_idx in idx_arr:
+        n_smp_read[orig_idx] += ch_data.shape[1]
+
+
 @fill_doc
 def _read_header(
     fname,
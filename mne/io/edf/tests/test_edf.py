@@ -25,6 +25,7 @@ from mne.datasets import testing
 from mne.io import edf, read_raw_bdf, read_raw_edf, read_raw_fif, read_raw_gdf
 from mne.io.edf.edf import (
     _edf_str,
+    _int24_to_int32,
     _parse_prefilter_string,
     _prefilter_float,
     _read_annotations_edf,
@@ -1262,3 +1263,24 @@ def test_edf_read_from_file_like():
         ]
 
         assert raw.ch_names == channels
+
+
+def test_int24_to_int32():
+    """Test unpacking of 24-bit BDF samples."""
+    want = np.array([0, 1, -1, 2**23 - 1, -(2**23), 123456, -654321], np.int32)
+    packed = want.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3].ravel()
+    assert_array_equal(_int24_to_int32(packed), want)
+
+
+@pytest.mark.parametrize(
+    "fname, reader",
+    [(bdf_path, read_raw_bdf), (edf_path, read_raw_edf)],
+)
+def test_read_memmap_file_like(fname, reader):
+    """Test that memory-mapped and file-like reads give the same data."""
+    raw = reader(fname)
+    with open(fname, "rb") as blob:
+        want = reader(BytesIO(blob.read()), preload=True).get_data()
+    assert_array_equal(raw.get_data(), want)
+    picks = [0, 5, len(raw.ch_names) - 1]
+    assert_array_equal(raw.get_data(picks, 123, 1567), want[picks, 123:1567])
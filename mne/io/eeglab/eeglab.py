@@ -15,7 +15,7 @@ from ..._fiff._digitization import _ensure_fiducials_head
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import create_info
 from ..._fiff.pick import _PICK_TYPES_KEYS
-from ..._fiff.utils import _find_channels, _mult_cal_one, _read_segments_file
+from ..._fiff.utils import _find_channels, _mult_cal_one, _read_segments_mmap
 from ...annotations import Annotations, read_annotations
 from ...channels import make_dig_montage
 from ...defaults import DEFAULTS
@@ -547,7 +547,7 @@ class RawEEGLAB(BaseRaw):
             return
 
         # Fall back to reading from file (separate .fdt file)
-        _read_segments_file(self, data, idx, fi, start, stop, cals, mult, dtype="<f4")
+        _read_segments_mmap(self, data, idx, fi, start, stop, cals, mult, dtype="<f4")
 
 
 class EpochsEEGLAB(BaseEpochs):
@@ -4,15 +4,17 @@
 
 import copy
 import os.path as op
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+from ..._fiff.compression import _decompress_buffer, _read_compressed_header
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import read_meas_info
 from ..._fiff.open import _fiff_get_fid, _get_next_fname, fiff_open
-from ..._fiff.tag import _call_dict, read_tag
+from ..._fiff.tag import _call_dict, _simple_dict, read_tag
 from ..._fiff.tree import dir_tree_find
 from ..._fiff.utils import _mult_cal_one
 from ...annotations import Annotations, _read_annotations_fif
@@ -23,6 +25,7 @@ from ...utils import (
     _check_fname,
     _file_like,
     _on_missing,
+    _validate_type,
     check_fname,
     fill_doc,
     logger,
@@ -63,6 +66,12 @@ class Raw(BaseRaw):
         activity. Can also be "yes" to load without eliciting a warning.
     %(preload)s
     %(on_split_missing)s
+    mmap : bool
+        If True, read data on demand through a read-only memory map of each
+        file rather than by reading and decoding whole data buffers. See
+        :func:`mne.io.read_raw_fif` for details.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Attributes
@@ -97,14 +106,17 @@ class Raw(BaseRaw):
         allow_maxshield: bool | str = False,
         preload: bool | str = False,
         on_split_missing: str = "raise",
+        *,
+        mmap: bool = False,
         verbose: bool | str | int | None = None,
     ):
+        _validate_type(mmap, bool, "mmap")
         raws = []
         do_check_ext = not _file_like(fname)
         next_fname = fname
         while next_fname is not None:
             raw, next_fname, buffer_size_sec = self._read_raw_file(
-                next_fname, allow_maxshield, preload, do_check_ext
+                next_fname, allow_maxshield, preload, do_check_ext, mmap=mmap
             )
             do_check_ext = False
             raws.append(raw)
@@ -179,7 +191,14 @@ class Raw(BaseRaw):
 
     @verbose
     def _read_raw_file(
-        self, fname, allow_maxshield, preload, do_check_ext=True, verbose=None
+        self,
+        fname,
+        allow_maxshield,
+        preload,
+        do_check_ext=True,
+        *,
+        mmap=False,
+        verbose=None,
     ):
         """Read in header information from a raw file."""
         logger.info(f"Opening raw data file {fname}...")
@@ -200,10 +219,14 @@ class Raw(BaseRaw):
             # filename
             fname = _check_fname(fname, "read", True, "fname")
             whole_file = preload if fname.suffix == ".gz" else False
+            if mmap and fname.suffix == ".gz":
+                raise ValueError("mmap=True cannot be used with gzipped files")
         else:
             # file-like
             if not preload:
                 raise ValueError("preload must be used with file-like objects")
+            if mmap:
+                raise ValueError("mmap=True cannot be used with file-like objects")
             whole_file = True
         ff, tree, _ = fiff_open(fname, preload=whole_file)
         with ff as fid:
@@ -288,7 +311,15 @@ class Raw(BaseRaw):
                 ent = directory[k]
                 # There can be skips in the data (e.g., if the user unclicked)
                 # an re-clicked the button
-                if ent.kind == FIFF.FIFF_DATA_BUFFER:
+                if ent.kind == FIFF.FIFF_MNE_COMPRESSED_DATA_BUFFER:
+                    if mmap:
+                        raise ValueError(
+                            "mmap=True cannot be used with compressed data buffers"
+                        )
+                    data_type, nsamp = _read_compressed_header(fid, ent)
+                    # from here on, treat it like a buffer of the stored type
+                    ent = replace(ent, type=data_type)
+                elif ent.kind == FIFF.FIFF_DATA_BUFFER:
                     #   Figure out the number of samples in this buffer
                     try:
                         div = _byte_dict[ent.type]
@@ -297,6 +328,10 @@ class Raw(BaseRaw):
                             f"Cannot handle data buffers of type {ent.type}"
                         ) from None
                     nsamp = ent.size // (div * nchan)
+                if ent.kind in (
+                    FIFF.FIFF_DATA_BUFFER,
+                    FIFF.FIFF_MNE_COMPRESSED_DATA_BUFFER,
+                ):
                     if orig_format is None:
                         orig_format = _orig_format_dict[ent.type]
 
@@ -356,6 +391,7 @@ class Raw(BaseRaw):
         del raw_extras["last"]
         del raw_extras["nsamp"]
         raw_extras["filename"] = fname
+        raw_extras["mmap"] = mmap
 
         raw.last_samp = first_samp - 1
         raw.orig_format = orig_format
@@ -403,6 +439,9 @@ class Raw(BaseRaw):
 
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file."""
+        if self._raw_extras[fi].get("mmap", False):
+            _read_segment_mmap(self._raw_extras[fi], data, idx, start, stop, cals, mult)
+            return
         n_bad = 0
         with _fiff_get_fid(self._raw_extras[fi]["filename"]) as fid:
             bounds = self._raw_extras[fi]["bounds"]
@@ -427,7 +466,10 @@ class Raw(BaseRaw):
                 # faster to always read full tag, taking advantage of knowing the header
                 # already (cutting out some of read_tag) ...
                 fid.seek(ent.pos + 16, 0)
-                one = _call_dict[ent.type](fid, ent, shape=None, rlims=None)
+                if ent.kind == FIFF.FIFF_MNE_COMPRESSED_DATA_BUFFER:
+                    one = _decompress_buffer(fid.read(ent.size), nchan)
+                else:
+                    one = _call_dict[ent.type](fid, ent, shape=None, rlims=None)
                 try:
                     one = _reshape_view(one, (nsamp, nchan))
                 except AttributeError:  # one is None
@@ -500,12 +542,87 @@ def _check_entry(first, nent):
         raise OSError("Could not read data, perhaps this is a corrupt file")
 
 
+_mmap_dtypes = {
+    **_simple_dict,
+    FIFF.FIFFT_COMPLEX_FLOAT: ">c8",
+    FIFF.FIFFT_COMPLEX_DOUBLE: ">c16",
+}
+
+
+def _mmap_runs(ents, use):
+    """Group buffers that can be viewed as one regularly strided array."""
+    run = list()
+    for ei in use:
+        if run:
+            ent, prev = ents[ei], ents[run[-1]]
+            same = (
+                ent is not None
+                and prev is not None
+                and ent.type == prev.type
+                and ent.size == prev.size
+            )
+            if same and len(run) > 1:
+                same = ent.pos - prev.pos == prev.pos - ents[run[-2]].pos
+            if not same:
+                yield run
+                run = list()
+        run.append(ei)
+    if run:
+        yield run
+
+
+def _read_segment_mmap(raw_extra, data, idx, start, stop, cals, mult):
+    """Read a segment of data using views of a memory-mapped file."""
+    bounds = raw_extra["bounds"]
+    ents = raw_extra["ent"]
+    nchan = raw_extra["orig_nchan"]
+    use = np.where((stop > bounds[:-1]) & (start < bounds[1:]))[0]
+    fmap = np.memmap(raw_extra["filename"], dtype=np.uint8, mode="r")
+    n_bad = offset = 0
+    for run in _mmap_runs(ents, use):
+        first_pick = max(start - bounds[run[0]], 0)
+        last_pick = min(bounds[run[-1] + 1], stop) - bounds[run[0]]
+        picksamp = last_pick - first_pick
+        this_sl = slice(offset, offset + picksamp)
+        offset += picksamp
+        ent = ents[run[0]]
+        if ent is None:
+            continue  # just use zeros for gaps
+        dtype = np.dtype(_mmap_dtypes[ent.type])
+        nsamp = ent.size // (dtype.itemsize * nchan)
+        step = ents[run[1]].pos - ent.pos if len(run) > 1 else ent.size + 16
+        if ents[run[-1]].pos + 16 + ent.size > fmap.size:
+            n_bad += picksamp
+            continue
+        # (n_buffers, n_samples, n_channels) view of the on-disk tag payloads,
+        # skipping the 16-byte tag headers between consecutive buffers
+        view = np.ndarray(
+            (len(run), nsamp, nchan),
+            dtype,
+            buffer=fmap,
+            offset=ent.pos + 16,
+            strides=(step, nchan * dtype.itemsize, dtype.itemsize),
+        )
+        # picking channels and casting is the only copy made of the on-disk data
+        one = view[..., idx].astype(data.dtype)
+        one = one.reshape(-1, one.shape[-1])[first_pick:last_pick]
+        _mult_cal_one(data[:, this_sl], one.T, slice(None), cals, mult)
+    if n_bad:
+        warn(
+            f"FIF raw buffer could not be read, acquisition error "
+            f"likely: {n_bad} samples set to zero"
+        )
+    assert offset == stop - start
+
+
 @fill_doc
 def read_raw_fif(
     fname: Path | str | FileLike,
     allow_maxshield: bool | str = False,
     preload: bool | str = False,
     on_split_missing: str = "raise",
+    *,
+    mmap: bool = False,
     verbose: bool | str | int | None = None,
 ) -> Raw:
     """Reader function for Raw FIF data.
@@ -529,6 +646,14 @@ def read_raw_fif(
         activity. Can also be "yes" to load without eliciting a warning.
     %(preload)s
     %(on_split_missing)s
+    mmap : bool
+        If True (and ``preload=False``), data are read on demand through a
+        read-only memory map of each file. Data buffers are then accessed as
+        strided views of the file contents, so only the requested channels
+        and samples are copied and calibrated. Cannot be used with gzipped
+        files or file-like objects.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -551,6 +676,7 @@ def read_raw_fif(
         preload=preload,
         verbose=verbose,
         on_split_missing=on_split_missing,
+        mmap=mmap,
     )
 
 
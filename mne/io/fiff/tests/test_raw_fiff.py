@@ -18,6 +18,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose, assert_array_almost_equal, assert_array_equal
 
+import mne.filter
 from mne import (
     compute_proj_raw,
     concatenate_events,
@@ -35,7 +36,14 @@ from mne._fiff.tag import _read_tag_header, read_tag
 from mne.annotations import Annotations
 from mne.datasets import testing
 from mne.filter import filter_data
-from mne.io import RawArray, base, concatenate_raws, match_channel_orders, read_raw_fif
+from mne.io import (
+    RawArray,
+    base,
+    concatenate_raws,
+    match_channel_orders,
+    read_raw_fif,
+    show_fiff,
+)
 from mne.io.tests.test_raw import _test_concat, _test_raw_reader
 from mne.transforms import Transform
 from mne.utils import (
@@ -44,8 +52,10 @@ from mne.utils import (
     assert_and_remove_boundary_annot,
     assert_object_equal,
     catch_logging,
+    get_config,
     requires_mne,
     run_subprocess,
+    set_fif_index,
 )
 
 testing_path = testing.data_path(download=False)
@@ -2035,6 +2045,374 @@ def test_memmap(tmp_path):
     # require them.
 
 
+@pytest.mark.parametrize("fmt", ["short", "int", "single", "double"])
+def test_mmap(tmp_path, fmt):
+    """Test reading FIF data through a memory map."""
+    rng = np.random.default_rng(0)
+    info = create_info(10, 1000.0, ["eeg"] * 8 + ["stim", "misc"])
+    data = rng.standard_normal((10, 5432)) * 1e-5
+    data[8] = np.round(data[8] * 1e5)
+    fname = tmp_path / "test_raw.fif"
+    raw = RawArray(data, info)
+    raw.save(fname, fmt=fmt, buffer_size_sec=0.3)
+    raw = read_raw_fif(fname)
+    raw_mmap = read_raw_fif(fname, mmap=True)
+    assert not raw_mmap.preload
+    atol = 1e-20 if fmt in ("single", "double") else 0
+    for picks, start, stop in [
+        (None, 0, None),  # all
+        ([1, 5, 8], 10, 20),  # within one buffer
+        ([0, 1, 2], 250, 1234),  # across buffers, slice of channels
+        ([9, 3], 5000, None),  # partial last buffer
+    ]:
+        want = raw.get_data(picks, start, stop)
+        got = raw_mmap.get_data(picks, start, stop)
+        assert_allclose(got, want, atol=atol, rtol=0)
+    # with projection (reading through mult)
+    for r in (raw, raw_mmap):
+        r.set_eeg_reference(projection=True)
+        r.apply_proj()
+    assert_allclose(raw_mmap[:8, 100:2000][0], raw[:8, 100:2000][0])
+    # preloading through the memory map
+    raw_mmap = read_raw_fif(fname, mmap=True, preload=True)
+    assert_allclose(raw_mmap.get_data(), read_raw_fif(fname).get_data())
+    gz_fname = tmp_path / "test_raw.fif.gz"
+    raw.save(gz_fname)
+    with pytest.raises(ValueError, match="gzipped"):
+        read_raw_fif(gz_fname, mmap=True)
+    with pytest.raises(ValueError, match="file-like"):
+        read_raw_fif(BytesIO(fname.read_bytes()), preload=True, mmap=True)
+
+
+def test_read_n_jobs(tmp_path):
+    """Test reading split and concatenated files using threads."""
+    info = create_info(32, 1000.0, "eeg")
+    data = np.random.default_rng(0).standard_normal((32, 100000)) * 1e-5
+    raw = RawArray(data, info)
+    raw.set_eeg_reference(projection=True)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, split_size="10MB", fmt="double")
+    raw_read = read_raw_fif(fname)
+    assert len(raw_read.filenames) == 3
+    raw_concat = concatenate_raws([read_raw_fif(fname), read_raw_fif(fname)])
+    n = len(raw.times)
+    for r, want in ((raw_read, data), (raw_concat, np.tile(data, 2))):
+        for n_jobs in (1, 3, -1):
+            assert_array_equal(r.get_data(n_jobs=n_jobs), want)
+            got = r.get_data([0, 2], 1234, 95678, n_jobs=n_jobs)
+            assert_array_equal(got, want[[0, 2], 1234:95678])
+        r.apply_proj()
+        want = raw.copy().apply_proj().get_data()
+        assert_allclose(r.get_data(n_jobs=3)[:, :n], want, atol=1e-20)
+        r.load_data(n_jobs=2)
+        assert_allclose(r.get_data()[:, :n], want, atol=1e-20)
+
+
+@pytest.mark.parametrize("preload", [True, False])
+def test_iter_chunks(tmp_path, preload):
+    """Test iterating over chunks of raw data."""
+    info = create_info(3, 100.0, "eeg")
+    data = np.random.default_rng(0).standard_normal((3, 1050)) * 1e-5
+    fname = tmp_path / "test_raw.fif"
+    RawArray(data, info).save(fname, buffer_size_sec=0.5)
+    raw = read_raw_fif(fname, preload=preload)
+    for prefetch in (0, 1, 3):
+        chunks = list(raw.iter_chunks(2.0, 0.5, prefetch=prefetch))
+        assert len(chunks) == 7
+        assert [c.shape[1] for c in chunks] == [200] * 6 + [150]
+        for ci, chunk in enumerate(chunks):
+            assert_allclose(chunk, data[:, ci * 150 : ci * 150 + 200], atol=1e-20)
+    data_, times = next(raw.iter_chunks(1.0, picks=[1], return_times=True))
+    assert_allclose(data_, data[[1], :100], atol=1e-20)
+    assert_allclose(times, raw.times[:100])
+    # stopping early
+    for chunk in raw.iter_chunks(1.0):
+        break
+    assert_allclose(chunk, data[:, :100], atol=1e-20)
+    # arguments are checked when called
+    with pytest.raises(ValueError, match="must be smaller"):
+        raw.iter_chunks(1.0, 1.0)
+    with pytest.raises(ValueError, match="non-negative"):
+        raw.iter_chunks(prefetch=-1)
+    # the log level applies while iterating
+    chunks = raw.iter_chunks(5.0, verbose="debug")
+    with catch_logging() as log:
+        list(chunks)
+    assert "Reading chunk 2/3: 500 ... 999" in log.getvalue()
+    with catch_logging(verbose="debug") as log:
+        list(raw.iter_chunks(5.0, verbose="warning"))
+    assert "Reading chunk" not in log.getvalue()
+    # saving reads ahead as well
+    raw.save(tmp_path / "test2_raw.fif", split_size="10MB")
+    assert_allclose(read_raw_fif(tmp_path / "test2_raw.fif").get_data(), data)
+
+
+def test_read_cache(tmp_path):
+    """Test caching blocks of data read from disk."""
+    info = create_info(4, 100.0, "eeg")
+    data = np.random.default_rng(0).standard_normal((4, 1050)) * 1e-5
+    fname = tmp_path / "test_raw.fif"
+    RawArray(data, info).save(fname, buffer_size_sec=1.0)
+    raw = read_raw_fif(fname)
+    assert raw.read_cache_info() is None
+    raw.set_read_cache("1MB")
+    assert_allclose(raw.get_data([1, 2], 150, 320), data[[1, 2], 150:320], atol=0)
+    info = raw.read_cache_info()
+    assert info["hits"] == 0 and info["misses"] == info["blocks"] == 3
+    assert info["size"] == 3 * 4 * 100 * 8
+    # other channels and overlapping windows are served from memory
+    assert_allclose(raw.get_data([0, 3], 200, 250), data[[0, 3], 200:250], atol=0)
+    assert raw.read_cache_info()["hits"] == 1
+    # picking, cropping and projection do not invalidate the blocks
+    raw.pick([2, 0]).crop(1.5, None)
+    assert_allclose(raw.get_data(stop=50), data[[2, 0], 150:200], atol=0)
+    assert raw.read_cache_info()["misses"] == 3
+    raw.set_eeg_reference(projection=True).apply_proj()
+    want = raw.copy().load_data().get_data()
+    assert raw.read_cache_info()["misses"] == 3 + 7  # the copy shares the cache
+    assert_allclose(want, data[[2, 0], 150:] - data[[2, 0], 150:].mean(0), atol=1e-12)
+    assert_allclose(raw.get_data(stop=100), want[:, :100], atol=1e-20)
+    # LRU eviction
+    raw.set_read_cache(1000)
+    assert raw.read_cache_info()["blocks"] == 0
+    raw.set_read_cache(2 * 1600)
+    raw.get_data()
+    assert raw.read_cache_info()["blocks"] == 2
+    assert_allclose(raw.get_data(), want, atol=1e-20)
+    raw.set_read_cache(None)
+    assert raw.read_cache_info() is None
+    with pytest.raises(ValueError, match="has to end with"):
+        raw.set_read_cache("1kB")
+
+
+@pytest.mark.parametrize(
+    "kwargs, rtol",
+    [
+        (dict(), 1e-12),
+        (dict(phase="minimum"), 1e-12),
+        (dict(phase="zero-double"), 1e-12),
+        (dict(method="iir", phase="forward"), 1e-12),
+        (dict(method="iir"), 1e-12),
+        (dict(method="iir", iir_params=dict(order=4, ftype="butter")), 1e-12),
+        (
+            dict(method="iir", iir_params=dict(order=2, ftype="butter", output="ba")),
+            1e-12,
+        ),
+    ],
+)
+def test_filter_stream(tmp_path, monkeypatch, kwargs, rtol):
+    """Test filtering data that are not preloaded while reading them."""
+    n_autotune = list()
+    use_fir_autotune = mne.filter._use_fir_autotune
+    monkeypatch.setattr(
+        mne.filter,
+        "_use_fir_autotune",
+        lambda: n_autotune.append(None) or use_fir_autotune(),
+    )
+    info = create_info(3, 250.0, ["eeg", "eeg", "stim"])
+    data = np.random.default_rng(0).standard_normal((3, 15000)) * 1e-5
+    raw = RawArray(data, info)
+    raw.set_annotations(Annotations([20.0], [2.0], ["bad_acq_skip"]))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, buffer_size_sec=1.0)
+    raw = read_raw_fif(fname, preload=True).filter(1.0, 40.0, **kwargs)
+    raw_stream = read_raw_fif(fname)
+    n_autotune.clear()
+    with catch_logging() as log:
+        out = raw_stream.filter(1.0, 40.0, **kwargs, verbose=True)
+    assert out is raw_stream
+    assert "in 2 contiguous segments while reading" in log.getvalue()
+    assert len(n_autotune) == (kwargs.get("method", "fir") == "fir")  # not per chunk
+    assert raw_stream.preload
+    assert raw_stream.info["highpass"] == raw.info["highpass"] == 1.0
+    assert raw_stream.info["lowpass"] == raw.info["lowpass"] == 40.0
+    want = raw.get_data()
+    assert_array_equal(raw_stream.get_data()[2], want[2])
+    atol = rtol * np.abs(want).max()
+    assert_allclose(raw_stream.get_data(), want, rtol=0, atol=atol)
+    # filtered into a memory-mapped file, with the notch filter
+    raw = read_raw_fif(fname, preload=True).notch_filter(50.0, **kwargs)
+    raw_stream = read_raw_fif(fname).notch_filter(
+        50.0, **kwargs, memmap=tmp_path / "data.dat"
+    )
+    assert isinstance(raw_stream._data, np.memmap)
+    assert_allclose(raw_stream.get_data(), raw.get_data(), rtol=0, atol=atol)
+
+
+@pytest.mark.parametrize("output", ["sos", "ba"])
+def test_filter_stream_iir_highpass(tmp_path, output):
+    """Test streaming a zero-phase IIR high-pass with a long impulse response."""
+    info = create_info(2, 250.0, "eeg")
+    rng = np.random.default_rng(0)
+    data = np.cumsum(rng.standard_normal((2, 30000)), axis=-1) * 1e-6
+    raw = RawArray(data, info)
+    # a short segment (shorter than padlen) and a long one
+    raw.set_annotations(Annotations([1.0, 40.0], [38.0, 2.0], ["bad_acq_skip"] * 2))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, buffer_size_sec=1.0)
+    kwargs = dict(method="iir", iir_params=dict(order=2, ftype="butter", output=output))
+    raw = read_raw_fif(fname, preload=True).filter(0.1, None, **kwargs)
+    raw_stream = read_raw_fif(fname).filter(0.1, None, **kwargs)
+    want = raw.get_data()
+    assert_allclose(raw_stream.get_data(), want, rtol=0, atol=1e-9 * np.abs(want).max())
+
+
+@pytest.mark.parametrize("sfreq, pad", [(500.0, "auto"), (1234.0, "edge")])
+def test_resample_stream(tmp_path, sfreq, pad):
+    """Test polyphase resampling of data that are not preloaded."""
+    rng = np.random.default_rng(0)
+    info = create_info(3, 5000.0, ["eeg", "eeg", "stim"])
+    data = rng.standard_normal((3, 100037)) * 1e-5
+    data[2] = 0
+    data[2, rng.integers(0, data.shape[1], 40)] = rng.integers(1, 5, 40)
+    fname = tmp_path / "test_raw.fif"
+    RawArray(data, info).save(fname, fmt="double")
+    raw = read_raw_fif(fname)
+    raw = concatenate_raws([raw, raw.copy().crop(0, 7.3)])
+    raw_stream = raw.copy()
+    raw.load_data().resample(sfreq, method="polyphase", pad=pad)
+    with catch_logging() as log:
+        raw_stream.resample(
+            sfreq,
+            method="polyphase",
+            pad=pad,
+            memmap=tmp_path / "data.dat",
+            verbose=True,
+        )
+    assert "while reading them" in log.getvalue()
+    assert raw_stream.preload
+    assert isinstance(raw_stream._data, np.memmap)
+    assert raw_stream.info["sfreq"] == sfreq
+    assert_array_equal(raw_stream._first_samps, raw._first_samps)
+    assert_array_equal(raw_stream.get_data(), raw.get_data())
+
+
+@pytest.mark.parametrize("envelope", [False, True])
+def test_hilbert_stream(tmp_path, envelope):
+    """Test the Hilbert transform of data that are not preloaded."""
+    rng = np.random.default_rng(0)
+    info = create_info(3, 250.0, ["eeg", "eeg", "stim"])
+    data = rng.standard_normal((3, 25013)) * 1e-5
+    raw = RawArray(data, info).filter(8, 12, picks=[0, 1])
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, fmt="double")
+    raw.apply_hilbert(envelope=envelope, n_fft=None)
+    want = raw.get_data()
+    # a single chunk: identical
+    raw_stream = read_raw_fif(fname).apply_hilbert(envelope=envelope, n_fft=None)
+    assert raw_stream.preload
+    assert_array_equal(raw_stream.get_data(), want)
+    # in chunks of 10 s (overlap-save), with single precision in a memmap
+    raw_stream = read_raw_fif(fname)
+    with catch_logging() as log:
+        raw_stream.apply_hilbert(
+            envelope=envelope,
+            n_fft=2500,
+            dtype="complex64",
+            memmap=tmp_path / "data.dat",
+            verbose=True,
+        )
+    assert "in 21 chunks of 10.0 s" in log.getvalue()
+    assert isinstance(raw_stream._data, np.memmap)
+    assert raw_stream._data.dtype == (np.float64 if envelope else np.complex64)
+    got = raw_stream.get_data()
+    assert_allclose(got[2], data[2], rtol=1e-6)  # not transformed
+    err = np.abs(got[:2, 500:-500] - want[:2, 500:-500]).max()
+    assert err < 5e-3 * np.abs(want[:2]).max()
+
+
+@pytest.mark.parametrize("compression", ["zlib", "zstd"])
+@pytest.mark.parametrize("fmt", ["short", "int", "single", "double"])
+def test_compression(tmp_path, compression, fmt):
+    """Test saving and reading compressed raw data buffers."""
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    info = create_info(4, 1000.0, ["eeg"] * 3 + ["stim"])
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((4, 5000)) * 1e-5
+    data[3] = rng.integers(0, 5, 5000)
+    raw = RawArray(data, info)
+    raw.set_annotations(Annotations([1.0], [1.0], ["BAD_ACQ_SKIP"]))
+    fname, fname_c = tmp_path / "test_raw.fif", tmp_path / "test_c_raw.fif"
+    raw.save(fname, fmt=fmt, buffer_size_sec=0.5)
+    raw.save(fname_c, fmt=fmt, buffer_size_sec=0.5, compression=compression)
+    if fmt in ("short", "int", "single"):
+        assert fname_c.stat().st_size < fname.stat().st_size
+    raw = read_raw_fif(fname)
+    raw_c = read_raw_fif(fname_c)
+    assert raw_c.orig_format == raw.orig_format == fmt
+    assert_array_equal(raw_c.get_data(), raw.get_data())
+    assert_array_equal(
+        raw_c.get_data([0, 3], 123, 3456), raw.get_data([0, 3], 123, 3456)
+    )
+    assert_array_equal(raw_c.get_data(n_jobs=2), raw.get_data())
+    assert "FIFF_MNE_COMPRESSED_DATA_BUFFER" in show_fiff(fname_c)
+    with pytest.raises(ValueError, match="compressed"):
+        read_raw_fif(fname_c, mmap=True)
+    with pytest.raises(ValueError, match="Invalid value"):
+        raw.save(fname_c, overwrite=True, compression="foo")
+
+
+@pytest.mark.parametrize("compression", [None, "zlib"])
+def test_save_n_jobs(tmp_path, compression):
+    """Test saving raw data using multiple threads."""
+    info = create_info(32, 1000.0, "eeg")
+    data = np.random.default_rng(0).standard_normal((32, 100000)) * 1e-5
+    fname = tmp_path / "test_raw.fif"
+    RawArray(data, info).save(fname, split_size="10MB")
+    raw = read_raw_fif(fname)
+    raw.set_eeg_reference(projection=True)
+    kwargs = dict(split_size="10MB", compression=compression, proj=True)
+    fnames = raw.save(tmp_path / "test1_raw.fif", **kwargs)
+    fnames_jobs = raw.save(tmp_path / "test2_raw.fif", n_jobs=3, **kwargs)
+    assert len(fnames) == len(fnames_jobs) > 1
+    for fname_1, fname_2 in zip(fnames, fnames_jobs):
+        assert fname_1.read_bytes() == fname_2.read_bytes().replace(
+            b"test2_raw", b"test1_raw"
+        )
+    raw_jobs = read_raw_fif(fnames_jobs[0])
+    assert_allclose(raw_jobs.get_data(), raw.copy().apply_proj().get_data())
+
+
+def test_fif_index(tmp_path, monkeypatch):
+    """Test sidecar tag directory indices."""
+    monkeypatch.setenv("_MNE_FAKE_HOME_DIR", str(tmp_path))
+    monkeypatch.setenv("MNE_FIF_INDEX", "false")
+    info = create_info(3, 1000.0, "eeg")
+    data = np.random.default_rng(0).standard_normal((3, 3000)) * 1e-5
+    fname = tmp_path / "test_raw.fif"
+    RawArray(data, info).save(fname, buffer_size_sec=0.5)
+    idx_fname = tmp_path / "test_raw.fif.idx"
+    read_raw_fif(fname)
+    assert not idx_fname.is_file()
+    set_fif_index(True)
+    assert get_config("MNE_FIF_INDEX") == "true"
+    with catch_logging(verbose="debug") as log:
+        raw = read_raw_fif(fname, preload=True)
+    assert "Wrote tag directory index" in log.getvalue()
+    assert idx_fname.is_file()
+    with catch_logging(verbose="debug") as log:
+        raw_idx = read_raw_fif(fname, preload=True)
+    assert "Using tag directory index" in log.getvalue()
+    assert_array_equal(raw_idx.get_data(), raw.get_data())
+    assert_object_equal(raw_idx.info, raw.info)
+    assert show_fiff(fname) == show_fiff(fname)
+    # invalidation
+    raw.crop(0, 1).save(fname, overwrite=True)
+    with catch_logging(verbose="debug") as log:
+        raw_idx = read_raw_fif(fname)
+    assert "outdated" in log.getvalue()
+    assert_allclose(raw_idx.get_data(), raw.get_data())
+    idx_fname.write_text("foo")
+    with catch_logging(verbose="debug") as log:
+        read_raw_fif(fname)
+    assert "invalid" in log.getvalue()
+    set_fif_index(False)
+    idx_fname.unlink()
+    read_raw_fif(fname)
+    assert not idx_fname.is_file()
+
+
 # These are slow on Azure Windows so let's do a subset
 @pytest.mark.parametrize(
     "kind",
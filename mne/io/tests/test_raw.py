@@ -168,6 +168,10 @@ def _test_raw_reader(
                 data2, times2 = other_raw[picks, sl_time]
                 assert_allclose(data1, data2, err_msg="Data mismatch with preload")
                 assert_allclose(times1, times2)
+        # threaded reading
+        data1 = raw.get_data(picks)
+        data2 = other_raws[-1].get_data(picks, n_jobs=2)
+        assert_allclose(data1, data2, err_msg="Data mismatch with n_jobs=2")
 
         # test projection vs cals and data units
         other_raw = reader(preload=False, **kwargs)
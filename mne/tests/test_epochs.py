@@ -49,6 +49,8 @@ from mne.epochs import (
     BaseEpochs,
     EpochsArray,
     _handle_event_repeated,
+    _is_good,
+    _merge_moments,
     average_movements,
     bootstrap,
     combine_event_ids,
@@ -1637,6 +1639,35 @@ def epochs_to_split(request, epochs_factory):
     return epochs, split_size, n_files
 
 
+@pytest.mark.parametrize("ext", ("-epo.fif", "-epo.fif.gz"))
+@pytest.mark.parametrize("dtype", (np.float64, np.complex128))
+def test_epochs_io_memmap(tmp_path, ext, dtype):
+    """Test reading only the epochs that are accessed."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((20, 3, 30)) * 1e-5
+    if dtype is np.complex128:
+        data = data + 1j * data[::-1]
+    events = np.array([np.arange(20) * 50, np.zeros(20, int), np.arange(20) % 2 + 1]).T
+    info = create_info(["a", "b", "c"], 100.0, "eeg")
+    EpochsArray(data, info, events).save(tmp_path / f"test{ext}")
+    epochs = read_epochs(tmp_path / f"test{ext}", preload=False)
+    epochs_want = read_epochs(tmp_path / f"test{ext}")
+    (container,) = epochs._raw
+    assert isinstance(container.data, np.memmap) == (ext == "-epo.fif")
+    idx = [7, 3, 3, 19]
+    assert_array_equal(epochs.get_data(item=idx), epochs_want.get_data(item=idx))
+    assert_array_equal(epochs[1::3]["2"].get_data(), epochs_want[1::3]["2"].get_data())
+    assert_array_equal(epochs[4].get_data(), epochs_want[4].get_data())
+    assert_array_equal(list(epochs), list(epochs_want))
+    assert_allclose(epochs.average().data, epochs_want.average().data)
+    assert_allclose(epochs_want.get_data(), data, rtol=1e-6)  # saved as single
+    # overwriting the file releases the memory maps
+    epochs_sub = epochs[:5]
+    epochs.save(tmp_path / f"test{ext}", overwrite=True)
+    assert container.data is None
+    assert epochs_sub.get_data().shape == (5, 3, 30)  # but no bus error
+
+
 @pytest.mark.parametrize("preload", [True, False], ids=["preload", "no_preload"])
 def test_split_saving_and_loading_back(tmp_path, epochs_to_split, preload):
     """Test saving split epochs and loading them back.
@@ -2318,6 +2349,61 @@ def test_callable_reject():
         )
 
 
+def test_drop_bad_bulk():
+    """Test finding the reasons to drop all epochs at once."""
+    rng = np.random.default_rng(0)
+    ch_types = ["eeg", "eog", "eeg", "mag", "eeg"]
+    info = create_info(["E1", "EOG", "E2", "M1", "E3"], 100.0, ch_types)
+    info["bads"] = ["E3"]
+    data = rng.standard_normal((300, 5, 50)) * 1e-5
+    data[::7, 2, 40] = 1e-2  # E2 artifacts (after reject_tmax for some)
+    data[::11, 4] = 1.0  # ignored (bad channel)
+    data[::13, 3] = 0.0  # flat
+    data[::17, 1, 10] = 1.0  # EOG artifacts
+    epochs = EpochsArray(data.copy(), info, tmin=-0.1)
+    reject, flat = (
+        dict(eeg=1e-3, eog=lambda x: (bool(x.max() > 0.5), "EOG")),
+        dict(mag=1e-20),
+    )
+    with catch_logging() as log:
+        epochs.drop_bad(reject=reject, flat=flat, verbose=True)
+    log = log.getvalue().splitlines()
+    want = list()
+    for ei, e in enumerate(data):
+        bad_tuple = ()
+        if ei % 7 == 0:
+            bad_tuple += ("E2",)
+            want.append("    Rejecting  epoch based on EEG : ['E2']")
+        if ei % 17 == 0:
+            bad_tuple += ("EOG",)
+        if ei % 13 == 0:
+            bad_tuple += ("M1",)
+            if ei % 7:
+                want.append("    Rejecting flat epoch based on MAG : ['M1']")
+        assert epochs.drop_log[ei] == bad_tuple
+        assert _is_good(
+            e, info["ch_names"], epochs._channel_type_idx, reject, flat, True, ["E3"]
+        ) == ((False, bad_tuple) if bad_tuple else (True, None))
+    assert [line for line in log if "Rejecting" in line] == want
+    # within reject_tmin/tmax, and tuning further
+    epochs = EpochsArray(data.copy(), info, tmin=-0.1, reject_tmax=0.2)
+    assert len(epochs) == 300
+    epochs.drop_bad(reject=dict(eeg=1e-4))
+    assert len(epochs) == 300  # the E2 artifacts are after reject_tmax
+    with pytest.warns(RuntimeWarning, match="All epochs were dropped"):
+        epochs.drop_bad(reject=dict(eeg=1e-5))
+    assert len(epochs) == 0
+    # functions modifying their input do not change the data
+    epochs = EpochsArray(data.copy(), info, tmin=-0.1)
+
+    def subtract(x):
+        x -= 1.0
+        return False, "subtracted"
+
+    epochs.drop_bad(reject=dict(mag=subtract, eeg=subtract))
+    assert_array_equal(epochs.get_data(), data)
+
+
 def test_preload_epochs():
     """Test preload of epochs."""
     raw, events, picks = _get_data()
@@ -2350,6 +2436,90 @@ def test_preload_epochs():
     assert_array_almost_equal(epochs_preload.average().data, epochs.average().data, 18)
 
 
+@pytest.mark.parametrize("preload", (True, False))
+def test_epochs_from_raw_batched(tmp_path, monkeypatch, preload):
+    """Test reading epochs from raw data in blocks."""
+    rng = np.random.default_rng(0)
+    info = create_info(["EEG1", "EEG2", "EEG3", "EOG"], 100.0, ["eeg"] * 3 + ["eog"])
+    with info._unlock():
+        info["lowpass"] = 10.0
+    data = rng.standard_normal((4, 20000)) * 1e-5
+    data[1, ::500] = 1e-2  # artifacts
+    raw = RawArray(data, info, first_samp=50)
+    raw.set_annotations(Annotations([20, 100.5], [1, 2], ["bad_a", "b"]))
+    raw.save(tmp_path / "test_raw.fif")
+    raw = read_raw_fif(tmp_path / "test_raw.fif", preload=preload)
+    raw.set_eeg_reference(projection=True)
+    # overlapping and out of bounds epochs
+    samps = np.concatenate([np.arange(60, 20000, 37), [20040]])
+    events = np.array([samps, np.zeros_like(samps), np.ones_like(samps)]).T
+    kwargs = dict(
+        tmin=-0.2,
+        tmax=0.5,
+        reject=dict(eeg=1e-3),
+        flat=dict(eog=1e-8),
+        reject_tmin=-0.1,
+        detrend=1,
+        decim=2,
+    )
+    with catch_logging() as log:
+        epochs = Epochs(raw, events, **kwargs)
+        data = epochs.get_data(verbose="debug")
+    assert "epochs from" in log.getvalue()  # read in runs
+    assert 0 < len(epochs) < len(samps)
+    # same as reading epoch by epoch
+    monkeypatch.setattr(Epochs, "_get_epochs_from_raw", BaseEpochs._get_epochs_from_raw)
+    epochs_want = Epochs(raw, events, **kwargs)
+    assert_allclose(data, epochs_want.get_data(), atol=1e-20)
+    assert epochs.drop_log == epochs_want.drop_log
+    assert "bad_a" in sum(epochs.drop_log, ())
+    assert "EEG2" in sum(epochs.drop_log, ())
+    assert ("NO_DATA",) in epochs.drop_log and ("TOO_SHORT",) in epochs.drop_log
+
+
+def test_average_not_preloaded():
+    """Test averaging epochs by event type in one pass without preloading."""
+    rng = np.random.default_rng(0)
+    info = create_info(["EEG1", "EEG2", "EOG"], 100.0, ["eeg", "eeg", "eog"])
+    data = rng.standard_normal((3, 10000)) * 1e-5
+    data[1, ::700] = 1e-2  # artifacts
+    raw = RawArray(data, info)
+    samps = np.arange(50, 10000, 23)
+    events = np.array([samps, np.zeros_like(samps), samps % 3 + 1]).T
+    event_id = dict(a=1, b=2, c=3)
+    kwargs = dict(tmin=-0.1, tmax=0.3, reject=dict(eeg=1e-3), proj=False)
+    epochs = Epochs(raw, events, event_id, preload=False, **kwargs)
+    epochs_want = Epochs(raw, events, event_id, preload=True, **kwargs)
+    for method in ("mean", "std"):
+        evoked = epochs.average(method=method)
+        evoked_want = epochs_want.average(method=method)
+        assert evoked.nave == evoked_want.nave == len(epochs_want)
+        assert evoked.kind == evoked_want.kind
+        assert_allclose(evoked.data, evoked_want.data, rtol=1e-10)
+        evokeds = epochs.average(method=method, by_event_type=True)
+        evokeds_want = epochs_want.average(method=method, by_event_type=True)
+        assert [ev.comment for ev in evokeds] == list(event_id)
+        for ev, ev_want in zip(evokeds, evokeds_want):
+            assert ev.comment == ev_want.comment
+            assert ev.nave == ev_want.nave
+            assert_allclose(ev.data, ev_want.data, rtol=1e-10)
+    with pytest.raises(ValueError, match="can only compute mean or standard"):
+        epochs.average(method="median", by_event_type=True)
+    # merging blocks gives the same moments as all data at once
+    x = rng.standard_normal((20, 2, 3)) + 1e3
+    keys = [1, 2] * 10
+    moments, moments_want = dict(), dict()
+    for start in range(0, 20, 3):
+        _merge_moments(moments, x[start : start + 3], keys[start : start + 3])
+    _merge_moments(moments_want, x, keys)
+    for key in (1, 2):
+        n, mean, m2 = moments[key]
+        assert n == moments_want[key][0] == 10
+        assert_allclose(mean, x[key - 1 :: 2].mean(0))
+        assert_allclose(m2 / n, x[key - 1 :: 2].var(0))
+        assert_allclose(m2, moments_want[key][2])
+
+
 def test_indexing_slicing():
     """Test of indexing and slicing operations."""
     raw, events, picks = _get_data()
@@ -4397,6 +4567,78 @@ def test_make_metadata_bounded_by_row_or_tmin_tmax_event_names(tmin, tmax):
         assert metadata.iloc[2][last_event_name] > 0
 
 
+@pytest.mark.parametrize("keep", ("first", "last"))
+def test_make_metadata_keep_first_last(keep):
+    """Test make_metadata() with HED groups and unsorted events."""
+    pd = pytest.importorskip("pandas")
+    event_id = {"stim": 1, "response/left": 2, "response/right": 3}
+    events = np.array(
+        [[0, 0, 1], [50, 0, 2], [80, 0, 3], [100, 0, 1], [130, 0, 3], [140, 0, 2]]
+    )
+    kwargs = dict(event_id=event_id, tmin=0.0, tmax=0.9, sfreq=100.0, row_events="stim")
+    kwargs[f"keep_{keep}"] = "response"
+    metadata, events_new, _ = make_metadata(events, **kwargs)
+    assert_array_equal(events_new, events[[0, 3]])
+    assert_allclose(metadata["response/left"], [0.5, 0.4])
+    assert_allclose(metadata["response/right"], [0.8, 0.3])
+    if keep == "first":
+        assert_allclose(metadata["response"], [0.5, 0.3])
+        assert list(metadata["first_response"]) == ["left", "right"]
+    else:
+        assert_allclose(metadata["response"], [0.8, 0.4])
+        assert list(metadata["last_response"]) == ["right", "left"]
+    # the order of the events does not matter
+    metadata_2, _, _ = make_metadata(events[[3, 5, 4, 2, 0, 1]], **kwargs)
+    assert_array_equal(metadata_2.index, [0, 4])
+    pd.testing.assert_frame_equal(
+        metadata_2.iloc[::-1].reset_index(drop=True), metadata.reset_index(drop=True)
+    )
+
+
+def test_metadata_query_compiled(monkeypatch):
+    """Test that simple metadata queries are evaluated without pandas.query."""
+    pd = pytest.importorskip("pandas")
+    rng = np.random.default_rng(0)
+    n_epochs = 50
+    metadata = pd.DataFrame(
+        dict(
+            condition=pd.Categorical(rng.choice(["A", "B", "C"], n_epochs)),
+            word=rng.choice(["x", "y"], n_epochs),
+            rt=np.where(rng.random(n_epochs) < 0.2, np.nan, rng.random(n_epochs)),
+            correct=rng.random(n_epochs) < 0.7,
+        )
+    )
+    events = np.array([np.arange(n_epochs), np.zeros(n_epochs), np.ones(n_epochs)])
+    epochs = EpochsArray(
+        np.zeros((n_epochs, 1, 2)),
+        create_info(1, 1000.0),
+        events.T.astype(int),
+        metadata=metadata,
+    )
+    queries = (
+        "condition == 'A' and rt < 0.5",
+        "(condition == 'A') | (word != 'x')",
+        "0.2 < rt <= 0.7 and not correct",
+        "condition in ['A', 'C'] or rt != rt",
+        "word not in ('y',) and -1 < rt",
+        "correct",
+    )
+    want = {
+        query: metadata.reset_index().query(query, engine="python").index.values
+        for query in queries
+    }
+    assert all(0 < len(idx) < n_epochs for idx in want.values())
+    # queries that cannot be compiled still go through pandas
+    want_abs = metadata.query("abs(rt - 0.5) < 0.1").index.values
+    assert_array_equal(epochs["abs(rt - 0.5) < 0.1"].selection, want_abs)
+    monkeypatch.setattr(pd.DataFrame, "query", None)
+    for query, idx in want.items():
+        assert_array_equal(epochs[query].selection, idx)
+        assert_array_equal(epochs[query].metadata.index, idx)
+    with pytest.raises(KeyError, match="query did not yield"):
+        epochs["abs(rt - 0.5) < 0.1"]
+
+
 def test_events_list():
     """Test that events can be a list."""
     events = [[100, 0, 1], [200, 0, 1], [300, 0, 1]]
@@ -2,6 +2,9 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import json
+import platform
+
 import numpy as np
 import pytest
 from numpy.fft import fft, fftfreq
@@ -12,9 +15,10 @@ from numpy.testing import (
     assert_array_equal,
     assert_array_less,
 )
-from scipy.signal import butter, freqz, sosfreqz
+from scipy.signal import butter, freqz, sosfreqz, welch
 from scipy.signal import resample as sp_resample
 
+import mne.filter
 from mne import Epochs, create_info
 from mne._fiff.pick import _DATA_CH_TYPES_SPLIT
 from mne.filter import (
@@ -22,13 +26,17 @@ from mne.filter import (
     _overlap_add_filter,
     _resample_stim_channels,
     _smart_pad,
+    clear_filter_cache,
     construct_iir_filter,
     create_filter,
+    decimate_data,
     design_mne_c_filter,
     detrend,
     estimate_ringing_samples,
+    filter_cache_info,
     filter_data,
     notch_filter,
+    profile_fir_filter,
     resample,
 )
 from mne.io import RawArray, read_raw_fif
@@ -173,6 +181,26 @@ def test_1d_filter(n_signal, n_filter, filter_type):
                 assert_allclose(x_filtered, x_expected, atol=1e-13)
 
 
+@pytest.mark.parametrize("phase", ("zero", "zero-double", "minimum"))
+def test_overlap_add_rows(phase):
+    """Test that overlap-add filtering of many rows matches filtering each."""
+    x = np.random.default_rng(0).standard_normal((10, 3, 3000))
+    h = create_filter(x, 1000.0, 5.0, 40.0, phase=phase)
+    # reference: direct convolution of each smart-padded row
+    n_edge = len(h) - 1
+    h_use = np.convolve(h, h[::-1]) if phase == "zero-double" else h
+    shift = ((len(h_use) - 1) // 2 if phase.startswith("zero") else 0) + n_edge
+    x_ext = _smart_pad(x.reshape(30, 3000), (n_edge, n_edge), "reflect_limited")
+    want = np.array([np.convolve(row, h_use) for row in x_ext])
+    want = want[:, shift : shift + 3000].reshape(x.shape)
+    got = _overlap_add_filter(x, h, phase=phase, n_jobs=2)
+    assert_allclose(got, want, rtol=0, atol=1e-12)
+    # picks
+    got = _overlap_add_filter(x.reshape(30, 3000), h, phase=phase, picks=[3, 7])
+    assert_array_equal(got[[0, 1, 2, 4]], x.reshape(30, 3000)[[0, 1, 2, 4]])
+    assert_allclose(got[[3, 7]], want.reshape(30, 3000)[[3, 7]], rtol=0, atol=1e-12)
+
+
 def test_iir_stability():
     """Test IIR filter stability check."""
     sig = np.random.default_rng(0).random(1000)
@@ -371,6 +399,13 @@ def test_notch_filters(method, filter_length, line_freq, tol):
         assert_array_almost_equal(out, line_freqs)
     new_power = np.sqrt(sum_squared(b) / b.size)
     assert_almost_equal(new_power, orig_power, tol)
+    if method == "spectrum_fit":  # channels are processed together
+        x = np.array([a, rng.standard_normal(a.size), a[::-1]])
+        want = [
+            notch_filter(x_, sfreq, line_freq, filter_length, method=method) for x_ in x
+        ]
+        got = notch_filter(x, sfreq, line_freq, filter_length, method=method)
+        assert_allclose(got, want, atol=1e-12)
 
 
 @resample_method_parametrize
@@ -418,7 +453,7 @@ def test_resample_scipy():
                 assert_allclose(x_p5, x_p5_sp, atol=1e-12, err_msg=err_msg)
 
 
-@pytest.mark.parametrize("n_jobs", (2, "cuda"))
+@pytest.mark.parametrize("n_jobs", (2, "cuda", "threads"))
 def test_n_jobs(n_jobs, capsys):
     """Test resampling against SciPy."""
     joblib = pytest.importorskip("joblib")
@@ -803,6 +838,126 @@ def test_filter_auto():
         notch_filter(raw, 1000.0, [60.0])
 
 
+def test_filter_cache():
+    """Test caching of designed filters."""
+    clear_filter_cache()
+    assert all(val["size"] == 0 for val in filter_cache_info().values())
+    x = np.random.default_rng(0).standard_normal((2, 5000))
+    kwargs = dict(sfreq=1000.0, l_freq=1.0, h_freq=40.0)
+    h = create_filter(x, **kwargs)
+    want = h.copy()
+    h[:] = 0  # the cached kernel is not affected
+    assert_array_equal(create_filter(x, **kwargs), want)
+    info = filter_cache_info()
+    assert info["fir"]["hits"] == 1 and info["fir"]["misses"] == 1
+    assert info["fir"]["max_size"] == 128
+    want = filter_data(x, **kwargs)
+    assert filter_cache_info()["fft"]["misses"] == 1
+    assert_array_equal(filter_data(x, **kwargs), want)
+    assert filter_cache_info()["fft"]["hits"] == 1
+    iir_params = dict(order=4, ftype="butter")
+    kwargs.update(method="iir", iir_params=iir_params)
+    want = create_filter(x, **kwargs)
+    got = create_filter(x, **kwargs)
+    assert "sos" not in iir_params
+    assert got["padlen"] == want["padlen"]
+    assert_array_equal(got["sos"], want["sos"])
+    assert got["sos"] is not want["sos"] and got["sos"].flags.writeable
+    info = filter_cache_info()
+    assert info["iir"]["misses"] == info["iir_padlen"]["misses"] == 1
+    assert info["iir_padlen"]["hits"] == 1
+    clear_filter_cache()
+    assert filter_cache_info()["fir"] == dict(hits=0, misses=0, size=0, max_size=128)
+
+
+@pytest.mark.parametrize("impl", ("direct", None))
+@pytest.mark.parametrize("phase", ("zero", "zero-double", "minimum"))
+def test_filter_autotune(tmp_path, monkeypatch, impl, phase):
+    """Test measuring and using the fastest FIR filtering implementation."""
+    monkeypatch.setenv("_MNE_FAKE_HOME_DIR", str(tmp_path))
+    monkeypatch.setattr(mne.filter, "_fir_timings", dict())
+    x = np.random.default_rng(0).standard_normal((3, 2000))
+    kwargs = dict(sfreq=1000.0, l_freq=None, h_freq=40.0, phase=phase)
+    want = filter_data(x, **kwargs)
+    monkeypatch.setenv("MNE_FILTER_AUTOTUNE", "true")
+    if impl is not None:  # force a given implementation
+        monkeypatch.setattr(mne.filter, "_fastest_fir_impl", lambda n_h, n_x: impl)
+    assert_allclose(filter_data(x, **kwargs), want, atol=1e-12)
+    fname = tmp_path / ".mne" / "filter_timings.json"
+    assert fname.is_file() == (impl is None)
+    if impl is not None or phase != "zero":  # other filter lengths below
+        return
+    with catch_logging() as log:
+        timings = profile_fir_filter(500, 3000, verbose=True)
+    assert "Measuring" not in log.getvalue()  # already measured (same bucket)
+    assert "direct" in timings and "iir" in timings
+    assert all(t > 0 for t in timings.values())
+    assert min(int(k[4:]) for k in timings if k.startswith("fft-")) == 1024
+    monkeypatch.setattr(mne.filter, "_fir_timings", dict())
+    with catch_logging() as log:
+        assert profile_fir_filter(511, 4096, verbose=True) == timings  # from disk
+    assert "Measuring" not in log.getvalue()
+    with catch_logging() as log:
+        assert "direct" not in profile_fir_filter(2000, 100, force=True, verbose=True)
+    assert "Measuring" in log.getvalue()
+    with pytest.raises(ValueError, match="must be positive"):
+        profile_fir_filter(0, 100)
+    # a truncated (or otherwise invalid) file is treated as empty
+    fname.write_text(fname.read_text()[:50])
+    monkeypatch.setattr(mne.filter, "_fir_timings", dict())
+    assert_allclose(filter_data(x, **kwargs), want, atol=1e-12)
+    stored = json.loads(fname.read_text())
+    assert list(stored[platform.node()]) == ["511-4096"]
+    assert not list(tmp_path.glob(".mne/*.tmp*"))
+
+
+@pytest.mark.parametrize("decim, n_stages", [(1, 1), (6, 2), (7, 1), (12, 3)])
+def test_decimate_data(decim, n_stages):
+    """Test multirate low-pass filtering and decimation."""
+    sfreq, n_times = 1000.0, 30000
+    t = np.arange(n_times) / sfreq
+    rng = np.random.default_rng(0)
+    x = np.array([np.sin(2 * np.pi * 5 * t), rng.standard_normal(n_times)])
+    h_freq = 0.3 * sfreq / decim
+    with catch_logging() as log:
+        y = decimate_data(x, sfreq, h_freq, decim, verbose=True)
+    log = log.getvalue()
+    assert y.shape == x[:, ::decim].shape
+    assert log.count("- Stage") == n_stages
+    assert "dB attenuation" in log
+    # the pass band is kept without delay
+    assert_allclose(y[0, 50:-50], x[0, ::decim][50:-50], atol=2e-3)
+    # and the stop band is removed (no aliasing)
+    freqs, power = welch(y[1], sfreq / decim, nperseg=256)
+    stop = freqs > h_freq + 0.25 * h_freq + 1
+    assert power[stop].max() < 1e-4 * power[freqs < h_freq].mean()
+    # matches single-rate filtering in the pass band
+    want = filter_data(x, sfreq, None, h_freq, verbose=False)[:, ::decim]
+    assert np.corrcoef(want[1, 100:-100], y[1, 100:-100])[0, 1] > 0.999
+    # causal version
+    y = decimate_data(x, sfreq, h_freq, decim, phase="minimum")
+    assert y.shape == x[:, ::decim].shape
+    with pytest.raises(ValueError, match="Nyquist frequency of the decimated"):
+        decimate_data(x, sfreq, sfreq / decim / 2.0, decim)
+    with pytest.raises(ValueError, match="Effective stop frequency"):
+        decimate_data(x, sfreq, h_freq, decim, h_trans_bandwidth=sfreq / decim)
+
+
+def test_decimate_data_cost():
+    """Test the cost of multirate filtering reported by decimate_data."""
+    x = np.zeros((1, 10000))
+    with catch_logging() as log:
+        decimate_data(x, 1000.0, 30.0, 10, verbose=True)
+    log = log.getvalue()
+    assert "1000.00 -> 500.00 Hz, 9 taps" in log
+    assert "500.00 -> 100.00 Hz, 221 taps" in log
+    # 9 taps per output sample at 500 Hz and 221 taps per output sample at
+    # 100 Hz, for 1000 input samples per second
+    n_mult = (9 * 500 + 221 * 100) / 1000.0
+    assert f"- {n_mult:0.1f} multiplications per input sample" in log
+    assert "single-rate FIR filter: 441 taps" in log
+
+
 def test_cuda_fir():
     """Test CUDA-based filtering."""
     # Using `n_jobs='cuda'` on a non-CUDA system should be fine,
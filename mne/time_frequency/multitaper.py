@@ -12,7 +12,7 @@ from scipy.signal.windows import dpss as sp_dpss
 
 from ..fixes import _reshape_view
 from ..parallel import parallel_func
-from ..utils import _check_option, logger, verbose, warn
+from ..utils import _check_option, _get_fft_workers, logger, verbose, warn
 
 
 def dpss_windows(N, half_nbw, Kmax, *, sym=True, norm=None, low_bias=True):
@@ -278,8 +278,9 @@ def _mt_spectra(x, dpss, sfreq, n_fft=None, remove_dc=True):
     # x_mt = fftpack.fft(x[:, np.newaxis, :] * dpss, n=n_fft)
     n_tapers = dpss.shape[0] if dpss.ndim > 1 else 1
     x_mt = np.zeros(x.shape[:-1] + (n_tapers, len(freqs)), dtype=np.complex128)
+    workers = _get_fft_workers()
     for idx, sig in enumerate(x):
-        x_mt[idx] = rfft(sig[..., np.newaxis, :] * dpss, n=n_fft)
+        x_mt[idx] = rfft(sig[..., np.newaxis, :] * dpss, n=n_fft, workers=workers)
     # Adjust DC and maybe Nyquist, depending on one-sided transform
     x_mt[..., 0] /= np.sqrt(2.0)
     if n_fft % 2 == 0:
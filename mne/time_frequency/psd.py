@@ -3,14 +3,16 @@
 # Copyright the MNE-Python contributors.
 
 import warnings
+from contextlib import nullcontext
 from functools import partial
 
 import numpy as np
+from scipy.fft import set_workers
 from scipy.signal import spectrogram
 
 from ..fixes import _reshape_view
 from ..parallel import parallel_func
-from ..utils import _check_option, _ensure_int, logger, verbose, warn
+from ..utils import _check_option, _ensure_int, _get_fft_workers, logger, verbose, warn
 from ..utils.numerics import _mask_to_onsets_offsets
 
 
@@ -301,10 +303,12 @@ def psd_array_welch(
         x_splits = [arr for arr in np.array_split(x, n_jobs) if arr.size != 0]
         agg_func = np.concatenate
         func = _func
-    f_spect = parallel(
-        my_spect_func(d, func=func, freq_sl=freq_sl, average=average, output=output)
-        for d in x_splits
-    )
+    workers = _get_fft_workers()
+    with nullcontext() if workers is None else set_workers(workers):
+        f_spect = parallel(
+            my_spect_func(d, func=func, freq_sl=freq_sl, average=average, output=output)
+            for d in x_splits
+        )
     psds = agg_func(f_spect, axis=0)
     shape = dshape + (len(freqs),)
     if average is None:
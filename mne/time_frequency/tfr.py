@@ -40,6 +40,7 @@ from ..utils import (
     _convert_times,
     _ensure_events,
     _freq_mask,
+    _get_fft_workers,
     _import_h5io_funcs,
     _is_numeric,
     _pl,
@@ -386,14 +387,16 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
 
     # Make generator looping across signals
     tfr = np.zeros((n_freqs, n_times_out), dtype=np.complex128)
+    workers = _get_fft_workers()
     for x in X:
         if use_fft:
-            fft_x = fft(x, fsize)
+            fft_x = fft(x, fsize, workers=workers)
 
         # Loop across wavelets
         for ii, W in enumerate(Ws):
             if use_fft:
-                ret = ifft(fft_x * fft_Ws[ii])[: n_times + W.size - 1]
+                ret = ifft(fft_x * fft_Ws[ii], workers=workers)
+                ret = ret[: n_times + W.size - 1]
             else:
                 # Work around multarray.correlate->OpenBLAS bug on ppc64le
                 # ret = np.correlate(x, W, mode=mode)
@@ -77,6 +77,7 @@ __all__ = [
     "_get_blas_funcs",
     "_get_call_line",
     "_get_extra_data_path",
+    "_get_fft_workers",
     "_get_inst_data",
     "_get_numpy_libs",
     "_get_root_dir",
@@ -175,6 +176,8 @@ __all__ = [
     "running_subprocess",
     "set_cache_dir",
     "set_config",
+    "set_fft_workers",
+    "set_fif_index",
     "set_log_file",
     "set_log_level",
     "set_memmap_min_size",
@@ -183,6 +186,7 @@ __all__ = [
     "sqrtm_sym",
     "sum_squared",
     "sys_info",
+    "use_fft_workers",
     "use_log_level",
     "verbose",
     "warn",
@@ -286,6 +290,7 @@ from .check import (
 )
 from .config import (
     _get_extra_data_path,
+    _get_fft_workers,
     _get_numpy_libs,
     _get_root_dir,
     _get_stim_channel,
@@ -295,8 +300,11 @@ from .config import (
     get_subjects_dir,
     set_cache_dir,
     set_config,
+    set_fft_workers,
+    set_fif_index,
     set_memmap_min_size,
     sys_info,
+    use_fft_workers,
 )
 from .dataframe import (
     _build_data_frame,
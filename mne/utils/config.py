@@ -30,6 +30,7 @@ from .check import (
     _check_fname,
     _check_option,
     _check_qt_version,
+    _ensure_int,
     _soft_import,
     _validate_type,
 )
@@ -83,6 +84,108 @@ def set_memmap_min_size(memmap_min_size):
     set_config("MNE_MEMMAP_MIN_SIZE", memmap_min_size, set_env=False)
 
 
+def set_fif_index(enabled):
+    """Enable or disable sidecar tag directory indices for FIF files.
+
+    When enabled, opening a FIF file (e.g., with :func:`mne.io.read_raw_fif`,
+    :func:`mne.read_epochs`, or :func:`mne.read_forward_solution`) stores its
+    tag directory and block tree in a ``<fname>.idx`` file next to it, and
+    subsequent opens read them from there instead of scanning the file.
+    An index is ignored (and rewritten) whenever the size, modification time,
+    or header of the FIF file changes.
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to use (and write) sidecar indices. The setting is stored as
+        ``MNE_FIF_INDEX`` in the MNE-Python config and environment.
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    _validate_type(enabled, bool, "enabled")
+    set_config("MNE_FIF_INDEX", str(enabled).lower())
+
+
+_fft_workers = None
+
+
+def set_fft_workers(workers):
+    """Set the number of threads used to compute FFTs.
+
+    Parameters
+    ----------
+    workers : int | None
+        The number of threads (``workers``) that :mod:`scipy.fft` uses in
+        FIR filtering, resampling, multitaper and Welch spectra, and Morlet
+        wavelet transforms. Negative values count back from the number of CPUs,
+        e.g., ``-1`` uses all of them. None (default) uses the SciPy default
+        (see :func:`scipy.fft.set_workers`).
+
+    Returns
+    -------
+    old_workers : int | None
+        The previous value.
+
+    See Also
+    --------
+    use_fft_workers
+
+    Notes
+    -----
+    Unlike parallelization with ``n_jobs``, the threads share the memory of
+    the calling process, so data do not have to be copied to other processes.
+    FIR filtering uses ``n_jobs`` threads instead when ``n_jobs`` is given.
+
+    .. versionadded:: 1.13
+    """
+    global _fft_workers
+    if workers is not None:
+        workers = _ensure_int(workers, "workers")
+        if workers == 0:
+            raise ValueError("workers must not be 0")
+    old_workers, _fft_workers = _fft_workers, workers
+    return old_workers
+
+
+def _get_fft_workers():
+    return _fft_workers
+
+
+class use_fft_workers:
+    """Context manager for the number of threads used to compute FFTs.
+
+    Parameters
+    ----------
+    workers : int | None
+        The number of threads, see :func:`mne.set_fft_workers`.
+
+    See Also
+    --------
+    set_fft_workers
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+
+    Examples
+    --------
+    >>> import mne
+    >>> with mne.use_fft_workers(-1):  # doctest:+SKIP
+    ...     raw.filter(1.0, 40.0)  # use all CPUs for the FFTs
+    """
+
+    def __init__(self, workers):
+        self._workers = workers
+
+    def __enter__(self):  # noqa: D105
+        self._old_workers = set_fft_workers(self._workers)
+
+    def __exit__(self, *args):  # noqa: D105
+        set_fft_workers(self._old_workers)
+
+
 # List the known configuration values
 _known_config_types = {
     "MNE_3D_OPTION_ANTIALIAS": (
@@ -178,6 +281,12 @@ _known_config_types = {
     "MNE_DATASETS_REFMEG_NOISE_PATH": "str, path for refmeg_noise data",
     "MNE_DATASETS_SSVEP_PATH": "str, path for ssvep data",
     "MNE_DATASETS_ERP_CORE_PATH": "str, path for erp_core data",
+    "MNE_FIF_INDEX": (
+        "bool, whether to store and use sidecar tag directory indices for FIF files"
+    ),
+    "MNE_FILTER_AUTOTUNE": (
+        "bool, use the FIR filtering implementation measured fastest on this machine"
+    ),
     "MNE_FORCE_SERIAL": "bool, force serial rather than parallel execution",
     "MNE_LOGGING_LEVEL": (
         "str or int, controls the level of verbosity of any function decorated with "
@@ -1251,6 +1251,15 @@ dtype : numpy.dtype
     (default) the data type is not modified.
 """
 
+docdict["dtype_hilbert"] = """
+dtype : str
+    The data type of the analytic signal, ``'complex128'`` (default) or
+    ``'complex64'``, which needs half the memory. Only used if
+    ``envelope=False``, in which case all channels/vertices are converted.
+
+    .. versionadded:: 1.13
+"""
+
 # %%
 # E
 
@@ -2091,6 +2100,18 @@ head_source : str | list of str
     :func:`mne.get_head_surf` for more information.
 """
 
+docdict["header_only_info"] = """
+header_only : bool
+    If True, only read the parts of the measurement info that describe the
+    recording (e.g., ``sfreq``, channel definitions, ``bads``, ``meas_date`` and
+    the device-to-head transform) and leave ``dig``, ``projs``, ``comps``,
+    ``events``, ``hpi_results``, ``hpi_meas`` and ``proc_history`` empty (and
+    ``cross_talk`` and ``fine_calibration`` unset), which is much faster for
+    files with many of these entries. Defaults to False.
+
+    .. versionadded:: 1.13
+"""
+
 docdict["helmet_upsampling"] = """
 upsampling : int
     The upsampling factor to use for the helmet mesh. The default (1) does no
@@ -2690,6 +2711,25 @@ meg : str | list | dict | bool | None
        Added support for specifying alpha values as a dict.
 """
 
+docdict["memmap_filter"] = """
+memmap : path-like | None
+    Only used when the data are not preloaded, in which case they are filtered
+    while being read from disk (see Notes) and then kept in memory, or in a
+    memory-mapped file at this path if not ``None``.
+
+    .. versionadded:: 1.13
+"""
+
+docdict["memmap_resample"] = """
+memmap : path-like | None
+    Only used when the data are not preloaded and ``method='polyphase'``, in
+    which case they are resampled while being read from disk (see Notes) and
+    then kept in memory, or in a memory-mapped file at this path if not
+    ``None``.
+
+    .. versionadded:: 1.13
+"""
+
 _metadata_attr_template = """
 metadata : instance of pandas.DataFrame | None
     A :class:`pandas.DataFrame` specifying metadata about each epoch{or_none}.{extra}
@@ -2907,15 +2947,34 @@ n_jobs : int | None
 docdict["n_jobs_cuda"] = """
 n_jobs : int | str
     Number of jobs to run in parallel. Can be ``'cuda'`` if ``cupy``
-    is installed properly.
+    is installed properly, or ``'threads'`` to process the channels in one CPU
+    thread per core, each reusing preallocated FFT buffers.
 """
 
 docdict["n_jobs_fir"] = """
 n_jobs : int | str
     Number of jobs to run in parallel. Can be ``'cuda'`` if ``cupy``
-    is installed properly and ``method='fir'``.
+    is installed properly, or ``'threads'`` to process the channels in one CPU
+    thread per core, each reusing preallocated FFT buffers. Both are only
+    used when ``method='fir'``.
 """
 
+docdict["n_jobs_hilbert"] = """
+n_jobs : int | None
+    The number of threads used by the FFTs. ``None`` (default) uses the
+    value set by :func:`mne.set_fft_workers`, and ``-1`` uses one thread per
+    CPU core.
+"""
+
+docdict["n_jobs_read"] = """
+n_jobs : int | None
+    The number of threads to use to read data from disk. Reads spanning
+    several files (e.g., split or concatenated recordings) or many data
+    buffers are distributed across threads that fill the output array
+    directly, which mostly helps on storage with high per-request latency.
+    ``None`` (default) and ``1`` read sequentially, and ``-1`` uses one
+    thread per CPU core. Has no effect on preloaded data."""
+
 docdict["n_pca_components_apply"] = """
 n_pca_components : int | float | None
     The number of PCA components to be kept, either absolute (int)
@@ -4,10 +4,13 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import ast
 import json
 import logging
+import operator
 from collections import OrderedDict
 from copy import deepcopy
+from functools import lru_cache, partial, reduce
 
 import numpy as np
 
@@ -238,7 +241,9 @@ class GetEpochsMixin:
                 if isinstance(reason, str):
                     reason = (reason,)
                 reason = tuple(reason)
-                for idx in np.setdiff1d(inst.selection, key_selection):
+                dropped = np.ones(len(inst.selection), bool)
+                dropped[select] = False
+                for idx in inst.selection[dropped].tolist():
                     drop_log[idx] = reason
             inst.drop_log = tuple(drop_log)
             inst.selection = key_selection
@@ -301,12 +306,14 @@ class GetEpochsMixin:
                 md = self.metadata if hasattr(self, "_metadata") else None
                 self._check_metadata(metadata=md)
                 try:
-                    # Try metadata
-                    vals = (
-                        self.metadata.reset_index()
-                        .query(keys[0], engine="python")
-                        .index.values
-                    )
+                    # Try metadata, first with the compiled query
+                    vals = _query_metadata(self.metadata, keys[0])
+                    if vals is None:
+                        vals = (
+                            self.metadata.reset_index()
+                            .query(keys[0], engine="python")
+                            .index.values
+                        )
                 except Exception as exp:
                     msg += (
                         " The epochs.metadata Pandas query did not "
@@ -798,3 +805,121 @@ def _prepare_read_metadata(metadata):
                 metadata.set_index("index", inplace=True)
             assert isinstance(metadata, pd.DataFrame)
     return metadata
+
+
+_query_compare_ops = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+
+@lru_cache(maxsize=128)
+def _compile_metadata_query(query):
+    """Compile a metadata query to a function of the metadata.
+
+    Only comparisons between columns and constants (and ``in`` / ``not in``
+    lists of constants) combined with boolean operators are compiled, which
+    evaluate these operations directly on the columns. Returns None for other
+    queries, which need to go through :meth:`pandas.DataFrame.query`.
+    """
+    try:
+        node = ast.parse(query.strip(), mode="eval").body
+        return _compile_query_node(node)
+    except (SyntaxError, ValueError):
+        return None
+
+
+def _compile_query_node(node):
+    if isinstance(node, ast.BoolOp) or (
+        isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd | ast.BitOr)
+    ):
+        if isinstance(node, ast.BinOp):
+            funs = [_compile_query_node(node.left), _compile_query_node(node.right)]
+            use_and = isinstance(node.op, ast.BitAnd)
+        else:
+            funs = [_compile_query_node(value) for value in node.values]
+            use_and = isinstance(node.op, ast.And)
+        combine = operator.and_ if use_and else operator.or_
+        return lambda md: reduce(combine, (fun(md) for fun in funs))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not | ast.Invert):
+        fun = _compile_query_node(node.operand)
+        return lambda md: ~fun(md)
+    if isinstance(node, ast.Name):  # boolean column
+        return lambda md: md[node.id]
+    if not isinstance(node, ast.Compare):
+        raise ValueError("Unsupported query")
+    funs = list()
+    operands = [node.left] + list(node.comparators)
+    for left, op, right in zip(operands[:-1], node.ops, operands[1:]):
+        if isinstance(op, ast.In | ast.NotIn):
+            if not isinstance(left, ast.Name):
+                raise ValueError("Unsupported query")
+            values = _query_constant(right, allow_list=True)
+            if not isinstance(values, list):
+                raise ValueError("Unsupported query")
+            funs.append(partial(_query_isin, left.id, values, isinstance(op, ast.In)))
+        elif type(op) in _query_compare_ops:
+            left, right = _query_operand(left), _query_operand(right)
+            if not any(isinstance(operand, ast.Name) for operand in (left, right)):
+                raise ValueError("Unsupported query")
+            funs.append(
+                partial(_query_compare, _query_compare_ops[type(op)], left, right)
+            )
+        else:
+            raise ValueError("Unsupported query")
+    return lambda md: reduce(operator.and_, (fun(md) for fun in funs))
+
+
+def _query_constant(node, allow_list=False):
+    if allow_list and isinstance(node, ast.List | ast.Tuple):
+        return [_query_constant(elt) for elt in node.elts]
+    if (
+        isinstance(node, ast.UnaryOp)
+        and isinstance(node.op, ast.USub | ast.UAdd)
+        and isinstance(node.operand, ast.Constant)
+        and type(node.operand.value) in (int, float)
+    ):
+        value = node.operand.value
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.Constant) and type(node.value) in (str, int, float, bool):
+        return node.value
+    raise ValueError("Unsupported query")
+
+
+def _query_operand(node):
+    return node if isinstance(node, ast.Name) else ast.Constant(_query_constant(node))
+
+
+def _query_value(md, node):
+    return md[node.id] if isinstance(node, ast.Name) else node.value
+
+
+def _query_compare(op, left, right, md):
+    return op(_query_value(md, left), _query_value(md, right))
+
+
+def _query_isin(name, values, isin, md):
+    mask = md[name].isin(values)
+    return mask if isin else ~mask
+
+
+def _query_metadata(metadata, query):
+    """Get the indices of the rows of the metadata matching a query.
+
+    Returns None if the query cannot be compiled or evaluated, in which case
+    it should be passed on to :meth:`pandas.DataFrame.query`.
+    """
+    fun = _compile_metadata_query(query)
+    if fun is None:
+        return None
+    try:
+        mask = np.asarray(fun(metadata))
+    except Exception:
+        return None
+    if mask.dtype != bool or mask.shape != (len(metadata),):
+        return None
+    return np.flatnonzero(mask)
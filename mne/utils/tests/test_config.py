@@ -13,12 +13,15 @@ from functools import partial
 from pathlib import Path
 from urllib.error import URLError
 
+import numpy as np
 import pytest
+from numpy.testing import assert_allclose
 
 import mne
 import mne.utils.config
 from mne.utils import (
     ClosingStringIO,
+    _get_fft_workers,
     _get_stim_channel,
     _record_warnings,
     get_config,
@@ -26,8 +29,11 @@ from mne.utils import (
     get_subjects_dir,
     requires_good_network,
     set_config,
+    set_fft_workers,
+    set_fif_index,
     set_memmap_min_size,
     sys_info,
+    use_fft_workers,
 )
 
 
@@ -100,6 +106,8 @@ def test_config(tmp_path):
     with pytest.raises(TypeError, match="must be an instance"):
         set_memmap_min_size(1)
     pytest.raises(ValueError, set_memmap_min_size, "foo")
+    with pytest.raises(TypeError, match="must be an instance"):
+        set_fif_index("true")
     pytest.raises(TypeError, get_config, 1)
     pytest.raises(TypeError, set_config, 1)
     pytest.raises(TypeError, set_config, "foo", 1)
@@ -107,6 +115,37 @@ def test_config(tmp_path):
     pytest.raises(TypeError, _get_stim_channel, [1], None)
 
 
+def test_fft_workers():
+    """Test setting the number of FFT threads."""
+    from mne.filter import filter_data
+    from mne.time_frequency import (
+        psd_array_multitaper,
+        psd_array_welch,
+        tfr_array_morlet,
+    )
+
+    x = np.random.default_rng(0).standard_normal((1, 3, 5000))
+    funcs = (
+        partial(filter_data, x[0], 1000.0, 1.0, 40.0, verbose=False),
+        partial(psd_array_welch, x, 1000.0, verbose=False),
+        partial(psd_array_multitaper, x, 1000.0, verbose=False),
+        partial(tfr_array_morlet, x, 1000.0, [10.0, 20.0], verbose=False),
+    )
+    want = [np.asarray(func()[0]) for func in funcs]
+    assert _get_fft_workers() is None
+    with use_fft_workers(2):
+        assert _get_fft_workers() == 2
+        for func, this_want in zip(funcs, want):
+            assert_allclose(func()[0], this_want, rtol=1e-7)
+    assert _get_fft_workers() is None
+    assert set_fft_workers(-1) is None
+    assert set_fft_workers(None) == -1
+    with pytest.raises(ValueError, match="must not be 0"):
+        set_fft_workers(0)
+    with pytest.raises(TypeError, match="must be an int"):
+        set_fft_workers(1.5)
+
+
 def test_sys_info_basic():
     """Test info-showing utility."""
     out = ClosingStringIO()